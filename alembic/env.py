@@ -20,6 +20,7 @@ from app.models.menu import MenuItem, MenuOption, OptionChoice
 from app.models.order import Order, OrderItem
 from app.models.permission import Permission
 from app.models.audit import AuditLog
+from app.models.cache_version import CacheVersion
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
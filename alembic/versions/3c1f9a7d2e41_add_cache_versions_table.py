@@ -0,0 +1,33 @@
+"""Add cache_versions table
+
+Revision ID: 3c1f9a7d2e41
+Revises: ddab603d8ca8
+Create Date: 2026-10-19 09:12:44.201837
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f9a7d2e41'
+down_revision: Union[str, None] = 'ddab603d8ca8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    cache_versions = op.create_table(
+        'cache_versions',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('name')
+    )
+    op.bulk_insert(cache_versions, [{'name': 'menu', 'version': 0}])
+
+
+def downgrade() -> None:
+    op.drop_table('cache_versions')
@@ -0,0 +1,25 @@
+"""Add orders (updated_at, id) index
+
+Revision ID: 8e4b2c6f1a93
+Revises: 3c1f9a7d2e41
+Create Date: 2026-10-19 11:40:18.552019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b2c6f1a93'
+down_revision: Union[str, None] = '3c1f9a7d2e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_orders_updated_at_id', 'orders', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_orders_updated_at_id', table_name='orders')
@@ -0,0 +1,32 @@
+"""Add order status transition timestamps
+
+Revision ID: d4a8f2c1b9e7
+Revises: b7d3e9a4c215
+Create Date: 2026-10-19 15:20:37.418205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8f2c1b9e7'
+down_revision: Union[str, None] = 'b7d3e9a4c215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('orders', sa.Column('preparing_at', sa.DateTime(), nullable=True))
+    op.add_column('orders', sa.Column('ready_at', sa.DateTime(), nullable=True))
+    op.add_column('orders', sa.Column('completed_at', sa.DateTime(), nullable=True))
+    op.add_column('orders', sa.Column('cancelled_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('orders', 'cancelled_at')
+    op.drop_column('orders', 'completed_at')
+    op.drop_column('orders', 'ready_at')
+    op.drop_column('orders', 'preparing_at')
@@ -0,0 +1,25 @@
+"""Add orders status index
+
+Revision ID: f2c7a9e3d516
+Revises: d4a8f2c1b9e7
+Create Date: 2026-10-19 16:05:42.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c7a9e3d516'
+down_revision: Union[str, None] = 'd4a8f2c1b9e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_orders_status', 'orders', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_orders_status', table_name='orders')
@@ -1,5 +1,11 @@
-"""API Router Module"""
+"""API Router Module
 
-from . import auth_router, user_router, menu_router, orders_router, admin_router, superadmin_router
+superadmin_router and db_admin_router are not imported here; main.py loads
+them lazily on first request.
+"""
 
-__all__ = ["auth_router", "user_router", "menu_router", "orders_router", "admin_router", "superadmin_router"]
+from . import auth_router, user_router, menu_router, orders_router, kitchen_router, admin_router
+
+__all__ = [
+    "auth_router", "user_router", "menu_router", "orders_router", "kitchen_router", "admin_router",
+]
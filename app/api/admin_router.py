@@ -3,7 +3,9 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timedelta
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db, engine, replica_router
+from app.db.pool import get_pool_stats
+from app.core.config import settings
 from app.models import Order, OrderItem, User, UserRole
 from app.services import user_service
 from app.services.order_service import OrderService
@@ -51,7 +53,7 @@ def get_current_admin(
 @router.get("/dashboard/stats")
 def get_dashboard_stats(
     current_user: User = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get dashboard statistics (total orders, revenue, users, etc)."""
     try:
@@ -107,7 +109,7 @@ def get_dashboard_stats(
 def get_orders_summary(
     days: int = Query(30, ge=1, le=365),
     current_user: User = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get order summary for the last N days."""
     try:
@@ -147,7 +149,7 @@ def get_revenue_report(
     start_date: str = Query(...),  # YYYY-MM-DD
     end_date: str = Query(...),    # YYYY-MM-DD
     current_user: User = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get revenue report for a date range."""
     try:
@@ -263,7 +265,7 @@ def get_top_products(
     limit: int = Query(10, ge=1, le=100),
     days: int = Query(30, ge=1, le=365),
     current_user: User = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get top selling products for the last N days."""
     try:
@@ -313,7 +315,7 @@ def get_top_products(
 @router.get("/orders/by-status")
 def get_orders_by_status(
     current_user: User = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get order count and revenue breakdown by status."""
     try:
@@ -342,3 +344,27 @@ def get_orders_by_status(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve orders by status"
         )
+
+
+@router.get("/db/pool")
+def get_db_pool_stats(
+    current_user: User = Depends(get_current_admin),
+):
+    """Get database connection pool configuration and usage statistics."""
+    stats = get_pool_stats(engine)
+    stats["config"] = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "statement_timeout_ms": settings.DB_STATEMENT_TIMEOUT_MS,
+        "web_concurrency": settings.WEB_CONCURRENCY,
+        "max_connections": settings.DB_MAX_CONNECTIONS,
+    }
+    stats["replicas"] = [
+        {**status_, "pool": get_pool_stats(replica.engine)}
+        for status_, replica in zip(replica_router.status(), replica_router.replicas)
+    ]
+    logger.info(f"DB pool stats retrieved by user {current_user.id}")
+    return stats
@@ -0,0 +1,136 @@
+from fastapi import APIRouter, Depends, Header, Path, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.websockets import WebSocketState
+from typing import Optional
+import asyncio
+
+from app.core.config import settings
+from app.core.exceptions import AppException
+from app.core.logging import get_logger
+from app.db.database import get_db
+from app.schemas.kitchen import KitchenOrder, KitchenQueueResponse
+from app.services import order_events
+from app.services.kitchen_queue import kitchen_queue
+from app.services.menu_cache import menu_cache
+from app.services.order_events import EventFilter, OrderEvent, Subscription, UnknownStatusError
+
+logger = get_logger(__name__)
+
+router = APIRouter(
+    prefix="/kitchen",
+    tags=["Kitchen"],
+)
+
+# Close code for "try again later" when the worker has too many subscribers
+WS_TRY_AGAIN_LATER = 1013
+
+
+def _subscribe(status: Optional[str], table: Optional[str], last_event_id: Optional[str]) -> Subscription:
+    try:
+        event_filter = EventFilter.parse(status, table)
+    except UnknownStatusError as e:
+        raise AppException(str(e), 422)
+    except ValueError as e:
+        raise AppException(str(e), 400)
+    try:
+        return order_events.get_broker().subscribe(event_filter, last_event_id or None)
+    except ValueError:
+        raise AppException("Last-Event-ID must be an order event id", 400)
+    except OverflowError as e:
+        raise AppException(str(e), 503)
+
+
+def _sse_message(event: OrderEvent) -> bytes:
+    return b"id: %s\nevent: %s\ndata: %s\n\n" % ((event.id or "").encode(), event.type.encode(), event.to_json())
+
+
+@router.get("/stream")
+async def stream_order_events(
+    status: Optional[str] = Query(None, description="Comma-separated statuses, e.g. pending,preparing"),
+    table: Optional[str] = Query(None, description="Comma-separated table numbers"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """Stream order events as Server-Sent Events.
+
+    Reconnecting clients send Last-Event-ID to receive the events they
+    missed; a ``resync`` event means they should refetch current orders.
+    """
+    subscription = _subscribe(status, table, last_event_id)
+
+    async def events():
+        with subscription:
+            yield b"retry: 3000\n\n"
+            while True:
+                event = await subscription.get(settings.ORDER_EVENTS_HEARTBEAT_SECONDS)
+                # A comment line keeps proxies from closing an idle connection
+                yield b": heartbeat\n\n" if event is None else _sse_message(event)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def order_events_websocket(
+    websocket: WebSocket,
+    status: Optional[str] = Query(None),
+    table: Optional[str] = Query(None),
+    last_event_id: Optional[str] = Query(None),
+):
+    """Push order events as JSON messages over a WebSocket."""
+    try:
+        subscription = _subscribe(status, table, last_event_id)
+    except AppException as e:
+        await websocket.close(code=WS_TRY_AGAIN_LATER if e.status_code == 503 else 1008, reason=e.message)
+        return
+
+    await websocket.accept()
+
+    async def send_events():
+        while True:
+            event = await subscription.get(settings.ORDER_EVENTS_HEARTBEAT_SECONDS)
+            if event is None:
+                await websocket.send_json({"type": "heartbeat"})
+            else:
+                await websocket.send_text(event.to_json().decode())
+
+    with subscription:
+        sender = asyncio.create_task(send_events())
+        try:
+            # Client messages are ignored; receiving detects the disconnect
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        finally:
+            sender.cancel()
+            try:
+                await sender
+            except (asyncio.CancelledError, WebSocketDisconnect, RuntimeError):
+                pass
+            if websocket.client_state == WebSocketState.CONNECTED:
+                await websocket.close()
+
+
+@router.get("/queue", response_model=KitchenQueueResponse)
+def get_kitchen_queue(
+    station: Optional[str] = Query(None, description="Only lines of this station (menu category)"),
+    db: Session = Depends(get_db),
+):
+    """Pending and preparing orders in cooking order, with estimated ready times."""
+    kitchen_queue.ensure_loaded(db)
+    return kitchen_queue.schedule(menu_cache.get_pricing_index(db).items, station=station)
+
+
+@router.get("/orders/{order_id}/eta", response_model=KitchenOrder)
+def get_order_eta(
+    order_id: int = Path(..., gt=0),
+    db: Session = Depends(get_db),
+):
+    """Estimated ready time of one pending or preparing order."""
+    kitchen_queue.ensure_loaded(db)
+    order = kitchen_queue.order_eta(order_id, menu_cache.get_pricing_index(db).items)
+    if order is None:
+        raise AppException("Order is not in the kitchen queue", 404)
+    return order
@@ -0,0 +1,65 @@
+"""Deferred router registration for rarely used API modules."""
+import importlib
+import threading
+
+from fastapi import FastAPI
+from starlette.routing import Mount
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class LazyRouter:
+    """Register a router's URL prefix now and import its module on first use.
+
+    A placeholder mount is added at the router's prefix. The first request
+    under it (or the first OpenAPI schema build) imports the module, includes
+    its router in the app, removes the placeholder and re-dispatches the
+    request, so routing, dependencies and middleware behave as if the router
+    had been included at startup.
+    """
+
+    def __init__(self, app: FastAPI, module_path: str, router_prefix: str, prefix: str = ""):
+        self.app = app
+        self.module_path = module_path
+        self.prefix = prefix
+        self.mount = Mount(prefix + router_prefix, app=self)
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def install(self) -> "LazyRouter":
+        self.app.router.routes.append(self.mount)
+        return self
+
+    def load(self) -> None:
+        """Import the module and include its router (idempotent)."""
+        with self._lock:
+            if self.loaded:
+                return
+            module = importlib.import_module(self.module_path)
+            self.app.include_router(module.router, prefix=self.prefix)
+            self.app.router.routes.remove(self.mount)
+            self.app.openapi_schema = None
+            self.loaded = True
+            logger.info(f"Lazy router loaded: {self.module_path}")
+
+    async def __call__(self, scope, receive, send):
+        if not self.loaded:
+            self.load()
+        # Undo the mount's root_path change and route again through the app
+        scope = dict(scope, root_path=scope.get("app_root_path", ""))
+        await self.app.router(scope, receive, send)
+
+
+def include_lazy_routers(app: FastAPI, lazy_routers: list) -> None:
+    """Make OpenAPI generation load every lazy router first."""
+    original_openapi = app.openapi
+
+    def openapi():
+        if app.openapi_schema is None:
+            for lazy_router in lazy_routers:
+                lazy_router.load()
+        return original_openapi()
+
+    app.openapi = openapi
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, Query, Path
+from fastapi import APIRouter, Body, Depends, Query, Path, Request, Response
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.db.database import get_db
+from app.core.config import settings
+from app.db.database import get_db, get_read_db, get_async_db
 from app.schemas.menu import (
     MenuItemCreate,
     MenuItemUpdate,
@@ -11,9 +14,15 @@ from app.schemas.menu import (
     MenuOptionResponse,
     OptionChoiceCreate,
     OptionChoiceResponse,
+    MenuCatalogFile,
+    MenuImportResult,
+    DisplayOrder,
+    MenuCategory,
 )
-from app.services.menu_service import MenuService
+from app.services.menu_service import MenuService, AsyncMenuService
+from app.services.menu_import import MenuImportService, items_to_csv, parse_catalog_json, parse_items_csv
 from app.core.logging import get_logger
+from app.core.responses import precompressed_response, typed_response
 
 logger = get_logger(__name__)
 
@@ -23,30 +32,86 @@ router = APIRouter(
 )
 
 
-# Menu Items Endpoints
+SEARCH_QUERY = Query(
+    ..., min_length=1, max_length=100,
+    description="Words or part of a name, in Thai or English; small typos are tolerated",
+)
 
-@router.get("/items", response_model=List[MenuItemResponse])
-def get_all_menu_items(
-    db: Session = Depends(get_db),
-    category: Optional[str] = Query(None),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
-):
-    """Get all menu items with optional filtering by category."""
-    logger.info(f"Fetching menu items: category={category}, skip={skip}, limit={limit}")
-    items = MenuService.get_all_menu_items(db, category=category, skip=skip, limit=limit)
-    return items
 
+# Menu Items Endpoints
 
-@router.get("/items/{item_id}", response_model=MenuItemResponse)
-def get_menu_item(
-    item_id: int = Path(..., gt=0),
-    db: Session = Depends(get_db),
-):
-    """Get menu item by ID."""
-    logger.info(f"Fetching menu item: {item_id}")
-    item = MenuService.get_menu_item_by_id(db, item_id)
-    return item
+if settings.DB_ASYNC:
+    # Menu reads served on the event loop through AsyncSession
+
+    @router.get("/items", response_model=List[MenuItemResponse])
+    async def get_all_menu_items(
+        request: Request,
+        db: AsyncSession = Depends(get_async_db),
+        category: Optional[str] = Query(None),
+        skip: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=1000),
+    ):
+        """Get all menu items with optional filtering by category."""
+        logger.info(f"Fetching menu items: category={category}, skip={skip}, limit={limit}")
+        payload = await AsyncMenuService.get_menu_payload(db, category=category, skip=skip, limit=limit)
+        return precompressed_response(request, payload.body, payload.encoded, payload.etag)
+
+    @router.get("/items/{item_id}", response_model=MenuItemResponse)
+    async def get_menu_item(
+        item_id: int = Path(..., gt=0),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        """Get menu item by ID."""
+        logger.info(f"Fetching menu item: {item_id}")
+        item = await AsyncMenuService.get_menu_item_by_id(db, item_id)
+        return item
+
+    @router.get("/search", response_model=List[MenuItemResponse])
+    async def search_menu_items(
+        db: AsyncSession = Depends(get_async_db),
+        q: str = SEARCH_QUERY,
+        category: Optional[str] = Query(None),
+        limit: int = Query(20, ge=1, le=100),
+    ):
+        """Search menu items; recommended items rank higher."""
+        items = await AsyncMenuService.search_menu_items(db, q, category=category, limit=limit)
+        return typed_response(List[MenuItemResponse], items)
+
+else:
+
+    @router.get("/items", response_model=List[MenuItemResponse])
+    def get_all_menu_items(
+        request: Request,
+        db: Session = Depends(get_read_db),
+        category: Optional[str] = Query(None),
+        skip: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=1000),
+    ):
+        """Get all menu items with optional filtering by category."""
+        logger.info(f"Fetching menu items: category={category}, skip={skip}, limit={limit}")
+        payload = MenuService.get_menu_payload(db, category=category, skip=skip, limit=limit)
+        return precompressed_response(request, payload.body, payload.encoded, payload.etag)
+
+    @router.get("/items/{item_id}", response_model=MenuItemResponse)
+    def get_menu_item(
+        item_id: int = Path(..., gt=0),
+        db: Session = Depends(get_read_db),
+    ):
+        """Get menu item by ID."""
+        logger.info(f"Fetching menu item: {item_id}")
+        item = MenuService.get_menu_item_by_id(db, item_id)
+        return item
+
+    @router.get("/search", response_model=List[MenuItemResponse])
+    def search_menu_items(
+        db: Session = Depends(get_read_db),
+        q: str = SEARCH_QUERY,
+        category: Optional[str] = Query(None),
+        limit: int = Query(20, ge=1, le=100),
+    ):
+        """Search menu items; recommended items rank higher."""
+        items = MenuService.search_menu_items(db, q, category=category, limit=limit)
+        return typed_response(List[MenuItemResponse], items)
 
 
 @router.post("/items", response_model=MenuItemResponse, status_code=201)
@@ -85,18 +150,71 @@ def delete_menu_item(
 
 
 @router.get("/categories", response_model=List[str])
-def get_categories(db: Session = Depends(get_db)):
+def get_categories(db: Session = Depends(get_read_db)):
     """Get all menu categories."""
     logger.info("Fetching menu categories")
-    categories = MenuService.get_categories(db)
-    return categories
+    categories = MenuService.get_category_index(db)
+    return Response(categories.names_body, media_type="application/json")
+
+
+@router.get("/categories/facets", response_model=List[MenuCategory])
+def get_category_facets(db: Session = Depends(get_read_db)):
+    """Get menu categories with item and availability counts, for faceted browsing."""
+    logger.info("Fetching menu category facets")
+    categories = MenuService.get_category_index(db)
+    return Response(categories.categories_body, media_type="application/json")
+
+
+# Bulk Import/Export Endpoints
+
+@router.get("/export", response_model=MenuCatalogFile)
+def export_menu(
+    format: str = Query("json", pattern="^(json|csv)$"),
+    db: Session = Depends(get_read_db),
+):
+    """Export the menu catalog as JSON, or menu items as CSV."""
+    logger.info(f"Exporting menu as {format}")
+    catalog = MenuImportService.export_catalog(db)
+    if format == "csv":
+        return Response(
+            items_to_csv(catalog.items),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": 'attachment; filename="menu_items.csv"'},
+        )
+    return typed_response(MenuCatalogFile, catalog)
+
+
+# The body is parsed here so that CSV and JSON share one endpoint
+@router.post("/import", response_model=MenuImportResult, openapi_extra={
+    "requestBody": {
+        "required": True,
+        "content": {
+            # Registered in the schema by the export endpoint's response model
+            "application/json": {"schema": {"$ref": "#/components/schemas/MenuCatalogFile"}},
+            "text/csv": {"schema": {"type": "string", "description": "Menu item rows with a header row"}},
+        },
+    },
+})
+async def import_menu(
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    """Create or update options, choices and items in one transaction."""
+    body = await request.body()
+    if request.headers.get("content-type", "").startswith("text/csv"):
+        catalog = MenuCatalogFile(items=parse_items_csv(body.decode("utf-8-sig")))
+    else:
+        catalog = parse_catalog_json(body)
+    logger.info(f"Importing menu: {len(catalog.options)} options, {len(catalog.items)} items")
+    result = await run_in_threadpool(MenuImportService.import_catalog, db, catalog)
+    return result
 
 
 # Menu Options Endpoints
 
 @router.get("/options", response_model=List[MenuOptionResponse])
 def get_all_menu_options(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
 ):
@@ -109,7 +227,7 @@ def get_all_menu_options(
 @router.get("/options/{option_id}", response_model=MenuOptionResponse)
 def get_menu_option(
     option_id: int = Path(..., gt=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get menu option by ID."""
     logger.info(f"Fetching menu option: {option_id}")
@@ -191,7 +309,7 @@ def delete_option_choice(
 @router.post("/options/{option_id}/reorder-choices", response_model=List[OptionChoiceResponse])
 def reorder_option_choices(
     option_id: int = Path(..., gt=0),
-    choice_orders: List[dict] = None,
+    choice_orders: List[DisplayOrder] = Body(...),
     db: Session = Depends(get_db),
 ):
     """Reorder option choices. 
@@ -199,3 +317,24 @@ def reorder_option_choices(
     logger.info(f"Reordering choices for option: {option_id}")
     choices = MenuService.reorder_option_choices(db, option_id, choice_orders)
     return choices
+
+
+@router.post("/options/reorder", response_model=List[DisplayOrder])
+def reorder_menu_options(
+    option_orders: List[DisplayOrder],
+    db: Session = Depends(get_db),
+):
+    """Set the display order of many options in one update."""
+    logger.info(f"Reordering {len(option_orders)} menu options")
+    return MenuService.reorder_menu_options(db, option_orders)
+
+
+@router.post("/categories/{category}/reorder", response_model=List[DisplayOrder])
+def reorder_menu_items(
+    category: str,
+    item_orders: List[DisplayOrder],
+    db: Session = Depends(get_db),
+):
+    """Set the display order of menu items within a category in one update."""
+    logger.info(f"Reordering {len(item_orders)} menu items in category: {category}")
+    return MenuService.reorder_menu_items(db, category, item_orders)
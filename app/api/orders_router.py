@@ -1,14 +1,27 @@
-from fastapi import APIRouter, Depends, Query, Path
+from fastapi import APIRouter, Depends, Header, Query, Path, Response
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Awaitable, Callable, List, Optional
+import asyncio
+from app.core.config import settings
+from app.core.exceptions import AppException
+from app.db.database import get_db, get_read_db, get_async_db
 from app.schemas.order import (
+    OrderBulkCreate,
+    OrderBulkResponse,
+    OrderChanges,
     OrderCreate,
+    OpenTables,
     OrderUpdate,
     OrderResponse,
 )
-from app.services.order_service import OrderService
+from app.services import order_events
+from app.services.idempotency import StoredResponse
+from app.services.open_tables import open_tables
+from app.services.order_service import OrderService, AsyncOrderService
 from app.core.logging import get_logger
+from app.core.responses import typed_response
 
 logger = get_logger(__name__)
 
@@ -18,39 +31,197 @@ router = APIRouter(
 )
 
 
-@router.get("", response_model=List[OrderResponse])
-def get_all_orders(
-    db: Session = Depends(get_db),
-    status: Optional[str] = Query(None),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000),
-):
-    """Get all orders with optional filtering by status."""
-    logger.info(f"Fetching orders: status={status}, skip={skip}, limit={limit}")
-    orders = OrderService.get_all_orders(db, status=status, skip=skip, limit=limit)
-    return orders
+async def wait_for_changes(
+    fetch: Callable[[], Awaitable[OrderChanges]], since: Optional[str], timeout: float
+) -> OrderChanges:
+    """Fetch changes; if there are none, wait for one and fetch again.
 
+    Order events wake the request for changes made through this worker;
+    changes made through other workers are found by re-fetching every
+    ORDER_CHANGES_POLL_SECONDS. Subscribing before the first fetch means a
+    change committed in between still wakes the request. ``fetch`` must not
+    hold a database connection while the request waits.
+    """
+    try:
+        subscription = order_events.get_broker().subscribe()
+    except OverflowError as e:
+        raise AppException(str(e), 503)
 
-@router.get("/{order_id}", response_model=OrderResponse)
-def get_order(
-    order_id: int = Path(..., gt=0),
-    db: Session = Depends(get_db),
-):
-    """Get order by ID."""
-    logger.info(f"Fetching order: {order_id}")
-    order = OrderService.get_order_by_id(db, order_id)
-    return order
+    with subscription:
+        changes = await fetch()
+        if not since:
+            return changes
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not changes.orders:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            if await subscription.get(min(remaining, settings.ORDER_CHANGES_POLL_SECONDS)) is not None:
+                # The change is returned once it is older than the safety lag
+                await asyncio.sleep(max(0.0, min(settings.ORDER_CHANGES_SAFETY_LAG_SECONDS, deadline - loop.time())))
+            changes = await fetch()
+    return changes
 
 
-@router.post("", response_model=OrderResponse, status_code=201)
-def create_order(
-    order_create: OrderCreate,
-    db: Session = Depends(get_db),
-):
-    """Create new order."""
-    logger.info(f"Creating order with {len(order_create.items)} items")
-    order = OrderService.create_order(db, order_create)
-    return order
+def replay_response(stored: StoredResponse, replayed: bool) -> Response:
+    """Send a response stored for an Idempotency-Key."""
+    headers = {"Idempotent-Replayed": "true"} if replayed else None
+    return Response(stored.body, status_code=stored.status_code, media_type="application/json", headers=headers)
+
+
+IDEMPOTENCY_KEY = Header(
+    None, alias="Idempotency-Key",
+    description="Client-generated unique key; retries with the same key return the original order",
+)
+
+CHANGES_SINCE = Query(None, description="Cursor from the previous response; omit to get the current cursor")
+CHANGES_TIMEOUT = Query(
+    settings.ORDER_CHANGES_MAX_WAIT_SECONDS, ge=0, le=settings.ORDER_CHANGES_MAX_WAIT_SECONDS,
+    description="Seconds to wait for a change when there is none yet",
+)
+
+
+# Registered before /{order_id}; served from memory, the database is only read on first use
+@router.get("/tables", response_model=OpenTables)
+def get_open_tables(db: Session = Depends(get_db)):
+    """Open orders per table: count, running total and oldest pending order."""
+    open_tables.ensure_loaded(db)
+    return open_tables.snapshot()
+
+
+if settings.DB_ASYNC:
+    # High-concurrency endpoints served on the event loop through AsyncSession
+
+    @router.get("", response_model=List[OrderResponse])
+    async def get_all_orders(
+        db: AsyncSession = Depends(get_async_db),
+        status: Optional[str] = Query(None),
+        skip: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=1000),
+    ):
+        """Get all orders with optional filtering by status."""
+        logger.info(f"Fetching orders: status={status}, skip={skip}, limit={limit}")
+        orders = await AsyncOrderService.get_all_orders(db, status=status, skip=skip, limit=limit)
+        return typed_response(List[OrderResponse], orders)
+
+    # Reads the primary: a replica may not have the change an event announced yet
+    @router.get("/changes", response_model=OrderChanges)
+    async def get_order_changes(
+        db: AsyncSession = Depends(get_async_db),
+        since: Optional[str] = CHANGES_SINCE,
+        timeout: float = CHANGES_TIMEOUT,
+        limit: int = Query(100, ge=1, le=1000),
+    ):
+        """Long-poll for orders changed after the ``since`` cursor."""
+        async def fetch() -> OrderChanges:
+            try:
+                return await AsyncOrderService.get_order_changes(db, since, limit)
+            finally:
+                await db.rollback()  # Return the connection to the pool while waiting
+
+        changes = await wait_for_changes(fetch, since, timeout)
+        return typed_response(OrderChanges, changes)
+
+    @router.get("/{order_id}", response_model=OrderResponse)
+    async def get_order(
+        order_id: int = Path(..., gt=0),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        """Get order by ID."""
+        logger.info(f"Fetching order: {order_id}")
+        order = await AsyncOrderService.get_order_by_id(db, order_id)
+        return order
+
+    @router.post("", response_model=OrderResponse, status_code=201)
+    async def create_order(
+        order_create: OrderCreate,
+        db: AsyncSession = Depends(get_async_db),
+        idempotency_key: Optional[str] = IDEMPOTENCY_KEY,
+    ):
+        """Create new order."""
+        logger.info(f"Creating order with {len(order_create.items)} items")
+        if idempotency_key is not None:
+            stored, replayed = await AsyncOrderService.create_order_idempotent(db, order_create, idempotency_key)
+            return replay_response(stored, replayed)
+        order = await AsyncOrderService.create_order(db, order_create)
+        return order
+
+    @router.post("/bulk", response_model=OrderBulkResponse)
+    async def create_orders_bulk(
+        bulk: OrderBulkCreate,
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        """Create many orders at once; each result reports its own success or error."""
+        logger.info(f"Creating {len(bulk.orders)} orders in bulk")
+        result = await AsyncOrderService.create_orders_bulk(db, bulk)
+        return typed_response(OrderBulkResponse, result)
+
+else:
+
+    @router.get("", response_model=List[OrderResponse])
+    def get_all_orders(
+        db: Session = Depends(get_read_db),
+        status: Optional[str] = Query(None),
+        skip: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=1000),
+    ):
+        """Get all orders with optional filtering by status."""
+        logger.info(f"Fetching orders: status={status}, skip={skip}, limit={limit}")
+        orders = OrderService.get_all_orders(db, status=status, skip=skip, limit=limit)
+        return typed_response(List[OrderResponse], orders)
+
+    # Reads the primary: a replica may not have the change an event announced yet
+    @router.get("/changes", response_model=OrderChanges)
+    async def get_order_changes(
+        db: Session = Depends(get_db),
+        since: Optional[str] = CHANGES_SINCE,
+        timeout: float = CHANGES_TIMEOUT,
+        limit: int = Query(100, ge=1, le=1000),
+    ):
+        """Long-poll for orders changed after the ``since`` cursor."""
+        def fetch_changes() -> OrderChanges:
+            try:
+                return OrderService.get_order_changes(db, since, limit)
+            finally:
+                db.rollback()  # Return the connection to the pool while waiting
+
+        changes = await wait_for_changes(lambda: run_in_threadpool(fetch_changes), since, timeout)
+        return typed_response(OrderChanges, changes)
+
+    @router.get("/{order_id}", response_model=OrderResponse)
+    def get_order(
+        order_id: int = Path(..., gt=0),
+        db: Session = Depends(get_read_db),
+    ):
+        """Get order by ID."""
+        logger.info(f"Fetching order: {order_id}")
+        order = OrderService.get_order_by_id(db, order_id)
+        return order
+
+    @router.post("", response_model=OrderResponse, status_code=201)
+    def create_order(
+        order_create: OrderCreate,
+        db: Session = Depends(get_db),
+        idempotency_key: Optional[str] = IDEMPOTENCY_KEY,
+    ):
+        """Create new order."""
+        logger.info(f"Creating order with {len(order_create.items)} items")
+        if idempotency_key is not None:
+            stored, replayed = OrderService.create_order_idempotent(db, order_create, idempotency_key)
+            return replay_response(stored, replayed)
+        order = OrderService.create_order(db, order_create)
+        return order
+
+    @router.post("/bulk", response_model=OrderBulkResponse)
+    def create_orders_bulk(
+        bulk: OrderBulkCreate,
+        db: Session = Depends(get_db),
+    ):
+        """Create many orders at once; each result reports its own success or error."""
+        logger.info(f"Creating {len(bulk.orders)} orders in bulk")
+        result = OrderService.create_orders_bulk(db, bulk)
+        return typed_response(OrderBulkResponse, result)
 
 
 @router.put("/{order_id}", response_model=OrderResponse)
@@ -76,6 +247,28 @@ def delete_order(
     return None
 
 
+@router.post("/{order_id}/start", response_model=OrderResponse)
+def start_order(
+    order_id: int = Path(..., gt=0),
+    db: Session = Depends(get_db),
+):
+    """Mark order as being prepared."""
+    logger.info(f"Starting order: {order_id}")
+    order = OrderService.start_order(db, order_id)
+    return order
+
+
+@router.post("/{order_id}/ready", response_model=OrderResponse)
+def ready_order(
+    order_id: int = Path(..., gt=0),
+    db: Session = Depends(get_db),
+):
+    """Mark order as ready to serve."""
+    logger.info(f"Order ready: {order_id}")
+    order = OrderService.ready_order(db, order_id)
+    return order
+
+
 @router.post("/{order_id}/cancel", response_model=OrderResponse)
 def cancel_order(
     order_id: int = Path(..., gt=0),
@@ -99,7 +292,7 @@ def complete_order(
 
 
 @router.get("/summary/statistics", response_model=dict)
-def get_order_summary(db: Session = Depends(get_db)):
+def get_order_summary(db: Session = Depends(get_read_db)):
     """Get order summary statistics."""
     logger.info("Fetching order summary")
     summary = OrderService.get_order_summary(db)
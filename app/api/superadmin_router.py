@@ -1,5 +1,6 @@
 """SuperAdmin API endpoints for role and permission management."""
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Path
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime
@@ -8,6 +9,8 @@ from app.models import User, UserRole, Permission, AuditLog
 from app.services import user_service
 from app.core.security import JWTService
 from app.core.logging import get_logger
+from app.core.config import settings
+from app.core import profiling
 from app.schemas.user import UserRoleEnum, UserStatusEnum
 
 logger = get_logger(__name__)
@@ -836,3 +839,47 @@ def admin_reset_user_password(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to reset password"
         )
+
+
+@router.get("/profiles")
+def list_profiles(
+    current_user: User = Depends(get_current_superadmin),
+):
+    """List recently captured request and process profiles."""
+    return {"profiles": profiling.profile_store.list()}
+
+
+@router.post("/profiles/sample", status_code=status.HTTP_202_ACCEPTED)
+def start_process_profile(
+    seconds: float = Query(10, gt=0),
+    current_user: User = Depends(get_current_superadmin),
+):
+    """Start a time-boxed sampling profile of the whole process."""
+    if seconds > settings.PROFILE_MAX_SECONDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Sampling is limited to {settings.PROFILE_MAX_SECONDS} seconds"
+        )
+
+    profile_id = profiling.start_process_sampling(seconds, label=f"process ({seconds}s)")
+    logger.info(f"Process profile {profile_id} started for {seconds}s by superadmin {current_user.id}")
+    return {"profile_id": profile_id, "status": "running", "seconds": seconds}
+
+
+@router.get("/profiles/{profile_id}")
+def get_profile(
+    profile_id: str,
+    format: str = Query("json", pattern="^(json|collapsed)$"),
+    current_user: User = Depends(get_current_superadmin),
+):
+    """Get a captured profile as JSON or as collapsed stacks for flamegraph tools."""
+    profile = profiling.profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+
+    if format == "collapsed":
+        return PlainTextResponse(profile.get("collapsed", ""))
+    return profile
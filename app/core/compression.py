@@ -0,0 +1,192 @@
+"""Response compression with a size threshold and per-route opt-out.
+
+Responses are compressed with brotli (when the brotli package is installed)
+or gzip, whichever the client gives the higher q-value (brotli on a tie).
+Compressible responses carry ``Vary: Accept-Encoding`` even when sent
+uncompressed. A response is sent as-is when:
+
+* it is smaller than COMPRESSION_MIN_SIZE,
+* it already has a Content-Encoding (e.g. the pre-compressed menu payload),
+* its content type is already compressed or streamed (images, archives,
+  server-sent events),
+* it sets ``Cache-Control: no-transform``,
+* its path starts with one of COMPRESSION_EXCLUDE_PATHS, or
+* its endpoint is decorated with :func:`no_compression`.
+"""
+import zlib
+from typing import Callable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core.config import get_settings
+from app.core.responses import negotiate_encoding
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+settings = get_settings()
+
+EXCLUDED_CONTENT_TYPES = (
+    "text/event-stream",
+    "image/",
+    "video/",
+    "audio/",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/octet-stream",
+)
+
+
+def no_compression(endpoint: Callable) -> Callable:
+    """Mark an endpoint whose responses must never be compressed."""
+    endpoint.no_compression = True
+    return endpoint
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        # wbits=31 writes a gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        body = self._compressor.compress(data)
+        # Flush streamed chunks so clients receive them without waiting for the end
+        return body + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        body = self._compressor.process(data)
+        return body + (self._compressor.finish() if final else self._compressor.flush())
+
+
+def available_encodings() -> tuple:
+    """Content codings the middleware can produce, in order of preference."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def make_encoder(coding: str, gzip_level: int, brotli_quality: int):
+    if coding == "br":
+        return _BrotliEncoder(brotli_quality)
+    return _GzipEncoder(gzip_level)
+
+
+class CompressionMiddleware:
+    """Compress HTTP responses for clients that accept it."""
+
+    def __init__(
+        self,
+        app,
+        minimum_size: Optional[int] = None,
+        gzip_level: Optional[int] = None,
+        brotli_quality: Optional[int] = None,
+        exclude_paths: Optional[list] = None,
+    ):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+        self.gzip_level = settings.COMPRESSION_GZIP_LEVEL if gzip_level is None else gzip_level
+        self.brotli_quality = (
+            settings.COMPRESSION_BROTLI_QUALITY if brotli_quality is None else brotli_quality
+        )
+        self.exclude_paths = tuple(
+            settings.COMPRESSION_EXCLUDE_PATHS if exclude_paths is None else exclude_paths
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+
+        coding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"), available_encodings())
+        if coding is None:
+            async def send_with_vary(message):
+                # Other clients may get this response compressed
+                if message["type"] == "http.response.start" and self._compressible(
+                    scope, Headers(raw=message["headers"])
+                ):
+                    MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+                await send(message)
+
+            await self.app(scope, receive, send_with_vary)
+            return
+
+        start_message = None
+        encoder = None
+        passthrough = False
+        # Body chunks held back until there is enough to decide on compression;
+        # responses passing through BaseHTTPMiddleware always arrive streamed
+        pending = []
+        pending_size = 0
+
+        async def send_compressed(message):
+            nonlocal start_message, encoder, passthrough, pending_size
+            message_type = message["type"]
+
+            if message_type == "http.response.start":
+                passthrough = not self._compressible(scope, Headers(raw=message["headers"]))
+                if passthrough:
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if passthrough or message_type != "http.response.body":
+                if start_message is not None:
+                    await send(start_message)
+                    start_message = None
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is None:
+                pending.append(body)
+                pending_size += len(body)
+                if more_body and pending_size < self.minimum_size:
+                    return
+                body = b"".join(pending)
+                pending.clear()
+
+                if len(body) < self.minimum_size:
+                    passthrough = True
+                    # Sent as-is, but the choice still depended on Accept-Encoding
+                    MutableHeaders(raw=start_message["headers"]).add_vary_header("Accept-Encoding")
+                    await send(start_message)
+                    start_message = None
+                    await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                    return
+
+                encoder = make_encoder(coding, self.gzip_level, self.brotli_quality)
+                headers = MutableHeaders(raw=start_message["headers"])
+                headers["Content-Encoding"] = coding
+                headers.add_vary_header("Accept-Encoding")
+                del headers["Content-Length"]
+                body = encoder.compress(body, final=not more_body)
+                if not more_body:
+                    headers["Content-Length"] = str(len(body))
+                await send(start_message)
+                start_message = None
+            else:
+                body = encoder.compress(body, final=not more_body)
+
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _compressible(self, scope, headers: Headers) -> bool:
+        """Whether the response headers and route allow compressing the body."""
+        if "content-encoding" in headers:
+            return False
+        if headers.get("content-type", "").startswith(EXCLUDED_CONTENT_TYPES):
+            return False
+        if "no-transform" in headers.get("cache-control", ""):
+            return False
+        endpoint = getattr(scope.get("route"), "endpoint", None)
+        return not getattr(endpoint, "no_compression", False)
@@ -12,6 +12,23 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_ECHO: bool = False  # Log every SQL statement
+    DB_MAX_CONNECTIONS: int = 20  # Connections this deployment may open across all workers
+    WEB_CONCURRENCY: int = 1  # Worker processes sharing DB_MAX_CONNECTIONS; set by the launcher if unset
+    DB_POOL_SIZE: int | None = None  # Defaults from DB_MAX_CONNECTIONS / WEB_CONCURRENCY
+    DB_MAX_OVERFLOW: int | None = None  # Defaults from DB_MAX_CONNECTIONS / WEB_CONCURRENCY
+    DB_POOL_TIMEOUT: float = 10.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 30000  # PostgreSQL statement_timeout, 0 disables
+    DATABASE_REPLICA_URLS: list[str] = []  # Read replicas for read-only routes
+    REPLICA_MAX_LAG_SECONDS: float = 5.0  # Replicas lagging more fall back to primary
+    REPLICA_LAG_CHECK_INTERVAL: float = 10.0  # Seconds between lag checks
+    READ_YOUR_WRITES_SECONDS: float = 5.0  # Reads go to primary this long after a write
+    DB_SCHEMA_MODE: str = "auto"  # 'migrations', 'create_all' or 'auto' (create_all when DEBUG)
+    DB_SCHEMA_REVISION: str | None = None  # Expected alembic revision; defaults to the head
+    DB_POOL_WARM_CONNECTIONS: int = 2  # Connections opened at startup
+    DB_ASYNC: bool = False  # Serve hot endpoints with AsyncSession (needs asyncpg/aiosqlite)
     
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production-min-32-chars-long-key-12345"
@@ -33,16 +50,126 @@ class Settings(BaseSettings):
     
     # API
     API_V1_PREFIX: str = "/api/v1"
-    
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_TO_FILE: bool = True
+    LOG_DIR: str = "logs"
+    LOG_FILE_NAME: str = "app.log"  # app.<pid>.log per worker when WEB_CONCURRENCY > 1
+    LOG_ROTATION: str = "size"  # 'size', 'time' or 'none'
+    LOG_MAX_BYTES: int = 10 * 1024 * 1024  # Used by 'size' rotation
+    LOG_ROTATION_WHEN: str = "midnight"  # Used by 'time' rotation
+    LOG_BACKUP_COUNT: int = 7  # Number of rotated files to keep
+    LOG_COMPRESS: bool = True  # Gzip rotated files in the background
+
+    # Menu cache
+    MENU_CACHE_CHECK_INTERVAL: float = 2.0  # Seconds between menu version checks
+    MENU_STOCK_CHECK_INTERVAL: float = 1.0  # Seconds between stock re-reads (orders don't bump the version)
+    WARM_MENU_CACHE: bool = True  # Load the menu catalog at startup
+
+    # Query diagnostics
+    SLOW_QUERY_THRESHOLD_MS: int = 500  # Log statements slower than this
+    QUERY_STATS_HEADERS: bool | None = None  # X-DB-Query-* headers; defaults to DEBUG
+
+    # Profiling
+    PROFILING_ENABLED: bool = True  # Allow superadmins to profile requests
+    PROFILE_SAMPLE_INTERVAL_MS: float = 5.0
+    PROFILE_MAX_SECONDS: int = 60  # Upper bound for whole-process sampling
+    PROFILE_STORE_SIZE: int = 20  # Number of recent profiles kept in memory
+
+    # Metrics
+    METRICS_ENABLED: bool = True  # Expose Prometheus metrics at /metrics
+
+    # Order event stream (kitchen WebSocket/SSE)
+    ORDER_EVENTS_QUEUE_SIZE: int = 100  # Events buffered per connection before it must resync
+    ORDER_EVENTS_REPLAY_SIZE: int = 256  # Recent events kept for Last-Event-ID resume
+    ORDER_EVENTS_MAX_SUBSCRIBERS: int = 200  # Connections per worker
+    ORDER_EVENTS_HEARTBEAT_SECONDS: float = 15.0  # Keep-alive interval on idle streams
+    ORDER_EVENTS_SHARED_BROKER: bool = False  # A set_broker() broker shares events across workers
+    ORDER_CHANGES_MAX_WAIT_SECONDS: float = 25.0  # Long-poll limit; keep below proxy read timeouts
+    # Changes newer than this are held back: updated_at is stamped at flush, so a transaction
+    # that flushed earlier may still commit; keep above the longest order transaction
+    ORDER_CHANGES_SAFETY_LAG_SECONDS: float = 1.0
+    ORDER_CHANGES_POLL_SECONDS: float = 1.0  # Re-check interval while waiting, for other workers' changes
+    # With several workers or a shared broker, in-memory order views (kitchen queue, open tables)
+    # are rebuilt from the database when read this long after their last load, picking up other
+    # workers' changes and missed events; see order_views_resync_interval
+    ORDER_VIEWS_RESYNC_SECONDS: float = 60.0
+
+    # Kitchen preparation queue (GET /kitchen/queue)
+    KITCHEN_COOKS_PER_STATION: int = 2  # Lines a station (menu category) cooks at once
+    KITCHEN_DEFAULT_PREP_MINUTES: int = 10  # For menu items without a prep_time
+
+    # Idempotency-Key on POST /orders
+    IDEMPOTENCY_TTL_SECONDS: int = 86400  # How long a key's response is replayed
+    IDEMPOTENCY_CACHE_SIZE: int = 10000  # Recent keys kept in worker memory
+    IDEMPOTENCY_PURGE_INTERVAL_SECONDS: float = 600.0  # Min time between expired-key cleanups
+
+    # Response compression
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # Smaller bodies are sent uncompressed
+    COMPRESSION_GZIP_LEVEL: int = 6  # 1 (fastest) to 9 (smallest)
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0 to 11; used when brotli is installed
+    COMPRESSION_EXCLUDE_PATHS: list[str] = []  # Path prefixes never compressed
+
+    # Server (python -m app.core.server)
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    SERVER_BACKEND: str = "auto"  # 'gunicorn', 'uvicorn' or 'auto' (gunicorn when installed)
+    PRELOAD_APP: bool = True  # Import the app once in the gunicorn master before forking
+    WORKER_TIMEOUT: int = 60  # Seconds before gunicorn restarts an unresponsive worker
+    GRACEFUL_TIMEOUT: int = 30  # Seconds workers get to finish requests on shutdown/reload
+    KEEPALIVE_TIMEOUT: int = 5  # Seconds an idle keep-alive connection is held open
+    MAX_REQUESTS: int = 0  # Recycle a worker after this many requests, 0 disables
+    MAX_REQUESTS_JITTER: int = 0  # Random extra requests so workers do not recycle together
+
     class Config:
         env_file = ".env"
         case_sensitive = True
 
+    @property
+    def order_views_resync_interval(self) -> float | None:
+        """Seconds between order view rebuilds, or None when order events alone keep them current.
+
+        One worker with the in-process broker sees every order change, so
+        its views never re-read orders.
+        """
+        if self.WEB_CONCURRENCY > 1 or self.ORDER_EVENTS_SHARED_BROKER:
+            return self.ORDER_VIEWS_RESYNC_SECONDS
+        return None
+
+    @property
+    def db_connections_per_worker(self) -> int:
+        """Share of DB_MAX_CONNECTIONS available to a single worker process."""
+        return max(2, self.DB_MAX_CONNECTIONS // max(1, self.WEB_CONCURRENCY))
+
+    @property
+    def db_pool_size(self) -> int:
+        """Persistent connections per worker: about two thirds of its share, at most 10."""
+        if self.DB_POOL_SIZE is not None:
+            return self.DB_POOL_SIZE
+        return max(1, min(10, self.db_connections_per_worker * 2 // 3))
+
+    @property
+    def db_max_overflow(self) -> int:
+        """Burst connections per worker: the rest of its share."""
+        if self.DB_MAX_OVERFLOW is not None:
+            return self.DB_MAX_OVERFLOW
+        return max(0, self.db_connections_per_worker - self.db_pool_size)
+
 
 @lru_cache()
 def get_settings() -> Settings:
     return Settings()
 
 
+def reload_settings() -> Settings:
+    """Re-read settings after the environment changed (used by the server launcher)."""
+    global settings
+    get_settings.cache_clear()
+    settings = get_settings()
+    return settings
+
+
 # Create settings instance
 settings = get_settings()
@@ -1,38 +1,188 @@
 """Logging configuration."""
+import functools
+import gzip
 import logging
+import logging.handlers
+import os
+import shutil
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Create logs directory if it doesn't exist
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
+from app.core.config import get_settings
+
+# Rotated files are gzipped off the request path by a single worker thread
+_compress_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+
+
+def _gzip(source: str, dest: str) -> None:
+    """Gzip ``source`` into ``dest``, via a temporary file so ``dest`` is never partial."""
+    tmp = dest + ".tmp"
+    with open(source, "rb") as f_in, gzip.open(tmp, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.replace(tmp, dest)
+
+
+def _pending_name(source: str) -> str:
+    """Unique name for a rotated segment awaiting compression."""
+    return f"{source}.{time.time_ns()}.pending"
+
+
+def _handle_error(handler: logging.Handler, message: str) -> None:
+    """Report the exception being handled through the handler, like a failed emit."""
+    handler.handleError(logging.makeLogRecord({"name": __name__, "msg": message}))
+
+
+def _compress_file(source: str, dest: str, handler: logging.Handler) -> None:
+    """Gzip ``source`` into ``dest`` and remove the uncompressed file."""
+    try:
+        _gzip(source, dest)
+        os.remove(source)
+    except OSError:
+        # Keep the uncompressed file rather than lose log data
+        _handle_error(handler, f"Failed to compress rotated log {source}")
+
+
+def _compress_and_shift(source: str, base: str, backup_count: int, handler: logging.Handler) -> None:
+    """Gzip ``source`` into ``base``.1.gz, shifting older backups up by one.
+
+    Runs on the compressor thread, so backups are shifted in the order
+    segments were rotated even when several rollovers outpace compression.
+    """
+    try:
+        compressed = f"{base}.pending.gz"
+        _gzip(source, compressed)
+        for i in range(backup_count - 1, 0, -1):
+            older = f"{base}.{i}.gz"
+            if os.path.exists(older):
+                os.replace(older, f"{base}.{i + 1}.gz")
+        os.replace(compressed, f"{base}.1.gz")
+        os.remove(source)
+    except OSError:
+        _handle_error(handler, f"Failed to compress rotated log {source}")
+
+
+def _gzip_namer(name: str) -> str:
+    """Name rotated log files with a .gz suffix."""
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str, handler: logging.Handler) -> None:
+    """Rename the active log synchronously and compress it in the background."""
+    if not os.path.exists(source):
+        return
+    pending = _pending_name(source)
+    os.rename(source, pending)
+    _compress_executor.submit(_compress_file, pending, dest, handler)
+
+
+class CompressingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Size-based rotation with backups gzipped in the background.
+
+    The stock handler shifts backups on the logging thread before rotating,
+    which races a compressor still writing the previous app.log.1.gz. Here
+    the active log is only renamed to a unique pending name; the shift and
+    compression happen together on the compressor thread.
+    """
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if self.backupCount > 0 and os.path.exists(self.baseFilename):
+            pending = _pending_name(self.baseFilename)
+            os.rename(self.baseFilename, pending)
+            _compress_executor.submit(_compress_and_shift, pending, self.baseFilename, self.backupCount, self)
+        if not self.delay:
+            self.stream = self._open()
+
+
+def _log_file_name(settings) -> str:
+    """LOG_FILE_NAME, with the process id added when several workers run.
+
+    Each worker process rotates its own handler, so workers sharing one
+    file would rename it under each other and lose or interleave segments.
+    """
+    if settings.WEB_CONCURRENCY <= 1:
+        return settings.LOG_FILE_NAME
+    name = Path(settings.LOG_FILE_NAME)
+    return f"{name.stem}.{os.getpid()}{name.suffix}"
+
+
+def _build_file_handler(settings) -> logging.Handler:
+    """Create the file handler selected by ``LOG_ROTATION``."""
+    log_dir = Path(settings.LOG_DIR)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_file = log_dir / _log_file_name(settings)
+
+    rotation = settings.LOG_ROTATION.lower()
+    if rotation == "size":
+        handler_class = (
+            CompressingRotatingFileHandler if settings.LOG_COMPRESS else logging.handlers.RotatingFileHandler
+        )
+        return handler_class(
+            log_file,
+            maxBytes=settings.LOG_MAX_BYTES,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+    elif rotation == "time":
+        handler = logging.handlers.TimedRotatingFileHandler(
+            log_file,
+            when=settings.LOG_ROTATION_WHEN,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding="utf-8",
+            utc=True,
+        )
+    elif rotation == "none":
+        return logging.FileHandler(log_file, encoding="utf-8")
+    else:
+        raise ValueError(f"Invalid LOG_ROTATION: {settings.LOG_ROTATION}")
+
+    # Timed backups are named by date and never shifted, so each is compressed on its own
+    if settings.LOG_COMPRESS:
+        handler.namer = _gzip_namer
+        handler.rotator = functools.partial(_gzip_rotator, handler=handler)
+    return handler
 
 
 def setup_logging():
     """Setup application logging."""
-    
+    settings = get_settings()
+
     # Create formatter
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
-    
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(settings.LOG_LEVEL.upper())
     console_handler.setFormatter(formatter)
-    
-    # File handler
-    file_handler = logging.FileHandler(log_dir / "app.log")
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    
+
     # Root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
-    
+    root_logger.setLevel(logging.DEBUG if settings.DEBUG else settings.LOG_LEVEL.upper())
+
+    # Drop handlers from a previous call so reconfiguring doesn't duplicate output
+    for handler in list(root_logger.handlers):
+        if getattr(handler, "_app_handler", False):
+            root_logger.removeHandler(handler)
+            handler.close()
+
+    handlers = [console_handler]
+    if settings.LOG_TO_FILE:
+        file_handler = _build_file_handler(settings)
+        file_handler.setLevel(logging.DEBUG if settings.DEBUG else settings.LOG_LEVEL.upper())
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    for handler in handlers:
+        handler._app_handler = True
+        root_logger.addHandler(handler)
+
     return root_logger
 
 
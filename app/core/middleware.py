@@ -1,23 +1,70 @@
 """Middleware configuration."""
 import time
 from fastapi import Request
+from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.core import metrics
+from app.db.database import start_query_tracking, set_force_primary
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+_query_stats_headers = (
+    settings.DEBUG if settings.QUERY_STATS_HEADERS is None else settings.QUERY_STATS_HEADERS
+)
+
+# Read-your-writes: clients echo the time of their last write via cookie or header
+WRITE_MARKER_COOKIE = "db_write_at"
+WRITE_MARKER_HEADER = "X-DB-Write-At"
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def _recently_wrote(request: Request) -> bool:
+    """Whether the client wrote within READ_YOUR_WRITES_SECONDS."""
+    marker = request.headers.get(WRITE_MARKER_HEADER) or request.cookies.get(WRITE_MARKER_COOKIE)
+    if not marker:
+        return False
+    try:
+        return time.time() - float(marker) < settings.READ_YOUR_WRITES_SECONDS
+    except ValueError:
+        return False
+
+
+def _route_template(request: Request) -> str:
+    """Return the matched route template, e.g. /api/v1/orders/{order_id}."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
 
 
 async def log_requests(request: Request, call_next):
     """Log all incoming requests and their processing time."""
-    start_time = time.time()
+    start_time = time.perf_counter()
+    query_stats = start_query_tracking(f"{request.method} {request.url.path}")
+    if settings.DATABASE_REPLICA_URLS:
+        set_force_primary(_recently_wrote(request))
     
     # Log request
     logger.info(f"Request: {request.method} {request.url.path}")
     
     # Process request
-    response = await call_next(request)
-    
-    # Calculate processing time
-    process_time = time.time() - start_time
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        # Calculate processing time
+        process_time = time.perf_counter() - start_time
+
+        route = _route_template(request)
+        metrics.http_requests_total.inc(
+            method=request.method, route=route, status=str(status_code)
+        )
+        metrics.http_request_duration_seconds.observe(
+            process_time, method=request.method, route=route, status=str(status_code)
+        )
+        metrics.http_request_db_queries.observe(
+            query_stats.count, method=request.method, route=route
+        )
     
     # Log response
     logger.info(
@@ -28,5 +75,23 @@ async def log_requests(request: Request, call_next):
     
     # Add custom header
     response.headers["X-Process-Time"] = str(process_time)
+    if _query_stats_headers:
+        response.headers["X-DB-Query-Count"] = str(query_stats.count)
+        response.headers["X-DB-Query-Time"] = f"{query_stats.total_time:.4f}"
+
+    # Keep this client's reads on the primary until replicas catch up
+    if (
+        settings.DATABASE_REPLICA_URLS
+        and request.method not in _SAFE_METHODS
+        and response.status_code < 400
+    ):
+        write_at = f"{time.time():.3f}"
+        response.headers[WRITE_MARKER_HEADER] = write_at
+        response.set_cookie(
+            WRITE_MARKER_COOKIE,
+            write_at,
+            max_age=max(1, int(settings.READ_YOUR_WRITES_SECONDS)),
+            httponly=True,
+        )
     
     return response
@@ -0,0 +1,251 @@
+"""On-demand statistical profiling for single requests and the whole process.
+
+A background thread samples the Python stacks of every thread at a fixed
+interval. Sync endpoints run in Starlette's threadpool rather than on the
+event loop thread, so sampling all threads (instead of cProfile, which only
+sees the thread that enabled it) is what captures their work. On a busy
+worker a per-request profile also includes concurrent requests.
+"""
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import List, Optional
+from urllib.parse import parse_qs
+
+from fastapi import HTTPException
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Top-of-stack frames that mean a thread is idle rather than doing work
+_IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+    ("_thread.py", "run"),
+}
+
+
+class StackSampler:
+    """Sample all thread stacks into collapsed-stack counts."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples = 0
+        self.started_at: Optional[float] = None
+        self.duration = 0.0
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.time() - self.started_at
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.samples += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                code = frame.f_code
+                if (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                self._stacks[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Render stacks in collapsed format for flamegraph tools."""
+        return "\n".join(f"{stack} {count}" for stack, count in self._stacks.most_common())
+
+    def top_functions(self, limit: int = 30) -> List[dict]:
+        """Summarize self and total sample counts per function."""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self._stacks.items():
+            frames = stack.split(";")
+            self_counts[frames[-1]] += count
+            for frame in set(frames):
+                total_counts[frame] += count
+        return [
+            {"function": function, "self_samples": self_counts[function], "total_samples": total}
+            for function, total in total_counts.most_common(limit)
+        ]
+
+
+class ProfileStore:
+    """Keep the most recent profiles in memory."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._profiles: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, profile_id: str, profile: dict) -> None:
+        with self._lock:
+            self._profiles[profile_id] = profile
+            self._profiles.move_to_end(profile_id)
+            while len(self._profiles) > self.max_size:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[dict]:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> List[dict]:
+        with self._lock:
+            profiles = list(self._profiles.values())
+        return [
+            {key: value for key, value in profile.items() if key not in ("collapsed", "top")}
+            for profile in reversed(profiles)
+        ]
+
+
+profile_store = ProfileStore(settings.PROFILE_STORE_SIZE)
+
+
+def new_profile_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def _sampler_interval() -> float:
+    return settings.PROFILE_SAMPLE_INTERVAL_MS / 1000
+
+
+def _build_profile(profile_id: str, label: str, sampler: StackSampler, status: str) -> dict:
+    return {
+        "id": profile_id,
+        "label": label,
+        "status": status,
+        "started_at": datetime.utcfromtimestamp(sampler.started_at).isoformat(),
+        "duration": round(sampler.duration, 4),
+        "interval_ms": settings.PROFILE_SAMPLE_INTERVAL_MS,
+        "samples": sampler.samples,
+        "top": sampler.top_functions(),
+        "collapsed": sampler.collapsed(),
+    }
+
+
+def start_process_sampling(seconds: float, label: str = "process") -> str:
+    """Sample the whole process for ``seconds`` in the background."""
+    profile_id = new_profile_id()
+    sampler = StackSampler(_sampler_interval())
+    sampler.start()
+    profile_store.put(profile_id, {
+        "id": profile_id,
+        "label": label,
+        "status": "running",
+        "started_at": datetime.utcfromtimestamp(sampler.started_at).isoformat(),
+        "duration": seconds,
+    })
+
+    def finish():
+        time.sleep(seconds)
+        sampler.stop()
+        profile_store.put(profile_id, _build_profile(profile_id, label, sampler, "completed"))
+        logger.info(f"Process profile {profile_id} completed ({sampler.samples} samples)")
+
+    threading.Thread(target=finish, name=f"profile-{profile_id}", daemon=True).start()
+    return profile_id
+
+
+def _profile_requested(scope) -> bool:
+    for name, value in scope["headers"]:
+        if name == b"x-profile":
+            return value.lower() in (b"1", b"true")
+    query_string = scope.get("query_string", b"")
+    if b"profile" not in query_string:
+        return False
+    values = parse_qs(query_string.decode("latin-1")).get("profile", [])
+    return any(value.lower() in ("1", "true") for value in values)
+
+
+def _is_superadmin(app, authorization: Optional[str]) -> bool:
+    """Run the superadmin dependency outside of FastAPI's dependency injection.
+
+    The session comes from the app's ``get_db`` dependency, honouring
+    ``app.dependency_overrides`` as a route would.
+    """
+    if not authorization:
+        return False
+    # Imported lazily: the router imports services and models
+    from app.api.superadmin_router import get_current_superadmin
+    from app.db.database import get_db
+
+    overrides = getattr(app, "dependency_overrides", {})
+    sessions = overrides.get(get_db, get_db)()
+    try:
+        get_current_superadmin(authorization=authorization, db=next(sessions))
+        return True
+    except HTTPException:
+        return False
+    finally:
+        sessions.close()
+
+
+class ProfilingMiddleware:
+    """Profile a single request when it carries ``X-Profile: 1`` or ``?profile=1``.
+
+    The profile id is returned in the ``X-Profile-Id`` response header and the
+    result can be fetched from ``GET /superadmin/profiles/{profile_id}``.
+    Only superadmins can profile; for anyone else the flag is ignored and the
+    request is served as usual.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _profile_requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        from starlette.concurrency import run_in_threadpool
+
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value.decode("latin-1")
+                break
+        if not await run_in_threadpool(_is_superadmin, scope.get("app"), authorization):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = new_profile_id()
+        label = f"{scope['method']} {scope['path']}"
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", profile_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler = StackSampler(_sampler_interval())
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            profile_store.put(profile_id, _build_profile(profile_id, label, sampler, "completed"))
+            logger.info(f"Request profile {profile_id} captured for {label}")
@@ -0,0 +1,115 @@
+"""JSON response classes and pre-serialized, pre-compressed responses."""
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson, or the stdlib when orjson is missing.
+
+    Not the app's default response class: a custom default turns off
+    FastAPI's Pydantic ``dump_json`` path for every response_model route.
+    Use it per route for large payloads without a model, and
+    typed_response for measured list endpoints.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """Cached TypeAdapter per response type (building one compiles a schema)."""
+    return TypeAdapter(tp)
+
+
+def serialize(tp: Any, data: Any) -> bytes:
+    """Validate ``data`` (ORM objects or schemas) as ``tp`` and dump it to JSON bytes."""
+    adapter = type_adapter(tp)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def typed_response(tp: Any, data: Any, status_code: int = 200) -> Response:
+    """Return ``data`` serialized once as ``tp``, bypassing response_model handling.
+
+    Call from sync endpoints to serialize in the endpoint's worker thread;
+    FastAPI would otherwise hop to the threadpool again to validate the
+    result. Keep ``response_model`` on the route for the OpenAPI schema.
+    """
+    return Response(serialize(tp, data), status_code=status_code, media_type="application/json")
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value."""
+    codings = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        codings[coding.strip().lower()] = quality
+    return codings
+
+
+def negotiate_encoding(header: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """Pick the coding of ``available`` with the client's highest q-value.
+
+    Ties go to the earlier coding in ``available`` (the server's preference);
+    None when the client accepts none of them.
+    """
+    codings = parse_accept_encoding(header)
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = codings.get(coding, codings.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches ``etag``.
+
+    The header may list several tags or be ``*``; tags are compared weakly
+    (ignoring ``W/``), as RFC 9110 requires for If-None-Match.
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def precompressed_response(
+    request: Request, body: bytes, encoded: Dict[str, bytes], etag: str
+) -> Response:
+    """Serve JSON ``body`` or one of its pre-compressed ``encoded`` variants.
+
+    ``encoded`` maps a content coding to the compressed body, in order of
+    preference. Answers 304 when the client already has ``etag``.
+    """
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    coding = negotiate_encoding(request.headers.get("accept-encoding"), encoded)
+    if coding is not None:
+        headers["Content-Encoding"] = coding
+        body = encoded[coding]
+    return Response(body, media_type="application/json", headers=headers)
@@ -1,7 +1,6 @@
 """Authentication utilities for JWT tokens and password hashing."""
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
 import bcrypt
 from app.core.config import settings
 
@@ -43,6 +42,8 @@ class JWTService:
         else:
             expire = datetime.utcnow() + timedelta(hours=1)
 
+        from jose import jwt  # Deferred: python-jose is slow to import
+
         to_encode = {"exp": expire, "sub": subject, "type": "access"}
         encoded_jwt = jwt.encode(
             to_encode,
@@ -55,6 +56,8 @@ class JWTService:
     def create_refresh_token(subject: str) -> str:
         """Create a JWT refresh token (valid for 7 days)."""
         expire = datetime.utcnow() + timedelta(days=7)
+        from jose import jwt  # Deferred: python-jose is slow to import
+
         to_encode = {"exp": expire, "sub": subject, "type": "refresh"}
         encoded_jwt = jwt.encode(
             to_encode,
@@ -66,6 +69,8 @@ class JWTService:
     @staticmethod
     def decode_token(token: str) -> Optional[dict]:
         """Decode a JWT token."""
+        from jose import JWTError, jwt  # Deferred: python-jose is slow to import
+
         try:
             payload = jwt.decode(
                 token,
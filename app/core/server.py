@@ -0,0 +1,202 @@
+"""
+Production server launcher.
+
+Runs the app with several worker processes:
+
+* gunicorn with uvicorn workers when gunicorn is installed (Linux). The app
+  is imported once in the master (PRELOAD_APP) so workers share its memory
+  copy-on-write, and SIGHUP replaces workers gracefully. With a preloaded
+  app SIGHUP keeps the loaded code; deploy new code by restarting the
+  process, or with SIGUSR2 followed by SIGQUIT to the old master.
+* ``uvicorn --workers`` otherwise. Workers import the app themselves and
+  SIGHUP restarts them one by one, picking up new code.
+
+Order events (the kitchen WebSocket/SSE stream and the long-poll wake-ups)
+are delivered in-process, so a worker only pushes changes made through it.
+Unless a shared broker is installed (see app.services.order_events) and
+ORDER_EVENTS_SHARED_BROKER is set, the launcher therefore runs one worker by
+default; WEB_CONCURRENCY forces another count, with a warning. With a shared
+broker the count defaults to the number of usable CPUs, capped so that every
+worker gets a useful share of DB_MAX_CONNECTIONS. The resolved count is
+exported as WEB_CONCURRENCY so each worker sizes its connection pool for it.
+
+Usage:
+    python -m app.core.server
+"""
+import gc
+import importlib.util
+import os
+import sys
+
+from app.core import config
+from app.core.logging import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+APP_PATH = "main:app"
+
+# Fewer pooled connections than this per worker leaves requests queuing
+# on the pool instead of using the extra process
+MIN_DB_CONNECTIONS_PER_WORKER = 4
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (respects container CPU affinity)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def resolve_workers(settings: config.Settings, cpus: int | None = None) -> int:
+    """Worker processes to run.
+
+    WEB_CONCURRENCY if set; otherwise one, or with a shared order event
+    broker, sized from CPUs and the pool.
+    """
+    if "WEB_CONCURRENCY" in settings.model_fields_set:
+        return max(1, settings.WEB_CONCURRENCY)
+    if not settings.ORDER_EVENTS_SHARED_BROKER:
+        return 1
+    cpus = cpus or available_cpus()
+    pool_limit = settings.DB_MAX_CONNECTIONS // MIN_DB_CONNECTIONS_PER_WORKER
+    return max(1, min(cpus, pool_limit))
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def event_loop() -> str:
+    """uvloop when installed, else the stdlib asyncio loop."""
+    return "uvloop" if _installed("uvloop") and sys.platform != "win32" else "asyncio"
+
+
+def http_protocol() -> str:
+    """httptools when installed, else h11."""
+    return "httptools" if _installed("httptools") else "h11"
+
+
+def resolve_backend(settings: config.Settings) -> str:
+    """Return 'gunicorn' or 'uvicorn' from SERVER_BACKEND."""
+    backend = settings.SERVER_BACKEND.lower()
+    gunicorn_available = _installed("gunicorn") and sys.platform != "win32"
+    if backend == "auto":
+        return "gunicorn" if gunicorn_available else "uvicorn"
+    if backend not in ("gunicorn", "uvicorn"):
+        raise ValueError(f"Invalid SERVER_BACKEND: {settings.SERVER_BACKEND}")
+    if backend == "gunicorn" and not gunicorn_available:
+        raise RuntimeError("SERVER_BACKEND=gunicorn but gunicorn is not installed")
+    return backend
+
+
+def gunicorn_worker_class() -> str:
+    if _installed("uvicorn_worker"):
+        return "uvicorn_worker.UvicornWorker"
+    return "uvicorn.workers.UvicornWorker"
+
+
+def gunicorn_options(settings: config.Settings, workers: int) -> dict:
+    """Gunicorn configuration for the given settings."""
+    return {
+        "bind": f"{settings.HOST}:{settings.PORT}",
+        "workers": workers,
+        "worker_class": gunicorn_worker_class(),
+        "preload_app": settings.PRELOAD_APP,
+        "timeout": settings.WORKER_TIMEOUT,
+        "graceful_timeout": settings.GRACEFUL_TIMEOUT,
+        "keepalive": settings.KEEPALIVE_TIMEOUT,
+        "max_requests": settings.MAX_REQUESTS,
+        "max_requests_jitter": settings.MAX_REQUESTS_JITTER,
+        "accesslog": None,  # Requests are logged by the app's middleware
+        "errorlog": "-",
+        "loglevel": settings.LOG_LEVEL.lower(),
+        "post_fork": _post_fork,
+    }
+
+
+def uvicorn_options(settings: config.Settings, workers: int) -> dict:
+    """uvicorn.run() keyword arguments for the given settings."""
+    return {
+        "host": settings.HOST,
+        "port": settings.PORT,
+        "workers": workers,
+        "loop": event_loop(),
+        "http": http_protocol(),
+        "timeout_keep_alive": settings.KEEPALIVE_TIMEOUT,
+        "timeout_graceful_shutdown": settings.GRACEFUL_TIMEOUT,
+        "limit_max_requests": settings.MAX_REQUESTS or None,
+        "access_log": False,  # Requests are logged by the app's middleware
+        "log_level": settings.LOG_LEVEL.lower(),
+    }
+
+
+def _post_fork(server, worker) -> None:
+    # Connections opened by the preloaded app in the master must not be shared
+    from app.db.database import dispose_engines_after_fork
+
+    dispose_engines_after_fork()
+    # Nor the master's log file: each worker writes and rotates its own
+    setup_logging()
+
+
+def _load_app():
+    module_name, attr = APP_PATH.split(":")
+    app = getattr(importlib.import_module(module_name), attr)
+    # Keep objects created at import out of later collections, so the garbage
+    # collector does not touch (and un-share) the pages the workers inherit
+    gc.freeze()
+    return app
+
+
+def run_gunicorn(settings: config.Settings, workers: int) -> None:
+    from gunicorn.app.base import BaseApplication
+
+    class Application(BaseApplication):
+        def __init__(self, options: dict):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return _load_app()
+
+    Application(gunicorn_options(settings, workers)).run()
+
+
+def run_uvicorn(settings: config.Settings, workers: int) -> None:
+    import uvicorn
+
+    uvicorn.run(APP_PATH, **uvicorn_options(settings, workers))
+
+
+def main() -> None:
+    setup_logging()
+    settings = config.get_settings()
+    workers = resolve_workers(settings)
+    backend = resolve_backend(settings)
+
+    # Workers read WEB_CONCURRENCY to size their share of the connection pool
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    settings = config.reload_settings()
+
+    if workers > 1 and not settings.ORDER_EVENTS_SHARED_BROKER:
+        logger.warning(
+            f"Running {workers} workers without a shared order event broker: /kitchen/stream, "
+            "/kitchen/ws and long-poll wake-ups only see orders changed through the same worker"
+        )
+    logger.info(
+        f"Starting {backend} with {workers} workers on {settings.HOST}:{settings.PORT} "
+        f"(loop={event_loop()}, http={http_protocol()}, "
+        f"pool={settings.db_pool_size}+{settings.db_max_overflow} per worker)"
+    )
+    if backend == "gunicorn":
+        run_gunicorn(settings, workers)
+    else:
+        run_uvicorn(settings, workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,70 @@
-from sqlalchemy import create_engine
+"""Database Module"""
+import itertools
+import threading
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.pool import InstrumentedQueuePool
 
 settings = get_settings()
+logger = get_logger(__name__)
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-)
+# Async drivers used when DATABASE_URL names a backend without one
+_ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def _engine_options(database_url: str, is_async: bool = False) -> dict:
+    """Build create_engine() keyword arguments from settings."""
+    url = make_url(database_url)
+    options = {
+        "echo": settings.DB_ECHO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if url.get_backend_name() == "sqlite":
+        # SQLite uses its own pool classes; pool sizing does not apply
+        return options
+
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    if not is_async:
+        options["poolclass"] = InstrumentedQueuePool
+    if url.get_backend_name() == "postgresql" and settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        if is_async:
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+            }
+    return options
+
+
+def to_async_url(database_url: str) -> str:
+    """Rewrite a sync DATABASE_URL to use the backend's async driver."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return url.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+engine = create_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -19,6 +75,63 @@ SessionLocal = sessionmaker(
 Base = declarative_base()
 
 
+class QueryStats:
+    """Mutable per-request query counters shared with worker threads."""
+
+    __slots__ = ("count", "total_time", "origin")
+
+    def __init__(self, origin: Optional[str] = None):
+        self.count = 0
+        self.total_time = 0.0
+        self.origin = origin
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def start_query_tracking(origin: Optional[str] = None) -> QueryStats:
+    """Begin counting queries issued from the current request context."""
+    stats = QueryStats(origin)
+    _query_stats.set(stats)
+    return stats
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.total_time += elapsed
+
+    if elapsed * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+        logger.warning(
+            f"Slow query ({elapsed * 1000:.1f}ms) "
+            f"from {stats.origin if stats is not None and stats.origin else 'background'}: "
+            f"{statement} | params={parameters!r}"
+        )
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute is skipped for failed statements; drop their start time
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def install_query_hooks(bind) -> None:
+    """Attach query counting, timing and slow-query logging to an engine."""
+    event.listen(bind, "before_cursor_execute", _before_cursor_execute)
+    event.listen(bind, "after_cursor_execute", _after_cursor_execute)
+    event.listen(bind, "handle_error", _handle_error)
+
+
+install_query_hooks(engine)
+
+
 def get_db():
     """Database dependency for FastAPI routes."""
     db = SessionLocal()
@@ -26,3 +139,168 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Read-replica routing
+
+_force_primary: ContextVar[bool] = ContextVar("force_primary", default=False)
+
+
+def set_force_primary(force_primary: bool) -> None:
+    """Route read-only sessions of the current request to the primary."""
+    _force_primary.set(force_primary)
+
+
+class Replica:
+    """A read replica engine and its last observed replication lag."""
+
+    def __init__(self, url: str):
+        self.engine = create_engine(url, **_engine_options(url))
+        install_query_hooks(self.engine)
+        self.name = make_url(url).render_as_string(hide_password=True)
+        self.lag: Optional[float] = None
+        self.healthy = True
+        self.checked_at = 0.0
+
+
+class ReplicaRouter:
+    """Pick a replica for read-only sessions, falling back to the primary.
+
+    Replicas are used round-robin while their replication lag is within
+    REPLICA_MAX_LAG_SECONDS. Lag is re-checked at most every
+    REPLICA_LAG_CHECK_INTERVAL seconds by whichever request notices it is
+    stale; other requests keep using the last known state meanwhile.
+    """
+
+    _LAG_QUERY = text(
+        "SELECT CASE WHEN pg_is_in_recovery() "
+        "THEN COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+        "ELSE 0 END"
+    )
+
+    def __init__(self, urls: List[str]):
+        self.replicas = [Replica(url) for url in urls]
+        self._next = itertools.count()
+        self._check_lock = threading.Lock()
+
+    def _check_lag(self, replica: Replica) -> None:
+        try:
+            with replica.engine.connect() as conn:
+                if replica.engine.dialect.name == "postgresql":
+                    replica.lag = float(conn.execute(self._LAG_QUERY).scalar() or 0)
+                else:
+                    conn.execute(text("SELECT 1"))
+                    replica.lag = 0.0
+            replica.healthy = replica.lag <= settings.REPLICA_MAX_LAG_SECONDS
+            if not replica.healthy:
+                logger.warning(f"Replica {replica.name} lagging by {replica.lag:.1f}s; using primary")
+        except Exception as e:
+            replica.healthy = False
+            logger.warning(f"Replica {replica.name} unavailable: {e}")
+        finally:
+            replica.checked_at = time.monotonic()
+
+    def _refresh_if_stale(self) -> None:
+        now = time.monotonic()
+        stale = [
+            r for r in self.replicas
+            if now - r.checked_at >= settings.REPLICA_LAG_CHECK_INTERVAL
+        ]
+        if stale and self._check_lock.acquire(blocking=False):
+            try:
+                for replica in stale:
+                    self._check_lag(replica)
+            finally:
+                self._check_lock.release()
+
+    def pick(self):
+        """Return an engine for a read-only session."""
+        if not self.replicas:
+            return engine
+        self._refresh_if_stale()
+        healthy = [r for r in self.replicas if r.healthy]
+        if not healthy:
+            return engine
+        return healthy[next(self._next) % len(healthy)].engine
+
+    def status(self) -> List[dict]:
+        return [
+            {"name": r.name, "healthy": r.healthy, "lag_seconds": r.lag}
+            for r in self.replicas
+        ]
+
+
+replica_router = ReplicaRouter(settings.DATABASE_REPLICA_URLS)
+
+
+def dispose_engines_after_fork() -> None:
+    """Drop pooled connections inherited from a parent process.
+
+    Called in each forked server worker; the parent's connections are left
+    open for the parent rather than closed from the child.
+    """
+    engine.dispose(close=False)
+    for replica in replica_router.replicas:
+        replica.engine.dispose(close=False)
+
+
+def get_read_db():
+    """Database dependency for read-only routes.
+
+    Uses a replica when one is configured and healthy, unless the request
+    must read its own recent writes, in which case the primary is used.
+    """
+    if _force_primary.get():
+        bind = engine
+    else:
+        bind = replica_router.pick()
+    db = SessionLocal(bind=bind)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+_async_engine = None
+_async_session_factory = None
+
+
+def get_async_engine():
+    """Return the AsyncEngine, creating it on first use.
+
+    Created lazily so the async driver (asyncpg/aiosqlite) is only required
+    when DB_ASYNC is enabled.
+    """
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        _async_engine = create_async_engine(
+            to_async_url(settings.DATABASE_URL),
+            **_engine_options(settings.DATABASE_URL, is_async=True),
+        )
+        install_query_hooks(_async_engine.sync_engine)
+        _async_session_factory = async_sessionmaker(
+            bind=_async_engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_engine
+
+
+def AsyncSessionLocal():
+    """Create a new AsyncSession bound to the async engine."""
+    get_async_engine()
+    return _async_session_factory()
+
+
+async def dispose_async_engine() -> None:
+    """Close async engine connections if the engine was created."""
+    if _async_engine is not None:
+        await _async_engine.dispose()
+
+
+async def get_async_db():
+    """Async database dependency for FastAPI routes."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,82 @@
+"""Connection pool instrumentation."""
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how often and how long checkouts wait.
+
+    A checkout waits when no idle connection is available and the overflow
+    limit has been reached, so the caller blocks until another request
+    returns a connection or ``pool_timeout`` expires.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        must_wait = self._pool.empty() and self._max_overflow > -1 and self.overflow() >= self._max_overflow
+        if not must_wait:
+            connection = super()._do_get()
+            with self._stats_lock:
+                self.checkouts += 1
+            return connection
+
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self.waits += 1
+                self.timeouts += 1
+                self.wait_time += time.perf_counter() - start
+            raise
+        with self._stats_lock:
+            self.checkouts += 1
+            self.waits += 1
+            self.wait_time += time.perf_counter() - start
+        return connection
+
+    def recreate(self):
+        # Keep counters across pool recreation (e.g. after dispose on fork)
+        pool = super().recreate()
+        pool.checkouts, pool.waits = self.checkouts, self.waits
+        pool.wait_time, pool.timeouts = self.wait_time, self.timeouts
+        return pool
+
+
+def get_pool_stats(bind) -> dict:
+    """Return a snapshot of pool usage for an engine."""
+    pool = bind.pool
+    stats = {
+        "pool_class": type(pool).__name__,
+        "status": pool.status(),
+    }
+    for key, attr in (
+        ("size", "size"),
+        ("checked_out", "checkedout"),
+        ("checked_in", "checkedin"),
+        ("overflow", "overflow"),
+    ):
+        method = getattr(pool, attr, None)
+        if method is not None:
+            stats[key] = method()
+    if isinstance(pool, QueuePool):
+        stats["max_overflow"] = pool._max_overflow
+        stats["timeout"] = pool.timeout()
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update(
+            checkouts=pool.checkouts,
+            waits=pool.waits,
+            wait_time_seconds=round(pool.wait_time, 4),
+            timeouts=pool.timeouts,
+        )
+    return stats
@@ -0,0 +1,105 @@
+"""Startup schema verification, warm-up and readiness checks."""
+from pathlib import Path
+from typing import List, Optional
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+# Filled in by the lifespan handler; read by /health/ready
+schema_status = {
+    "mode": None,
+    "ok": False,
+    "expected": None,
+    "current": None,
+    "error": "Startup not completed",
+}
+
+
+def resolve_schema_mode() -> str:
+    """Return 'create_all' or 'migrations' from DB_SCHEMA_MODE."""
+    mode = settings.DB_SCHEMA_MODE.lower()
+    if mode == "auto":
+        return "create_all" if settings.DEBUG else "migrations"
+    if mode not in ("create_all", "migrations"):
+        raise ValueError(f"Invalid DB_SCHEMA_MODE: {settings.DB_SCHEMA_MODE}")
+    return mode
+
+
+def expected_schema_revisions() -> List[str]:
+    """Alembic head revision(s) the code expects, unless pinned in settings."""
+    if settings.DB_SCHEMA_REVISION:
+        return [settings.DB_SCHEMA_REVISION]
+    from alembic.script import ScriptDirectory
+
+    return list(ScriptDirectory(str(ALEMBIC_DIR)).get_heads())
+
+
+def verify_schema_revision(bind) -> dict:
+    """Compare the database's alembic_version with the expected head in one query."""
+    expected = expected_schema_revisions()
+    schema_status.update(mode="migrations", expected=expected, current=None)
+    try:
+        with bind.connect() as conn:
+            current = [row[0] for row in conn.execute(text("SELECT version_num FROM alembic_version"))]
+    except Exception as e:
+        schema_status.update(ok=False, error=f"Could not read alembic_version: {e}")
+        logger.error(schema_status["error"])
+        return schema_status
+
+    schema_status["current"] = current
+    if sorted(current) != sorted(expected):
+        schema_status.update(
+            ok=False,
+            error=f"Database at revision {current}, expected {expected}; run 'alembic upgrade head'",
+        )
+        logger.error(schema_status["error"])
+    else:
+        schema_status.update(ok=True, error=None)
+        logger.info(f"Database schema at expected revision {current}")
+    return schema_status
+
+
+def create_schema(bind, metadata) -> dict:
+    """Create missing tables directly from the models (development only)."""
+    schema_status.update(mode="create_all", expected=None, current=None)
+    try:
+        metadata.create_all(bind=bind)
+        schema_status.update(ok=True, error=None)
+        logger.info("Database tables created successfully")
+    except Exception as e:
+        schema_status.update(ok=False, error=f"create_all failed: {e}")
+        logger.error(schema_status["error"])
+    return schema_status
+
+
+def warm_pool(bind, connections: int) -> int:
+    """Open up to ``connections`` pooled connections so first requests skip connect latency."""
+    opened = []
+    try:
+        for _ in range(connections):
+            conn = bind.connect()
+            opened.append(conn)
+            conn.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.warning(f"Connection pool warm-up stopped after {len(opened)} connections: {e}")
+    finally:
+        for conn in opened:
+            conn.close()
+    return len(opened)
+
+
+def check_database(bind) -> Optional[str]:
+    """Return None if the database answers a trivial query, else the error."""
+    try:
+        with bind.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return None
+    except Exception as e:
+        return str(e)
@@ -4,11 +4,15 @@ from app.models.menu import MenuItem, MenuOption, OptionChoice
 from app.models.order import Order, OrderItem
 from app.models.permission import Permission
 from app.models.audit import AuditLog
+from app.models.cache_version import CacheVersion
+from app.models.idempotency import IdempotencyKey
 
 __all__ = [
     "User", "UserRole", "UserStatus",
     "MenuItem", "MenuOption", "OptionChoice",
     "Order", "OrderItem",
     "Permission",
-    "AuditLog"
+    "AuditLog",
+    "CacheVersion",
+    "IdempotencyKey",
 ]
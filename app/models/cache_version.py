@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from app.db.database import Base
+
+
+class CacheVersion(Base):
+    """Version counter for data cached in worker memory (e.g. the menu catalog).
+
+    Writers bump the counter in the same transaction as their change; every
+    worker compares it against the version it has cached.
+    """
+    __tablename__ = "cache_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
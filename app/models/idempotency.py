@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime, LargeBinary
+from datetime import datetime
+from app.db.database import Base
+
+
+class IdempotencyKey(Base):
+    """Response stored for a client's Idempotency-Key, replayed on retries.
+
+    Written in the same transaction as the change it records, so a key
+    exists exactly when its change was committed.
+    """
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String(255), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)  # SHA-256 of the request
+    status_code = Column(Integer, nullable=False)
+    response_body = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
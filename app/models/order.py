@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.database import Base
@@ -7,13 +7,21 @@ from app.db.database import Base
 class Order(Base):
     """Order database model."""
     __tablename__ = "orders"
+    # Keyset for GET /orders/changes
+    __table_args__ = (Index("ix_orders_updated_at_id", "updated_at", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     total = Column(Float, nullable=False)
-    status = Column(String(50), default='pending')  # pending, completed, cancelled
+    # pending, preparing, ready, completed, cancelled; indexed for the order views' open-order reads
+    status = Column(String(50), default='pending', index=True)
     table_number = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Set when the order enters each status
+    preparing_at = Column(DateTime, nullable=True)
+    ready_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    cancelled_at = Column(DateTime, nullable=True)
 
     # Relationships
     items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
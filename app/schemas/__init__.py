@@ -16,7 +16,7 @@ from app.schemas.menu import (
     OptionChoiceCreate,
     OptionChoiceResponse,
 )
-from app.schemas.order import OrderCreate, OrderUpdate, OrderResponse, OrderItemResponse
+from app.schemas.order import OrderCreate, OrderUpdate, OrderResponse, OrderItemResponse, OrderStatusEnum
 
 __all__ = [
     # User schemas
@@ -47,4 +47,5 @@ __all__ = [
     "OrderUpdate",
     "OrderResponse",
     "OrderItemResponse",
+    "OrderStatusEnum",
 ]
@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+
+class KitchenLine(BaseModel):
+    """One order line as scheduled on its station."""
+    order_item_id: int
+    menu_item_id: int
+    name: str
+    quantity: int
+    station: str
+    prep_minutes: int
+    start_at: datetime
+    ready_at: datetime
+
+
+class KitchenOrder(BaseModel):
+    """A pending or preparing order with its estimated ready time."""
+    order_id: int
+    table_number: Optional[int]
+    status: str
+    created_at: datetime
+    eta: datetime
+    lines: List[KitchenLine]
+
+
+class KitchenStation(BaseModel):
+    """Load on one kitchen station."""
+    station: str
+    lines: int
+    busy_until: datetime  # When every cook on the station is free again
+
+
+class KitchenQueueResponse(BaseModel):
+    """The kitchen preparation queue, in the order lines will be cooked."""
+    generated_at: datetime
+    stations: List[KitchenStation]
+    orders: List[KitchenOrder]
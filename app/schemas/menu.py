@@ -93,6 +93,19 @@ class MenuItemUpdate(BaseModel):
     option_ids: Optional[List[int]] = None
 
 
+class DisplayOrder(BaseModel):
+    """Display order of one menu item, option or choice, used by the reorder endpoints."""
+    id: int
+    display_order: int
+
+
+class MenuCategory(BaseModel):
+    """A menu category with facet counts; categories are listed in the order they were first used."""
+    name: str
+    item_count: int
+    available_count: int  # Available and not out of stock
+
+
 class MenuItemResponse(BaseModel):
     """Schema for menu item response."""
     id: int
@@ -110,3 +123,60 @@ class MenuItemResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# Bulk import/export. Rows are matched to existing records by id when given,
+# otherwise by natural key: option name, choice name within its option, and
+# item (category, name). Matched records are overwritten; nothing is deleted.
+
+class OptionChoiceImport(BaseModel):
+    """Option choice in the import/export format."""
+    name: str
+    price_modifier: float = 0.0
+    is_default: bool = False
+    display_order: Optional[int] = None  # Defaults to the position in the list
+
+
+class MenuOptionImport(BaseModel):
+    """Menu option in the import/export format."""
+    id: Optional[int] = None
+    name: str
+    description: Optional[str] = None
+    option_type: str = 'single'
+    is_required: bool = False
+    min_selection: Optional[int] = None
+    max_selection: Optional[int] = None
+    display_order: int = 0
+    choices: Optional[List[OptionChoiceImport]] = None  # None leaves existing choices as they are
+
+
+class MenuItemImport(BaseModel):
+    """Menu item in the import/export format; options are referenced by name."""
+    id: Optional[int] = None
+    name: str
+    category: str
+    price: float
+    image_url: Optional[str] = None
+    description: Optional[str] = None
+    is_available: bool = True
+    stock_quantity: Optional[int] = None
+    prep_time: Optional[int] = None
+    is_recommended: bool = False
+    display_order: Optional[int] = None  # New items default to the end of their category
+    options: Optional[List[str]] = None  # None leaves existing option links as they are
+
+
+class MenuCatalogFile(BaseModel):
+    """Whole menu catalog in the import/export format."""
+    options: List[MenuOptionImport] = []
+    items: List[MenuItemImport] = []
+
+
+class MenuImportResult(BaseModel):
+    """Counts of records written by a menu import."""
+    options_created: int = 0
+    options_updated: int = 0
+    choices_created: int = 0
+    choices_updated: int = 0
+    items_created: int = 0
+    items_updated: int = 0
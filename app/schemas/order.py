@@ -1,15 +1,28 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
+from enum import Enum
+
+
+class OrderStatusEnum(str, Enum):
+    PENDING = "pending"
+    PREPARING = "preparing"
+    READY = "ready"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
 
 
 class OrderItemCreate(BaseModel):
-    """Schema for creating order item."""
+    """Schema for creating order item.
+
+    Name and price are taken from the menu; the client's values are ignored.
+    """
     menu_item_id: int
-    name: str
-    quantity: int
-    price: float
-    options_text: Optional[str] = None
+    quantity: int = Field(..., ge=1)
+    option_choice_ids: List[int] = []
+    name: Optional[str] = None
+    price: Optional[float] = None
+    options_text: Optional[str] = None  # Used when no option choices are selected
     remark: Optional[str] = None
 
 
@@ -29,15 +42,15 @@ class OrderItemResponse(BaseModel):
 
 
 class OrderCreate(BaseModel):
-    """Schema for creating order."""
-    total: float
+    """Schema for creating order. The total is computed server-side."""
+    total: Optional[float] = None
     table_number: Optional[int] = None
     items: List[OrderItemCreate]
 
 
 class OrderUpdate(BaseModel):
-    """Schema for updating order."""
-    status: Optional[str] = None
+    """Schema for updating order. Status changes must follow ORDER_TRANSITIONS."""
+    status: Optional[OrderStatusEnum] = None
     table_number: Optional[int] = None
 
 
@@ -49,7 +62,63 @@ class OrderResponse(BaseModel):
     table_number: Optional[int]
     created_at: datetime
     updated_at: datetime
+    preparing_at: Optional[datetime] = None
+    ready_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    cancelled_at: Optional[datetime] = None
     items: List[OrderItemResponse]
 
     class Config:
         from_attributes = True
+
+
+class OrderChanges(BaseModel):
+    """Orders changed after a cursor, for GET /orders/changes."""
+    orders: List[OrderResponse]
+    cursor: Optional[str]  # Pass as ``since`` on the next request
+    has_more: bool
+
+
+class OpenTable(BaseModel):
+    """Open (not completed or cancelled) orders of one table."""
+    table_number: Optional[int]  # None groups orders without a table, e.g. takeaway
+    open_orders: int
+    total: float
+    oldest_pending_at: Optional[datetime]  # Creation time of the oldest pending order
+    oldest_pending_seconds: Optional[int]
+
+
+class OpenTables(BaseModel):
+    """Floor view for GET /orders/tables."""
+    generated_at: datetime
+    tables: List[OpenTable]
+
+
+# Largest batch accepted by POST /orders/bulk
+MAX_BULK_ORDERS = 200
+
+
+class OrderBulkEntry(OrderCreate):
+    """One order in a bulk upload, with its own optional idempotency key."""
+    idempotency_key: Optional[str] = Field(None, min_length=1, max_length=255)
+
+
+class OrderBulkCreate(BaseModel):
+    """Schema for creating many orders at once (e.g. an offline POS queue)."""
+    orders: List[OrderBulkEntry] = Field(..., min_length=1, max_length=MAX_BULK_ORDERS)
+
+
+class OrderBulkResult(BaseModel):
+    """Outcome of one order in a bulk upload, in request order."""
+    index: int
+    status_code: int  # 201 when created or replayed, otherwise the error status
+    order: Optional[OrderResponse] = None
+    error: Optional[str] = None
+    replayed: bool = False
+
+
+class OrderBulkResponse(BaseModel):
+    """Schema for bulk order creation results."""
+    created: int
+    failed: int
+    results: List[OrderBulkResult]
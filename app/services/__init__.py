@@ -1,6 +1,6 @@
 """Business Logic Services Module"""
 
-from .menu_service import MenuService
-from .order_service import OrderService
+from .menu_service import MenuService, AsyncMenuService
+from .order_service import OrderService, AsyncOrderService
 
-__all__ = ["MenuService", "OrderService"]
+__all__ = ["MenuService", "AsyncMenuService", "OrderService", "AsyncOrderService"]
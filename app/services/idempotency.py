@@ -0,0 +1,171 @@
+"""Idempotency-Key support: replay the stored response when a client retries.
+
+The response to a request carrying an Idempotency-Key is stored in the
+idempotency_keys table in the same transaction as the change it reports.
+A retry with the same key gets that response back without running the
+request again; a concurrent retry loses on the primary key and replays
+the winner's response. Recently used keys are also kept in worker memory,
+so most retries are answered without a query.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Set
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.exceptions import AppException
+from app.core.logging import get_logger
+from app.models.idempotency import IdempotencyKey
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+MAX_KEY_LENGTH = 255
+
+
+def request_fingerprint(operation: str, payload: BaseModel, exclude: Optional[Set[str]] = None) -> str:
+    """Hash of the operation and its validated request body."""
+    data = operation.encode() + b"\n" + payload.model_dump_json(exclude=exclude).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+class StoredResponse:
+    """A response recorded for an idempotency key."""
+
+    __slots__ = ("fingerprint", "status_code", "body", "expires_at")
+
+    def __init__(self, fingerprint: str, status_code: int, body: bytes, expires_at: datetime):
+        self.fingerprint = fingerprint
+        self.status_code = status_code
+        self.body = body
+        self.expires_at = expires_at
+
+
+class IdempotencyStore:
+    """Idempotency keys in the database with an LRU of recent keys in memory."""
+
+    def __init__(self, ttl_seconds: int, max_entries: int, purge_interval: float):
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_entries = max_entries
+        self.purge_interval = purge_interval
+        self._entries: "OrderedDict[str, StoredResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_purge = time.monotonic()
+
+    def find(self, db: Session, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        """Stored response for ``key``, or None if the key is new or expired.
+
+        Raises 422 if the key was used for a different request.
+        """
+        if not key or len(key) > MAX_KEY_LENGTH:
+            raise AppException(f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters", 400)
+
+        now = datetime.utcnow()
+        stored = self._get_cached(key, now)
+        if stored is None:
+            row = db.get(IdempotencyKey, key)
+            if row is not None and row.expires_at <= now:
+                # Free the key for reuse in this transaction
+                db.delete(row)
+                row = None
+            if row is None:
+                return None
+            stored = StoredResponse(row.fingerprint, row.status_code, row.response_body, row.expires_at)
+            self.remember(key, stored)
+
+        if stored.fingerprint != fingerprint:
+            raise AppException("Idempotency-Key was already used for a different request", 422)
+        return stored
+
+    def find_many(self, db: Session, keys: Iterable[str]) -> Dict[str, StoredResponse]:
+        """Stored responses for any of ``keys``, with one query for keys not in memory.
+
+        Callers compare fingerprints themselves.
+        """
+        now = datetime.utcnow()
+        found: Dict[str, StoredResponse] = {}
+        missing = []
+        for key in keys:
+            stored = self._get_cached(key, now)
+            if stored is None:
+                missing.append(key)
+            else:
+                found[key] = stored
+        if missing:
+            for row in db.query(IdempotencyKey).filter(IdempotencyKey.key.in_(missing)).all():
+                if row.expires_at <= now:
+                    db.delete(row)
+                    continue
+                stored = StoredResponse(row.fingerprint, row.status_code, row.response_body, row.expires_at)
+                self.remember(row.key, stored)
+                found[row.key] = stored
+        return found
+
+    def add(self, db: Session, key: str, fingerprint: str, status_code: int, body: bytes) -> StoredResponse:
+        """Store a response under ``key`` inside the caller's transaction."""
+        stored = StoredResponse(fingerprint, status_code, body, datetime.utcnow() + self.ttl)
+        db.add(IdempotencyKey(
+            key=key,
+            fingerprint=fingerprint,
+            status_code=status_code,
+            response_body=body,
+            expires_at=stored.expires_at,
+        ))
+        self._maybe_purge(db)
+        event.listen(db, "after_commit", lambda session: self.remember(key, stored), once=True)
+        return stored
+
+    def remember(self, key: str, stored: StoredResponse) -> None:
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def purge_expired(self, db: Session) -> int:
+        """Delete expired keys inside the caller's transaction; returns the number deleted."""
+        now = datetime.utcnow()
+        deleted = db.query(IdempotencyKey).filter(IdempotencyKey.expires_at <= now).delete(
+            synchronize_session=False
+        )
+        with self._lock:
+            for key in [k for k, stored in self._entries.items() if stored.expires_at <= now]:
+                del self._entries[key]
+        if deleted:
+            logger.info(f"Purged {deleted} expired idempotency keys")
+        return deleted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get_cached(self, key: str, now: datetime) -> Optional[StoredResponse]:
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is None:
+                return None
+            if stored.expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return stored
+
+    def _maybe_purge(self, db: Session) -> None:
+        # Piggybacks on writes, at most once per interval per worker
+        if time.monotonic() - self._last_purge < self.purge_interval:
+            return
+        self._last_purge = time.monotonic()
+        self.purge_expired(db)
+
+
+idempotency_store = IdempotencyStore(
+    ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+    max_entries=settings.IDEMPOTENCY_CACHE_SIZE,
+    purge_interval=settings.IDEMPOTENCY_PURGE_INTERVAL_SECONDS,
+)
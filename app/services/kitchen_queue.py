@@ -0,0 +1,290 @@
+"""Kitchen preparation queue with estimated ready times.
+
+Pending and preparing orders are held in memory in arrival order and kept
+current by the order events delivered to this worker, so reading the queue
+queries no orders between its periodic resyncs from the database (see
+order_views).
+
+Each line is cooked on the station named after its menu item's category,
+and a station cooks KITCHEN_COOKS_PER_STATION lines at a time. Estimates
+come from list scheduling: lines of preparing orders first, then pending
+lines in arrival order, each go to the station cook that frees up first (a
+min-heap of free times per station) and take the item's prep_time; a line
+is cooked as one batch whatever its quantity. The schedule is reused until
+the queue or the menu changes, or it is SCHEDULE_MAX_AGE old.
+"""
+import bisect
+import heapq
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.models.order import Order
+from app.schemas.kitchen import KitchenLine, KitchenOrder, KitchenQueueResponse, KitchenStation
+from app.schemas.menu import MenuItemResponse
+from app.schemas.order import OrderStatusEnum
+from app.services import order_events
+from app.services.order_views import OrderView
+
+settings = get_settings()
+
+PENDING = OrderStatusEnum.PENDING.value
+PREPARING = OrderStatusEnum.PREPARING.value
+ACTIVE_STATUSES = (PENDING, PREPARING)
+# Station for lines whose menu item is no longer on the menu
+UNKNOWN_STATION = "Other"
+# Estimates are relative to when they were computed, so an unchanged queue is
+# still rescheduled this often
+SCHEDULE_MAX_AGE = timedelta(seconds=5)
+
+
+def _parse_datetime(value) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _station_schedule(schedule: KitchenQueueResponse, station: str) -> KitchenQueueResponse:
+    """The lines of one station from a full schedule."""
+    orders = []
+    for order in schedule.orders:
+        lines = [line for line in order.lines if line.station == station]
+        if lines:
+            orders.append(order.model_copy(update={"lines": lines}))
+    return KitchenQueueResponse(
+        generated_at=schedule.generated_at,
+        stations=[s for s in schedule.stations if s.station == station],
+        orders=orders,
+    )
+
+
+class QueuedLine:
+    __slots__ = ("order_item_id", "menu_item_id", "name", "quantity")
+
+    def __init__(self, order_item_id: int, menu_item_id: int, name: str, quantity: int):
+        self.order_item_id = order_item_id
+        self.menu_item_id = menu_item_id
+        self.name = name
+        self.quantity = quantity
+
+
+class QueuedOrder:
+    """What the scheduler needs from a pending or preparing order."""
+
+    __slots__ = ("order_id", "table_number", "status", "created_at", "preparing_at", "lines")
+
+    def __init__(
+        self,
+        order_id: int,
+        table_number: Optional[int],
+        status: str,
+        created_at: datetime,
+        preparing_at: Optional[datetime],
+        lines: List[QueuedLine],
+    ):
+        self.order_id = order_id
+        self.table_number = table_number
+        self.status = status
+        self.created_at = created_at
+        self.preparing_at = preparing_at
+        self.lines = lines
+
+    @property
+    def key(self) -> Tuple[datetime, int]:
+        return (self.created_at, self.order_id)
+
+    @classmethod
+    def from_response(cls, order: Mapping[str, Any]) -> "QueuedOrder":
+        """Build from an order as serialized in an event."""
+        return cls(
+            order["id"],
+            order.get("table_number"),
+            order["status"],
+            _parse_datetime(order["created_at"]),
+            _parse_datetime(order.get("preparing_at")),
+            [
+                QueuedLine(item["id"], item["menu_item_id"], item["name"], item["quantity"])
+                for item in order.get("items", ())
+            ],
+        )
+
+    @classmethod
+    def from_model(cls, order: Order) -> "QueuedOrder":
+        return cls(
+            order.id,
+            order.table_number,
+            order.status,
+            order.created_at,
+            order.preparing_at,
+            [QueuedLine(item.id, item.menu_item_id, item.name, item.quantity) for item in order.items],
+        )
+
+
+class KitchenQueue(OrderView):
+    """Active orders, updated incrementally from order events."""
+
+    def __init__(
+        self, cooks_per_station: int, default_prep_minutes: int, resync_interval: Optional[float] = None
+    ):
+        self.cooks_per_station = max(1, cooks_per_station)
+        self.default_prep_minutes = default_prep_minutes
+        self._orders: Dict[int, QueuedOrder] = {}
+        self._keys: List[Tuple[datetime, int]] = []  # Sorted arrival order
+        self._changes = 0  # Bumped on every change to the queued orders
+        # (changes, menu items, full schedule) of the last schedule computed
+        self._schedule: Optional[Tuple[int, Mapping[int, MenuItemResponse], KitchenQueueResponse]] = None
+        super().__init__(resync_interval)
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def _reset(self) -> None:
+        self._orders = {}
+        self._keys = []
+        self._changes += 1
+
+    def _put(self, order: QueuedOrder) -> None:
+        self._discard(order.order_id)
+        self._orders[order.order_id] = order
+        bisect.insort(self._keys, order.key)
+        self._changes += 1
+
+    def _discard(self, order_id: int) -> None:
+        old = self._orders.pop(order_id, None)
+        if old is not None:
+            self._changes += 1
+            index = bisect.bisect_left(self._keys, old.key)
+            del self._keys[index]
+
+    def _apply(self, event: order_events.OrderEvent) -> None:
+        active = (
+            event.type != order_events.ORDER_DELETED
+            and event.status in ACTIVE_STATUSES
+            and event.order is not None
+        )
+        if active:
+            self._put(QueuedOrder.from_response(event.order))
+        else:
+            self._discard(event.order_id)
+
+    def _query(self, db: Session) -> Sequence[Order]:
+        return (
+            db.query(Order)
+            .options(selectinload(Order.items))
+            .filter(Order.status.in_(ACTIVE_STATUSES))
+            .all()
+        )
+
+    def _rebuild(self, orders: Sequence[Order]) -> None:
+        self._orders = {order.id: QueuedOrder.from_model(order) for order in orders}
+        self._keys = sorted(order.key for order in self._orders.values())
+        self._changes += 1
+
+    def schedule(
+        self,
+        menu_items: Mapping[int, MenuItemResponse],
+        now: Optional[datetime] = None,
+        station: Optional[str] = None,
+    ) -> KitchenQueueResponse:
+        """Estimate start and ready times for every queued line.
+
+        ``station`` limits the lines returned, not the scheduling: every
+        station's load is always computed.
+        """
+        now = now or datetime.utcnow()
+        with self._lock:
+            cached, changes = self._schedule, self._changes
+            if (
+                cached is not None
+                and cached[0] == changes
+                and cached[1] is menu_items
+                and timedelta(0) <= now - cached[2].generated_at < SCHEDULE_MAX_AGE
+            ):
+                full = cached[2]
+            else:
+                full = None
+                orders = [self._orders[order_id] for _, order_id in self._keys]
+        if full is None:
+            full = self._compute(orders, menu_items, now)
+            with self._lock:
+                if self._changes == changes:
+                    self._schedule = (changes, menu_items, full)
+        return full if station is None else _station_schedule(full, station)
+
+    def _compute(
+        self, orders: List[QueuedOrder], menu_items: Mapping[int, MenuItemResponse], now: datetime
+    ) -> KitchenQueueResponse:
+        # Orders being prepared hold their cooks first; the sort is stable
+        orders.sort(key=lambda order: order.status != PREPARING)
+
+        cooks: Dict[str, List[datetime]] = {}
+        line_counts: Dict[str, int] = {}
+        scheduled = []
+        for order in orders:
+            lines = []
+            for line in order.lines:
+                item = menu_items.get(line.menu_item_id)
+                station_name = item.category if item is not None else UNKNOWN_STATION
+                prep_minutes = self.default_prep_minutes
+                if item is not None and item.prep_time is not None:
+                    prep_minutes = item.prep_time
+
+                free_at = cooks.setdefault(station_name, [now] * self.cooks_per_station)
+                start = heapq.heappop(free_at)
+                if order.status == PREPARING and order.preparing_at is not None and start <= now:
+                    start = order.preparing_at
+                # An overdue line is expected any moment now
+                ready = max(start + timedelta(minutes=prep_minutes), now)
+                heapq.heappush(free_at, ready)
+                line_counts[station_name] = line_counts.get(station_name, 0) + 1
+
+                lines.append(KitchenLine(
+                    order_item_id=line.order_item_id,
+                    menu_item_id=line.menu_item_id,
+                    name=line.name,
+                    quantity=line.quantity,
+                    station=station_name,
+                    prep_minutes=prep_minutes,
+                    start_at=start,
+                    ready_at=ready,
+                ))
+            scheduled.append(KitchenOrder(
+                order_id=order.order_id,
+                table_number=order.table_number,
+                status=order.status,
+                created_at=order.created_at,
+                eta=max((line.ready_at for line in lines), default=now),
+                lines=lines,
+            ))
+
+        stations = [
+            KitchenStation(station=name, lines=line_counts[name], busy_until=max(free_at))
+            for name, free_at in sorted(cooks.items())
+        ]
+        return KitchenQueueResponse(generated_at=now, stations=stations, orders=scheduled)
+
+    def order_eta(
+        self, order_id: int, menu_items: Mapping[int, MenuItemResponse], now: Optional[datetime] = None
+    ) -> Optional[KitchenOrder]:
+        """The schedule of one order, or None if it is not in the queue."""
+        if order_id not in self._orders:
+            return None
+        for order in self.schedule(menu_items, now).orders:
+            if order.order_id == order_id:
+                return order
+        return None
+
+
+kitchen_queue = KitchenQueue(
+    settings.KITCHEN_COOKS_PER_STATION, settings.KITCHEN_DEFAULT_PREP_MINUTES, settings.order_views_resync_interval
+)
+order_events.add_listener(kitchen_queue.apply)
+
+metrics.registry.gauge(
+    "kitchen_queue_orders",
+    "Pending and preparing orders in this worker's kitchen queue.",
+    callback=lambda: len(kitchen_queue),
+)
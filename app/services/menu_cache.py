@@ -0,0 +1,273 @@
+"""Per-process cache of the menu catalog, invalidated by a shared version counter."""
+import gzip
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.responses import serialize
+from app.models.cache_version import CacheVersion
+from app.models.menu import MenuItem, MenuOption
+from app.schemas.menu import MenuItemResponse
+from app.services.menu_categories import CategoryIndex, category_key
+from app.services.menu_search import MenuSearchIndex
+from app.services.pricing import PricingIndex
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+MENU_VERSION_KEY = "menu"
+
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 256
+# Distinct listings (category/skip/limit) kept per menu version
+MAX_PAYLOADS = 64
+# Payloads are compressed on the request that misses the cache, after every
+# menu edit or stock change, so moderate levels: most of the size win of the
+# highest levels at a fraction of the CPU
+PAYLOAD_BROTLI_QUALITY = 5
+PAYLOAD_GZIP_LEVEL = 6
+
+
+def get_menu_version(db: Session) -> int:
+    """Read the current menu version (a primary-key lookup)."""
+    version = db.query(CacheVersion.version).filter(CacheVersion.name == MENU_VERSION_KEY).scalar()
+    return version or 0
+
+
+def bump_menu_version(db: Session) -> None:
+    """Increment the menu version inside the caller's transaction.
+
+    Call before committing any change to menu items, options or choices so
+    every worker reloads its catalog once the change is visible. Stock
+    changed by orders uses mark_stock_changed instead.
+    """
+    result = db.execute(
+        update(CacheVersion)
+        .where(CacheVersion.name == MENU_VERSION_KEY)
+        .values(version=CacheVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        db.add(CacheVersion(name=MENU_VERSION_KEY, version=1))
+    # A concurrent read may cache the old catalog before this commits
+    event.listen(db, "after_commit", lambda session: menu_cache.invalidate(), once=True)
+
+
+def mark_stock_changed(db: Session) -> None:
+    """Have this worker re-read stock once the caller's transaction commits.
+
+    Orders change stock_quantity without bumping the menu version, so they
+    neither contend on the version row nor make every worker reload the
+    catalog; other workers pick the new stock up within
+    MENU_STOCK_CHECK_INTERVAL seconds.
+    """
+    event.listen(db, "after_commit", lambda session: menu_cache.invalidate_stock(), once=True)
+
+
+class MenuPayload:
+    """A catalog listing serialized to JSON once, with pre-compressed variants."""
+
+    __slots__ = ("body", "encoded", "etag")
+
+    def __init__(self, items: List[MenuItemResponse], version: int):
+        self.body = serialize(List[MenuItemResponse], items)
+        # Weak: the same ETag is served for every content coding
+        self.etag = f'W/"menu-{version}-{zlib.crc32(self.body):08x}"'
+        self.encoded: Dict[str, bytes] = {}
+        if len(self.body) >= MIN_COMPRESS_SIZE:
+            if brotli is not None:
+                self.encoded["br"] = brotli.compress(self.body, quality=PAYLOAD_BROTLI_QUALITY)
+            self.encoded["gzip"] = gzip.compress(self.body, compresslevel=PAYLOAD_GZIP_LEVEL, mtime=0)
+
+
+class MenuCatalogCache:
+    """The full menu catalog as response schemas, reloaded when the version changes.
+
+    The version is re-read at most every MENU_CACHE_CHECK_INTERVAL seconds, so
+    changes made through another worker show up within that interval; changes
+    made through this worker invalidate the cache immediately.
+
+    Stock levels change with every order and are not versioned: they are
+    re-read on their own (one query over stock-tracked items) at most every
+    ``stock_check_interval`` seconds and patched into the cached items and
+    the search results. That rebuilds the listings and category counts, but
+    not the pricing index or the search postings.
+
+    Database reads happen outside ``_lock``, which only guards swapping in
+    what they returned: under AsyncSession.run_sync a read yields to the
+    event loop, and another request on the same loop reaching the cache
+    would otherwise block the loop thread on a lock held by a coroutine that
+    can then never resume.
+    """
+
+    def __init__(self, check_interval: float, stock_check_interval: Optional[float] = None):
+        self.check_interval = check_interval
+        self.stock_check_interval = check_interval if stock_check_interval is None else stock_check_interval
+        self.version: Optional[int] = None
+        self.items: List[MenuItemResponse] = []
+        self._stock: Dict[int, int] = {}
+        self._payloads: Dict[Tuple, MenuPayload] = {}
+        self._pricing: Optional[PricingIndex] = None
+        self._categories: Optional[CategoryIndex] = None
+        # Kept across versions and synced incrementally
+        self._search = MenuSearchIndex()
+        self._search_version: Optional[int] = None
+        self._checked_at = 0.0
+        self._stock_checked_at = 0.0
+        # When the read behind the current stock levels started; older reads are discarded
+        self._stock_read_at = 0.0
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Force a version check on the next read."""
+        self._checked_at = 0.0
+
+    def invalidate_stock(self) -> None:
+        """Force a stock re-read on the next read."""
+        self._stock_checked_at = 0.0
+
+    def clear(self) -> None:
+        """Drop the cached catalog so the next read reloads it."""
+        with self._lock:
+            self.version = None
+            self.items = []
+            self._payloads = {}
+            self._pricing = None
+            self._categories = None
+            self._search.clear()
+            self._search_version = None
+            self._stock = {}
+            self._checked_at = 0.0
+            self._stock_checked_at = 0.0
+            self._stock_read_at = 0.0
+
+    def _load(self, db: Session, version: int) -> None:
+        started = time.monotonic()
+        rows = (
+            db.query(MenuItem)
+            .options(selectinload(MenuItem.options).selectinload(MenuOption.choices))
+            .order_by(MenuItem.display_order, MenuItem.id)
+            .all()
+        )
+        items = [MenuItemResponse.model_validate(item) for item in rows]
+        with self._lock:
+            # A concurrent load of a newer version finished first
+            if self.version is not None and self.version > version:
+                return
+            self.items = items
+            self._stock = {item.id: item.stock_quantity for item in items if item.stock_quantity is not None}
+            self._stock_checked_at = self._stock_read_at = started
+            self._payloads = {}
+            self._pricing = None
+            self._categories = None
+            self.version = version
+        logger.info(f"Menu catalog loaded: version={version}, items={len(items)}")
+
+    def _refresh_stock(self, db: Session) -> None:
+        started = time.monotonic()
+        rows = db.query(MenuItem.id, MenuItem.stock_quantity).filter(MenuItem.stock_quantity.isnot(None)).all()
+        stock = {item_id: quantity for item_id, quantity in rows}
+        with self._lock:
+            if started < self._stock_read_at:
+                return
+            self._stock_checked_at = self._stock_read_at = started
+            changed = {
+                item_id: quantity for item_id, quantity in stock.items() if self._stock.get(item_id) != quantity
+            }
+            self._stock = stock
+            if not changed:
+                return
+            items, patched = [], []
+            for item in self.items:
+                if item.id in changed:
+                    item = item.model_copy(update={"stock_quantity": changed[item.id]})
+                    patched.append(item)
+                items.append(item)
+            self.items = items
+            # Only the changed items; a full sync would compare every item's text
+            self._search.update_items(patched)
+            self._payloads = {}
+            self._categories = None
+
+    def get_items(self, db: Session) -> List[MenuItemResponse]:
+        """Return the cached catalog, reloading it if the menu version changed."""
+        now = time.monotonic()
+        if self.version is None or now - self._checked_at >= self.check_interval:
+            version = get_menu_version(db)
+            if version != self.version:
+                self._load(db, version)
+            self._checked_at = time.monotonic()
+        if time.monotonic() - self._stock_checked_at >= self.stock_check_interval:
+            self._refresh_stock(db)
+        return self.items
+
+    def get_payload(
+        self, db: Session, category: Optional[str] = None, skip: int = 0, limit: int = 100
+    ) -> MenuPayload:
+        """Return a listing's serialized and compressed bytes, built once per menu version."""
+        categories = self.get_category_index(db)
+        with self._lock:
+            version, payloads = self.version, self._payloads
+
+        # Spellings of the same category share one payload
+        key = (category_key(category) if category else None, skip, limit)
+        payload = payloads.get(key)
+        if payload is None:
+            payload = MenuPayload(categories.items_for(category)[skip:skip + limit], version)
+            if len(payloads) < MAX_PAYLOADS:
+                payloads[key] = payload
+        return payload
+
+    def get_pricing_index(self, db: Session) -> PricingIndex:
+        """Return the price/option index for the current menu version."""
+        self.get_items(db)
+        with self._lock:
+            if self._pricing is None:
+                self._pricing = PricingIndex(self.items)
+            return self._pricing
+
+    def get_category_index(self, db: Session) -> CategoryIndex:
+        """Return the category index for the current menu version."""
+        self.get_items(db)
+        with self._lock:
+            if self._categories is None:
+                self._categories = CategoryIndex(self.items)
+            return self._categories
+
+    def select_items(
+        self, db: Session, category: Optional[str], skip: int, limit: int
+    ) -> List[MenuItemResponse]:
+        """Filter the catalog by category and page it."""
+        return self.get_category_index(db).items_for(category)[skip:skip + limit]
+
+    def get_search_index(self, db: Session) -> MenuSearchIndex:
+        """Return the search index, re-indexing items changed since the last version."""
+        self.get_items(db)
+        with self._lock:
+            # Stock changes are patched in by _refresh_stock, so only menu edits resync
+            if self._search_version != self.version:
+                changed = self._search.sync(self.items)
+                self._search_version = self.version
+                logger.info(f"Menu search index synced: version={self.version}, reindexed={changed}")
+            return self._search
+
+    def warm(self, db: Session) -> None:
+        """Load the catalog, the default listing and the indexes ahead of the first request."""
+        self.invalidate()
+        self.get_payload(db)
+        self.get_pricing_index(db)
+        self.get_category_index(db)
+        self.get_search_index(db)
+
+
+menu_cache = MenuCatalogCache(settings.MENU_CACHE_CHECK_INTERVAL, settings.MENU_STOCK_CHECK_INTERVAL)
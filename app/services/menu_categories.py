@@ -0,0 +1,55 @@
+"""Category index of the menu catalog: names, facet counts and items per category.
+
+The menu catalog cache builds one per catalog version, and every item
+create, update or delete bumps the version, so listing categories with
+their counts, or the items of one category, needs no DISTINCT query and no
+scan of the catalog. Category names are matched ignoring case and extra
+whitespace.
+"""
+import unicodedata
+from typing import Dict, List, Optional, Sequence
+
+from app.core.responses import serialize
+from app.schemas.menu import MenuCategory, MenuItemResponse
+
+
+def category_key(name: str) -> str:
+    """Normalized form under which category names are matched."""
+    return " ".join(unicodedata.normalize("NFKC", name).casefold().split())
+
+
+def is_orderable(item: MenuItemResponse) -> bool:
+    return item.is_available and item.stock_quantity != 0
+
+
+class CategoryIndex:
+    """Categories of one catalog version, with pre-serialized listings."""
+
+    def __init__(self, items: Sequence[MenuItemResponse]):
+        self.items = list(items)
+        self._items: Dict[str, List[MenuItemResponse]] = {}
+        for item in self.items:
+            self._items.setdefault(category_key(item.category), []).append(item)
+
+        # Oldest item first: its spelling names the category, and its age orders the categories
+        oldest = {key: min(items, key=lambda item: item.id) for key, items in self._items.items()}
+        self.categories: List[MenuCategory] = [
+            MenuCategory(
+                name=oldest[key].category,
+                item_count=len(self._items[key]),
+                available_count=sum(1 for item in self._items[key] if is_orderable(item)),
+            )
+            for key in sorted(oldest, key=lambda key: oldest[key].id)
+        ]
+        self._by_key = {category_key(category.name): category for category in self.categories}
+        self.names_body = serialize(List[str], [category.name for category in self.categories])
+        self.categories_body = serialize(List[MenuCategory], self.categories)
+
+    def get(self, category: str) -> Optional[MenuCategory]:
+        return self._by_key.get(category_key(category))
+
+    def items_for(self, category: Optional[str]) -> List[MenuItemResponse]:
+        """Items of ``category`` in display order; every item when it is empty."""
+        if not category:
+            return self.items
+        return self._items.get(category_key(category), [])
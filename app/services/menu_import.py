@@ -0,0 +1,276 @@
+"""Bulk menu import and export (JSON catalog, or CSV for menu items).
+
+Imports are set-based: existing records are read with one query per table,
+then written with one executemany UPDATE and one multi-row INSERT per table,
+all in a single transaction with a single menu version bump.
+"""
+import csv
+import io
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import delete, func, insert, update
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.exceptions import AppException
+from app.models.menu import MenuItem, MenuOption, OptionChoice, menu_item_options
+from app.schemas.menu import (
+    MenuCatalogFile,
+    MenuImportResult,
+    MenuItemImport,
+    MenuOptionImport,
+    OptionChoiceImport,
+)
+from app.services.menu_cache import bump_menu_version
+
+ITEM_FIELDS = (
+    "name", "category", "price", "image_url", "description", "is_available",
+    "stock_quantity", "prep_time", "is_recommended", "display_order",
+)
+OPTION_FIELDS = (
+    "name", "description", "option_type", "is_required", "min_selection", "max_selection", "display_order",
+)
+CHOICE_FIELDS = ("name", "price_modifier", "is_default", "display_order")
+
+CSV_COLUMNS = ("id",) + ITEM_FIELDS + ("options",)
+# Separates option names in the CSV options column
+OPTIONS_SEPARATOR = "|"
+# Ids per DELETE when replacing option links; keeps within bound-parameter limits
+LINK_DELETE_BATCH = 1000
+
+_item_adapter = TypeAdapter(MenuItemImport)
+
+
+def parse_catalog_json(body: bytes) -> MenuCatalogFile:
+    try:
+        return MenuCatalogFile.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+
+
+def parse_items_csv(text: str) -> List[MenuItemImport]:
+    """Parse menu items from CSV with a header row using CSV_COLUMNS names.
+
+    Empty cells take the field's default. The options column lists option
+    names separated by ``|``; leaving the column out keeps existing links.
+    """
+    reader = csv.DictReader(io.StringIO(text))
+    missing = {"name", "category", "price"} - set(reader.fieldnames or ())
+    if missing:
+        raise AppException(f"CSV is missing columns: {', '.join(sorted(missing))}", 400)
+
+    items = []
+    errors = []
+    for line, row in enumerate(reader, start=2):
+        data = {key: value for key, value in row.items() if key in CSV_COLUMNS and value != ""}
+        if "options" in row:
+            data["options"] = [name.strip() for name in (row["options"] or "").split(OPTIONS_SEPARATOR) if name.strip()]
+        try:
+            items.append(_item_adapter.validate_python(data))
+        except ValidationError as e:
+            for error in e.errors(include_url=False):
+                errors.append({**error, "loc": ("body", f"line {line}", *error["loc"])})
+    if errors:
+        raise RequestValidationError(errors)
+    return items
+
+
+def items_to_csv(items: Sequence[MenuItemImport]) -> str:
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(CSV_COLUMNS)
+    for item in items:
+        row = [item.id] + [getattr(item, field) for field in ITEM_FIELDS]
+        row.append(OPTIONS_SEPARATOR.join(item.options or []))
+        writer.writerow(["" if value is None else str(value).lower() if isinstance(value, bool) else value for value in row])
+    return output.getvalue()
+
+
+def _check_unique(keys: List, label: str) -> None:
+    seen = set()
+    duplicates = {key for key in keys if key in seen or seen.add(key)}
+    if duplicates:
+        raise AppException(f"Duplicate {label} in import: {sorted(map(str, duplicates))[:10]}", 400)
+
+
+def _resolve(
+    record_id: Optional[int], key, existing: Dict, existing_ids: set, label: str
+) -> Optional[int]:
+    """Id of the existing record a row updates, or None for a new record."""
+    if record_id is not None:
+        if record_id not in existing_ids:
+            raise AppException(f"{label} {record_id} not found", 400)
+        return record_id
+    return existing.get(key)
+
+
+class MenuImportService:
+    """Service for bulk menu import and export."""
+
+    @staticmethod
+    def export_catalog(db: Session) -> MenuCatalogFile:
+        """Export every option (with choices) and item in the import format."""
+        options = db.query(MenuOption).options(selectinload(MenuOption.choices)).order_by(
+            MenuOption.display_order, MenuOption.id
+        ).all()
+        items = db.query(MenuItem).options(selectinload(MenuItem.options)).order_by(
+            MenuItem.category, MenuItem.display_order, MenuItem.id
+        ).all()
+        return MenuCatalogFile(
+            options=[
+                MenuOptionImport(
+                    id=option.id,
+                    **{field: getattr(option, field) for field in OPTION_FIELDS},
+                    choices=[
+                        OptionChoiceImport(**{field: getattr(choice, field) for field in CHOICE_FIELDS})
+                        for choice in sorted(option.choices, key=lambda c: (c.display_order, c.id))
+                    ],
+                )
+                for option in options
+            ],
+            items=[
+                MenuItemImport(
+                    id=item.id,
+                    **{field: getattr(item, field) for field in ITEM_FIELDS},
+                    options=[option.name for option in sorted(item.options, key=lambda o: (o.display_order, o.id))],
+                )
+                for item in items
+            ],
+        )
+
+    @staticmethod
+    def import_catalog(db: Session, catalog: MenuCatalogFile) -> MenuImportResult:
+        """Upsert options, choices and items in one transaction."""
+        result = MenuImportResult()
+        option_ids = MenuImportService._upsert_options(db, catalog.options, result)
+        MenuImportService._upsert_items(db, catalog.items, option_ids, result)
+        bump_menu_version(db)
+        db.commit()
+        return result
+
+    @staticmethod
+    def _upsert_options(
+        db: Session, options: List[MenuOptionImport], result: MenuImportResult
+    ) -> Dict[str, int]:
+        """Write options and their choices; return option ids by name for every option."""
+        _check_unique([option.name for option in options], "option names")
+        ids_by_name: Dict[str, int] = {}
+        existing_ids = set()
+        for option_id, name in db.query(MenuOption.id, MenuOption.name).order_by(MenuOption.id.desc()):
+            ids_by_name[name] = option_id  # The oldest option wins a duplicate name
+            existing_ids.add(option_id)
+
+        updates, inserts = [], []
+        for option in options:
+            row = option.model_dump(include=set(OPTION_FIELDS))
+            option_id = _resolve(option.id, option.name, ids_by_name, existing_ids, "Menu option")
+            if option_id is None:
+                inserts.append(row)
+            else:
+                updates.append({"id": option_id, **row})
+                ids_by_name[option.name] = option_id
+        if updates:
+            db.execute(update(MenuOption), updates)
+        if inserts:
+            for option_id, name in db.execute(insert(MenuOption).returning(MenuOption.id, MenuOption.name), inserts):
+                ids_by_name[name] = option_id
+        result.options_updated += len(updates)
+        result.options_created += len(inserts)
+
+        with_choices = {ids_by_name[option.name]: option.choices for option in options if option.choices is not None}
+        if with_choices:
+            MenuImportService._upsert_choices(db, with_choices, result)
+        return ids_by_name
+
+    @staticmethod
+    def _upsert_choices(
+        db: Session, choices_by_option: Dict[int, List[OptionChoiceImport]], result: MenuImportResult
+    ) -> None:
+        existing: Dict[Tuple[int, str], int] = {
+            (option_id, name): choice_id
+            for choice_id, option_id, name in db.query(
+                OptionChoice.id, OptionChoice.menu_option_id, OptionChoice.name
+            ).filter(OptionChoice.menu_option_id.in_(choices_by_option))
+        }
+        updates, inserts = [], []
+        for option_id, choices in choices_by_option.items():
+            _check_unique([choice.name for choice in choices], "choice names")
+            for position, choice in enumerate(choices):
+                row = choice.model_dump(include=set(CHOICE_FIELDS))
+                if row["display_order"] is None:
+                    row["display_order"] = position
+                choice_id = existing.get((option_id, choice.name))
+                if choice_id is None:
+                    inserts.append({"menu_option_id": option_id, **row})
+                else:
+                    updates.append({"id": choice_id, **row})
+        if updates:
+            db.execute(update(OptionChoice), updates)
+        if inserts:
+            db.execute(insert(OptionChoice), inserts)
+        result.choices_updated += len(updates)
+        result.choices_created += len(inserts)
+
+    @staticmethod
+    def _upsert_items(
+        db: Session, items: List[MenuItemImport], option_ids: Dict[str, int], result: MenuImportResult
+    ) -> None:
+        _check_unique([(item.category, item.name) for item in items], "items (category, name)")
+        unknown = {name for item in items for name in item.options or () if name not in option_ids}
+        if unknown:
+            raise AppException(f"Unknown menu options: {', '.join(sorted(unknown))}", 400)
+
+        existing: Dict[Tuple[str, str], int] = {}
+        display_orders: Dict[int, int] = {}
+        for item_id, category, name, display_order in db.query(
+            MenuItem.id, MenuItem.category, MenuItem.name, MenuItem.display_order
+        ).order_by(MenuItem.id.desc()):
+            existing[(category, name)] = item_id
+            display_orders[item_id] = display_order
+        # New items without a display order go after the last item in their category
+        next_order = dict(
+            db.query(MenuItem.category, func.max(MenuItem.display_order)).group_by(MenuItem.category)
+        )
+
+        existing_ids = set(display_orders)
+
+        updates, inserts = [], []
+        item_ids: Dict[Tuple[str, str], int] = {}
+        for item in items:
+            key = (item.category, item.name)
+            row = item.model_dump(include=set(ITEM_FIELDS))
+            item_id = _resolve(item.id, key, existing, existing_ids, "Menu item")
+            if item_id is None:
+                if row["display_order"] is None:
+                    next_order[item.category] = (next_order.get(item.category) or 0) + 1
+                    row["display_order"] = next_order[item.category]
+                inserts.append(row)
+            else:
+                if row["display_order"] is None:
+                    row["display_order"] = display_orders[item_id]
+                updates.append({"id": item_id, **row})
+                item_ids[key] = item_id
+        if updates:
+            db.execute(update(MenuItem), updates)
+        if inserts:
+            returning = insert(MenuItem).returning(MenuItem.id, MenuItem.category, MenuItem.name)
+            for item_id, category, name in db.execute(returning, inserts):
+                item_ids[(category, name)] = item_id
+        result.items_updated += len(updates)
+        result.items_created += len(inserts)
+
+        # Replace option links of items that list their options
+        linked = [item for item in items if item.options is not None]
+        if linked:
+            linked_ids = [item_ids[(item.category, item.name)] for item in linked]
+            for start in range(0, len(linked_ids), LINK_DELETE_BATCH):
+                batch = linked_ids[start:start + LINK_DELETE_BATCH]
+                db.execute(delete(menu_item_options).where(menu_item_options.c.menu_item_id.in_(batch)))
+            links = [
+                {"menu_item_id": item_id, "menu_option_id": option_ids[name]}
+                for item_id, item in zip(linked_ids, linked)
+                for name in dict.fromkeys(item.options)
+            ]
+            if links:
+                db.execute(insert(menu_item_options), links)
@@ -0,0 +1,202 @@
+"""In-memory full-text and fuzzy search over the menu catalog.
+
+Menu names mix Thai, which is written without spaces between words, and
+English, so text is indexed as character n-grams rather than words: Thai
+runs as bigrams, and other words as trigrams padded with a space at each
+end (so prefixes and suffixes get their own grams). A query matches items
+sharing enough of its grams, weighted by rarity and by field (name, then
+category, then description), so partial words and small typos still match.
+
+The index lives in the menu catalog cache and is synced with each catalog
+version: only items whose searchable text changed are re-tokenized.
+"""
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.schemas.menu import MenuItemResponse
+from app.services.menu_categories import category_key
+
+THAI_GRAM = 2
+WORD_GRAM = 3
+FIELD_WEIGHTS = (("name", 3.0), ("category", 2.0), ("description", 1.0))
+# Weighted share of the query's grams an item must contain to match
+MIN_COVERAGE = 0.4
+# Added when the whole query appears in the name; scaled by field weight for other fields
+PHRASE_BONUS = 0.5
+RECOMMENDED_BOOST = 1.25
+
+# Thai runs, and words of other scripts
+_RUNS = re.compile(r"[\u0e00-\u0e7f]+|[^\W_\u0e00-\u0e7f]+")
+_MAX_WEIGHT = max(weight for _, weight in FIELD_WEIGHTS)
+_CATEGORY_FIELD = [field for field, _ in FIELD_WEIGHTS].index("category")
+
+
+def normalize(text: Optional[str]) -> str:
+    return unicodedata.normalize("NFKC", text or "").casefold()
+
+
+def _is_thai(char: str) -> bool:
+    return "\u0e00" <= char <= "\u0e7f"
+
+
+def ngrams(text: str, prefix: bool = False) -> List[str]:
+    """Character n-grams of normalized ``text``; see the module docstring.
+
+    With ``prefix``, the last word may be incomplete (search as you type),
+    so it gets no end-of-word gram.
+    """
+    grams = []
+    runs = _RUNS.findall(text)
+    for run in runs:
+        if _is_thai(run[0]):
+            if len(run) <= THAI_GRAM:
+                grams.append(run)
+            else:
+                grams.extend(run[i:i + THAI_GRAM] for i in range(len(run) - THAI_GRAM + 1))
+        else:
+            padded = f" {run} "
+            grams.extend(padded[i:i + WORD_GRAM] for i in range(len(padded) - WORD_GRAM + 1))
+    if prefix and runs and not _is_thai(runs[-1][0]) and len(runs[-1]) > 1:
+        grams.pop()
+    return grams
+
+
+class IndexedItem:
+    __slots__ = ("text", "normalized", "grams", "category")
+
+    def __init__(self, text: Tuple, normalized: Tuple, grams: Dict[str, float], category: str):
+        self.text = text  # Indexed field values, to detect changes
+        self.normalized = normalized
+        self.grams = grams  # Gram -> field weight
+        self.category = category  # category_key of the item's category
+
+
+class MenuSearchIndex:
+    """Inverted index from n-gram to menu item ids, updated incrementally."""
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._indexed: Dict[int, IndexedItem] = {}
+        self._items: Dict[int, MenuItemResponse] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._indexed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings = {}
+            self._indexed = {}
+            self._items = {}
+
+    def sync(self, items: Sequence[MenuItemResponse]) -> int:
+        """Make the index match ``items``; returns how many items were (re)indexed."""
+        changed = 0
+        with self._lock:
+            current = {}
+            for item in items:
+                current[item.id] = item
+                text = tuple(getattr(item, field) for field, _ in FIELD_WEIGHTS)
+                indexed = self._indexed.get(item.id)
+                if indexed is None or indexed.text != text:
+                    if indexed is not None:
+                        self._unindex(item.id)
+                    self._index(item.id, text)
+                    changed += 1
+            for item_id in self._indexed.keys() - current.keys():
+                self._unindex(item_id)
+            self._items = current
+        return changed
+
+    def update_items(self, items: Sequence[MenuItemResponse]) -> None:
+        """Return these versions of indexed items from now on; their searchable text must be unchanged."""
+        with self._lock:
+            for item in items:
+                if item.id in self._items:
+                    self._items[item.id] = item
+
+    def _index(self, item_id: int, text: Tuple) -> None:
+        normalized = tuple(normalize(value) for value in text)
+        grams: Dict[str, float] = {}
+        for (_, weight), value in zip(FIELD_WEIGHTS, normalized):
+            for gram in ngrams(value):
+                if grams.get(gram, 0.0) < weight:
+                    grams[gram] = weight
+        for gram, weight in grams.items():
+            self._postings.setdefault(gram, {})[item_id] = weight
+        self._indexed[item_id] = IndexedItem(text, normalized, grams, category_key(text[_CATEGORY_FIELD]))
+
+    def _unindex(self, item_id: int) -> None:
+        indexed = self._indexed.pop(item_id)
+        for gram in indexed.grams:
+            posting = self._postings[gram]
+            del posting[item_id]
+            if not posting:
+                del self._postings[gram]
+
+    def search(
+        self, query: str, limit: int = 20, category: Optional[str] = None
+    ) -> List[MenuItemResponse]:
+        """Best matches for ``query``, recommended items boosted."""
+        normalized = normalize(query).strip()
+        category = category_key(category) if category else None
+        grams = set(ngrams(normalized, prefix=True))
+
+        with self._lock:
+            total = len(self._indexed)
+            known = {gram: self._postings[gram] for gram in grams if gram in self._postings}
+            if not known:
+                return []
+            # Rare grams count for more
+            weights = {gram: math.log(1 + total / len(posting)) for gram, posting in known.items()}
+            # Grams no item has (typos) count against coverage like an average gram
+            possible = sum(weights.values()) / len(weights) * len(grams)
+            needed = MIN_COVERAGE * possible
+
+            # Only items with one of the rarest grams can reach the coverage
+            # needed, so candidates come from those grams' postings alone
+            matched: Dict[int, float] = {}
+            remaining = sum(weights.values())
+            for gram in sorted(known, key=weights.get, reverse=True):
+                if remaining < needed:
+                    break
+                matched.update(dict.fromkeys(known[gram], 0.0))
+                remaining -= weights[gram]
+            weighted = dict.fromkeys(matched, 0.0)
+            for gram, posting in known.items():
+                idf = weights[gram]
+                for item_id, field_weight in posting.items():
+                    if item_id in matched:
+                        matched[item_id] += idf
+                        weighted[item_id] += idf * field_weight
+
+            # Bounded min-heap of the best matches, so a broad query does not
+            # build (and leave for the garbage collector) one entry per match
+            top: List[Tuple[Tuple[float, int, int], int]] = []
+            scale = possible * _MAX_WEIGHT
+            for item_id, score in matched.items():
+                if score < needed:
+                    continue
+                indexed = self._indexed[item_id]
+                if category is not None and indexed.category != category:
+                    continue
+                item = self._items[item_id]
+                # Matches in the name rank above the same matches in the description
+                rank = weighted[item_id] / scale
+                for (_, weight), value in zip(FIELD_WEIGHTS, indexed.normalized):
+                    if normalized in value:
+                        rank += PHRASE_BONUS * weight / _MAX_WEIGHT
+                        break
+                if item.is_recommended:
+                    rank *= RECOMMENDED_BOOST
+                key = (rank, -item.display_order, -item_id)
+                if len(top) < limit:
+                    heapq.heappush(top, (key, item_id))
+                elif key > top[0][0]:
+                    heapq.heapreplace(top, (key, item_id))
+
+            return [self._items[item_id] for _, item_id in sorted(top, reverse=True)]
@@ -1,9 +1,35 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import case, func, update
+from typing import List, Optional, Sequence
 from app.models.menu import MenuItem, MenuOption, OptionChoice
-from app.schemas.menu import MenuItemCreate, MenuItemUpdate, MenuOptionCreate, MenuOptionUpdate, OptionChoiceCreate
+from app.schemas.menu import DisplayOrder, MenuItemCreate, MenuItemUpdate, MenuItemResponse, MenuOptionCreate, MenuOptionUpdate, OptionChoiceCreate
 from app.core.exceptions import AppException
+from app.services.menu_cache import MenuPayload, menu_cache, bump_menu_version
+from app.services.menu_categories import CategoryIndex
+
+
+def bulk_reorder(db: Session, model, orders: Sequence[DisplayOrder], label: str, *scope) -> None:
+    """Set display_order on many rows with one UPDATE ... SET display_order = CASE id ... END.
+
+    Every id must match a row within ``scope`` (extra WHERE criteria, e.g. the
+    parent option); otherwise nothing is changed and a 400 is raised.
+    """
+    new_orders = {order.id: order.display_order for order in orders}
+    if len(new_orders) != len(orders):
+        raise AppException(f"Duplicate {label} ids in reorder request", 400)
+    if not new_orders:
+        return
+
+    result = db.execute(
+        update(model)
+        .where(model.id.in_(new_orders), *scope)
+        .values(display_order=case(new_orders, value=model.id))
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != len(new_orders):
+        db.rollback()
+        raise AppException(f"Some {label} ids do not exist or cannot be reordered here", 400)
 
 
 class MenuService:
@@ -17,11 +43,43 @@ class MenuService:
         limit: int = 100
     ) -> List[MenuItem]:
         """Get all menu items with optional filtering."""
-        query = db.query(MenuItem)
+        query = db.query(MenuItem).options(
+            selectinload(MenuItem.options).selectinload(MenuOption.choices)
+        )
         if category:
             query = query.filter(MenuItem.category == category)
         return query.order_by(MenuItem.display_order, MenuItem.id).offset(skip).limit(limit).all()
 
+    @staticmethod
+    def get_menu_catalog(
+        db: Session,
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[MenuItemResponse]:
+        """Get menu items from the cached catalog with optional filtering."""
+        return menu_cache.select_items(db, category, skip, limit)
+
+    @staticmethod
+    def get_menu_payload(
+        db: Session,
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> MenuPayload:
+        """Get a menu listing as pre-serialized, pre-compressed bytes."""
+        return menu_cache.get_payload(db, category=category, skip=skip, limit=limit)
+
+    @staticmethod
+    def search_menu_items(
+        db: Session,
+        query: str,
+        category: Optional[str] = None,
+        limit: int = 20
+    ) -> List[MenuItemResponse]:
+        """Search menu items by name, category and description, best matches first."""
+        return menu_cache.get_search_index(db).search(query, limit=limit, category=category)
+
     @staticmethod
     def get_menu_item_by_id(db: Session, item_id: int) -> MenuItem:
         """Get menu item by ID."""
@@ -62,6 +120,7 @@ class MenuService:
             menu_item.options = options
 
         db.add(menu_item)
+        bump_menu_version(db)
         db.commit()
         db.refresh(menu_item)
         return menu_item
@@ -89,6 +148,7 @@ class MenuService:
             ).all()
             item.options = options
 
+        bump_menu_version(db)
         db.commit()
         db.refresh(item)
         return item
@@ -98,13 +158,13 @@ class MenuService:
         """Delete menu item."""
         item = MenuService.get_menu_item_by_id(db, item_id)
         db.delete(item)
+        bump_menu_version(db)
         db.commit()
 
     @staticmethod
-    def get_categories(db: Session) -> List[str]:
-        """Get all menu categories."""
-        categories = db.query(MenuItem.category).distinct().all()
-        return [cat[0] for cat in categories]
+    def get_category_index(db: Session) -> CategoryIndex:
+        """Get the category index, with its listings pre-serialized."""
+        return menu_cache.get_category_index(db)
 
     # Menu Options Management
 
@@ -148,6 +208,7 @@ class MenuService:
             menu_option.choices.append(choice)
 
         db.add(menu_option)
+        bump_menu_version(db)
         db.commit()
         db.refresh(menu_option)
         return menu_option
@@ -170,6 +231,7 @@ class MenuService:
                 else:
                     setattr(option, field, value)
 
+        bump_menu_version(db)
         db.commit()
         db.refresh(option)
         return option
@@ -179,6 +241,7 @@ class MenuService:
         """Delete menu option."""
         option = MenuService.get_menu_option_by_id(db, option_id)
         db.delete(option)
+        bump_menu_version(db)
         db.commit()
 
     # Option Choices Management
@@ -201,6 +264,7 @@ class MenuService:
         )
 
         db.add(choice)
+        bump_menu_version(db)
         db.commit()
         db.refresh(choice)
         return choice
@@ -220,6 +284,7 @@ class MenuService:
             if value is not None:
                 setattr(choice, field, value)
 
+        bump_menu_version(db)
         db.commit()
         db.refresh(choice)
         return choice
@@ -232,29 +297,104 @@ class MenuService:
             raise AppException("Option choice not found", 404)
 
         db.delete(choice)
+        bump_menu_version(db)
         db.commit()
 
     @staticmethod
     def reorder_option_choices(
         db: Session,
         option_id: int,
-        choice_orders: List[dict]
+        choice_orders: List[DisplayOrder]
     ) -> List[OptionChoice]:
         """Reorder option choices. Expected: [{"id": 1, "display_order": 1}, ...]"""
-        option = MenuService.get_menu_option_by_id(db, option_id)
-
-        # Update display_order for each choice
-        for choice_order in choice_orders:
-            choice = db.query(OptionChoice).filter(
-                OptionChoice.id == choice_order['id'],
-                OptionChoice.menu_option_id == option_id
-            ).first()
-            if choice:
-                choice.display_order = choice_order['display_order']
+        try:
+            bulk_reorder(db, OptionChoice, choice_orders, "choice", OptionChoice.menu_option_id == option_id)
+        except AppException:
+            MenuService.get_menu_option_by_id(db, option_id)  # 404 for a missing option
+            raise
 
+        bump_menu_version(db)
         db.commit()
 
         # Return sorted choices
         return db.query(OptionChoice).filter(
             OptionChoice.menu_option_id == option_id
         ).order_by(OptionChoice.display_order, OptionChoice.id).all()
+
+    @staticmethod
+    def reorder_menu_options(db: Session, option_orders: List[DisplayOrder]) -> List[DisplayOrder]:
+        """Reorder menu options; returns the display order of every option."""
+        bulk_reorder(db, MenuOption, option_orders, "option")
+        bump_menu_version(db)
+        db.commit()
+
+        rows = db.query(MenuOption.id, MenuOption.display_order).order_by(
+            MenuOption.display_order, MenuOption.id
+        )
+        return [DisplayOrder(id=option_id, display_order=display_order) for option_id, display_order in rows]
+
+    @staticmethod
+    def reorder_menu_items(db: Session, category: str, item_orders: List[DisplayOrder]) -> List[DisplayOrder]:
+        """Reorder menu items within a category; returns the category's display order."""
+        bulk_reorder(db, MenuItem, item_orders, "menu item", MenuItem.category == category)
+        bump_menu_version(db)
+        db.commit()
+
+        rows = db.query(MenuItem.id, MenuItem.display_order).filter(MenuItem.category == category).order_by(
+            MenuItem.display_order, MenuItem.id
+        )
+        return [DisplayOrder(id=item_id, display_order=display_order) for item_id, display_order in rows]
+
+
+class AsyncMenuService:
+    """Async menu reads for AsyncSession-based handlers.
+
+    See AsyncOrderService for how the sync implementation is reused.
+    """
+
+    @staticmethod
+    async def get_all_menu_items(
+        db: AsyncSession,
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[MenuItemResponse]:
+        """Get all menu items with optional filtering."""
+        def run(session: Session) -> List[MenuItemResponse]:
+            return MenuService.get_menu_catalog(session, category=category, skip=skip, limit=limit)
+
+        return await db.run_sync(run)
+
+    @staticmethod
+    async def get_menu_payload(
+        db: AsyncSession,
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> MenuPayload:
+        """Get a menu listing as pre-serialized, pre-compressed bytes."""
+        def run(session: Session) -> MenuPayload:
+            return MenuService.get_menu_payload(session, category=category, skip=skip, limit=limit)
+
+        return await db.run_sync(run)
+
+    @staticmethod
+    async def search_menu_items(
+        db: AsyncSession,
+        query: str,
+        category: Optional[str] = None,
+        limit: int = 20
+    ) -> List[MenuItemResponse]:
+        """Search menu items by name, category and description, best matches first."""
+        def run(session: Session) -> List[MenuItemResponse]:
+            return MenuService.search_menu_items(session, query, category=category, limit=limit)
+
+        return await db.run_sync(run)
+
+    @staticmethod
+    async def get_menu_item_by_id(db: AsyncSession, item_id: int) -> MenuItemResponse:
+        """Get menu item by ID."""
+        def run(session: Session) -> MenuItemResponse:
+            return MenuItemResponse.model_validate(MenuService.get_menu_item_by_id(session, item_id))
+
+        return await db.run_sync(run)
@@ -0,0 +1,162 @@
+"""Per-table aggregate of open orders for the floor view.
+
+Each worker keeps, per table number, the count and running total of open
+(pending, preparing or ready) orders and a min-heap of the creation times
+of its pending ones. Order events update it, so GET /orders/tables is
+served from memory in time proportional to the number of tables, without
+scanning orders. Only with several workers or a shared broker is it also
+rebuilt from the database now and then (see order_views), reading open
+orders through the orders.status index.
+"""
+import heapq
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.models.order import Order
+from app.schemas.order import OpenTable, OpenTables, OrderStatusEnum
+from app.services import order_events
+from app.services.order_views import OrderView
+
+settings = get_settings()
+
+PENDING = OrderStatusEnum.PENDING.value
+OPEN_STATUSES = (PENDING, OrderStatusEnum.PREPARING.value, OrderStatusEnum.READY.value)
+
+
+def _parse_datetime(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+class OpenOrder:
+    """An open order's contribution to its table."""
+
+    __slots__ = ("order_id", "table_number", "status", "total", "created_at")
+
+    def __init__(self, order_id: int, table_number: Optional[int], status: str, total: float, created_at: datetime):
+        self.order_id = order_id
+        self.table_number = table_number
+        self.status = status
+        self.total = total
+        self.created_at = created_at
+
+    @classmethod
+    def from_response(cls, order: Mapping[str, Any]) -> "OpenOrder":
+        """Build from an order as serialized in an event."""
+        return cls(
+            order["id"], order.get("table_number"), order["status"], order["total"],
+            _parse_datetime(order["created_at"]),
+        )
+
+
+class TableAggregate:
+    __slots__ = ("table_number", "open_orders", "total", "pending", "_pending_heap")
+
+    def __init__(self, table_number: Optional[int]):
+        self.table_number = table_number
+        self.open_orders = 0
+        self.total = 0.0
+        self.pending: Dict[int, datetime] = {}  # Order id -> created_at
+        # (created_at, order id) of pending orders; entries no longer in pending are dropped lazily
+        self._pending_heap: List[Tuple[datetime, int]] = []
+
+    def add_pending(self, order_id: int, created_at: datetime) -> None:
+        self.pending[order_id] = created_at
+        heapq.heappush(self._pending_heap, (created_at, order_id))
+
+    def remove_pending(self, order_id: int) -> None:
+        if self.pending.pop(order_id, None) is not None and not self.pending:
+            self._pending_heap = []
+
+    def oldest_pending(self) -> Optional[datetime]:
+        heap = self._pending_heap
+        while heap and self.pending.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+
+class OpenTablesView(OrderView):
+    """Open orders grouped by table, updated incrementally from order events."""
+
+    def __init__(self, resync_interval: Optional[float] = None):
+        self._orders: Dict[int, OpenOrder] = {}
+        self._tables: Dict[Optional[int], TableAggregate] = {}
+        super().__init__(resync_interval)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def _reset(self) -> None:
+        self._orders = {}
+        self._tables = {}
+
+    def _add(self, order: OpenOrder) -> None:
+        table = self._tables.get(order.table_number)
+        if table is None:
+            table = self._tables[order.table_number] = TableAggregate(order.table_number)
+        table.open_orders += 1
+        table.total += order.total
+        if order.status == PENDING:
+            table.add_pending(order.order_id, order.created_at)
+        self._orders[order.order_id] = order
+
+    def _discard(self, order_id: int) -> None:
+        order = self._orders.pop(order_id, None)
+        if order is None:
+            return
+        table = self._tables[order.table_number]
+        table.open_orders -= 1
+        table.total -= order.total
+        table.remove_pending(order_id)
+        if table.open_orders == 0:
+            del self._tables[order.table_number]
+
+    def _apply(self, event: order_events.OrderEvent) -> None:
+        is_open = (
+            event.type != order_events.ORDER_DELETED
+            and event.status in OPEN_STATUSES
+            and event.order is not None
+        )
+        # Remove the old contribution first: the table or total may have changed
+        self._discard(event.order_id)
+        if is_open:
+            self._add(OpenOrder.from_response(event.order))
+
+    def _query(self, db: Session) -> Sequence[Any]:
+        return db.query(
+            Order.id, Order.table_number, Order.status, Order.total, Order.created_at, Order.updated_at
+        ).filter(Order.status.in_(OPEN_STATUSES)).all()
+
+    def _rebuild(self, rows: Sequence[Any]) -> None:
+        for row in rows:
+            self._add(OpenOrder(row.id, row.table_number, row.status, row.total, row.created_at))
+
+    def snapshot(self, now: Optional[datetime] = None) -> OpenTables:
+        now = now or datetime.utcnow()
+        with self._lock:
+            tables = []
+            for table in self._tables.values():
+                oldest = table.oldest_pending()
+                tables.append(OpenTable(
+                    table_number=table.table_number,
+                    open_orders=table.open_orders,
+                    total=round(table.total, 2),
+                    oldest_pending_at=oldest,
+                    oldest_pending_seconds=int((now - oldest).total_seconds()) if oldest else None,
+                ))
+        # Numbered tables first, then orders without a table
+        tables.sort(key=lambda t: (t.table_number is None, t.table_number or 0))
+        return OpenTables(generated_at=now, tables=tables)
+
+
+open_tables = OpenTablesView(settings.order_views_resync_interval)
+order_events.add_listener(open_tables.apply)
+
+metrics.registry.gauge(
+    "open_tables",
+    "Tables with open orders in this worker's floor view.",
+    callback=lambda: len(open_tables),
+)
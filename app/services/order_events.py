@@ -0,0 +1,349 @@
+"""Order change events and the pub/sub that pushes them to kitchen clients.
+
+OrderService publishes an event after each committed order change. The
+in-process broker fans events out to subscriptions held by WebSocket/SSE
+connections (and long-poll requests) in the same worker. Publishing may
+happen on any thread; delivery is handed to each subscriber's event loop.
+
+The in-process broker only sees orders changed through its own worker, so
+with several workers the streams are incomplete. To share events across
+workers, subclass EventBroker so that ``publish`` sends the event to a shared
+broker (e.g. Redis pub/sub) and a listener in every worker passes received
+events to ``deliver``; ``OrderEvent.to_json`` and ``OrderEvent.from_json``
+are the wire format. Install it with ``set_broker`` at startup and set
+ORDER_EVENTS_SHARED_BROKER, which lets the launcher run several workers.
+
+Event ids are the order's change cursor, ``<updated_at>_<order id>`` as in
+GET /orders/changes, so they mean the same thing in every worker and
+across restarts.
+"""
+import asyncio
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.responses import ORJSONResponse, serialize
+from app.schemas.order import OrderResponse, OrderStatusEnum
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+ORDER_CREATED = "order.created"
+ORDER_UPDATED = "order.updated"
+ORDER_PREPARING = "order.preparing"
+ORDER_READY = "order.ready"
+ORDER_CANCELLED = "order.cancelled"
+ORDER_COMPLETED = "order.completed"
+ORDER_DELETED = "order.deleted"
+# Sent to a subscriber that missed events; it should refetch current orders
+RESYNC = "resync"
+
+_render = ORJSONResponse(None).render
+
+# In-process consumers of every delivered event; see add_listener
+_listeners: List[Callable[["OrderEvent"], None]] = []
+
+
+def format_event_id(updated_at: datetime, order_id: int) -> str:
+    """Event id (and GET /orders/changes cursor) for an order change."""
+    return f"{updated_at.isoformat()}_{order_id}"
+
+
+def parse_event_id(event_id: str) -> Tuple[datetime, int]:
+    """The (updated_at, order id) an event id orders by; ValueError if malformed."""
+    updated_at, order_id = event_id.rsplit("_", 1)
+    return datetime.fromisoformat(updated_at), int(order_id)
+
+
+class OrderEvent:
+    """One order change, serialized once and shared by every subscriber."""
+
+    __slots__ = ("id", "type", "order_id", "status", "table_number", "order", "at", "_json")
+
+    def __init__(
+        self,
+        type: str,
+        order_id: Optional[int] = None,
+        status: Optional[str] = None,
+        table_number: Optional[int] = None,
+        order: Optional[Dict[str, Any]] = None,
+        at: Optional[str] = None,
+        id: Optional[str] = None,
+    ):
+        self.id = id
+        self.type = type
+        self.order_id = order_id
+        self.status = status
+        self.table_number = table_number
+        self.order = order
+        self.at = at or datetime.utcnow().isoformat()
+        self._json: Optional[bytes] = None
+
+    @classmethod
+    def for_order(cls, type: str, order) -> "OrderEvent":
+        """Build an event carrying the order as returned by the API."""
+        # A deletion leaves no row behind, so it is ordered by when it happened
+        changed_at = datetime.utcnow() if type == ORDER_DELETED else order.updated_at
+        return cls(
+            type,
+            order_id=order.id,
+            status=order.status,
+            table_number=order.table_number,
+            order=_load_json(serialize(OrderResponse, order)),
+            id=format_event_id(changed_at, order.id),
+        )
+
+    @classmethod
+    def from_json(cls, data: bytes) -> "OrderEvent":
+        return cls(**_load_json(data))
+
+    def to_json(self) -> bytes:
+        if self._json is None:
+            self._json = _render({
+                "id": self.id,
+                "type": self.type,
+                "order_id": self.order_id,
+                "status": self.status,
+                "table_number": self.table_number,
+                "order": self.order,
+                "at": self.at,
+            })
+        return self._json
+
+
+def _load_json(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+
+    return json.loads(data)
+
+
+class UnknownStatusError(ValueError):
+    """A status filter named something that is not an order status."""
+
+
+class EventFilter:
+    """Per-connection filter on order status and table number."""
+
+    __slots__ = ("statuses", "tables")
+
+    def __init__(self, statuses: Optional[Set[str]] = None, tables: Optional[Set[int]] = None):
+        self.statuses = statuses or None
+        self.tables = tables or None
+
+    @classmethod
+    def parse(cls, status: Optional[str], table: Optional[str]) -> "EventFilter":
+        """Build from comma-separated query parameters, e.g. ``status=pending,preparing``.
+
+        Raises UnknownStatusError for a status that no order can have, which
+        would otherwise never match.
+        """
+        statuses = {s.strip() for s in (status or "").split(",") if s.strip()}
+        unknown = statuses - {s.value for s in OrderStatusEnum}
+        if unknown:
+            raise UnknownStatusError(f"Unknown order status: {', '.join(sorted(unknown))}")
+        try:
+            tables = {int(t) for t in (table or "").split(",") if t.strip()}
+        except ValueError:
+            raise ValueError("table must be a comma-separated list of integers")
+        return cls(statuses, tables)
+
+    def matches(self, event: OrderEvent) -> bool:
+        if event.type == RESYNC:
+            return True
+        if self.statuses is not None and event.status not in self.statuses:
+            return False
+        if self.tables is not None and event.table_number not in self.tables:
+            return False
+        return True
+
+
+class Subscription:
+    """A subscriber's bounded event queue on its own event loop.
+
+    When the subscriber falls behind and the queue fills up, queued events
+    are dropped and replaced by a single RESYNC event, so a slow client
+    never holds memory for the whole stream or slows down publishers.
+    """
+
+    def __init__(self, broker: "EventBroker", event_filter: EventFilter, max_queue: int):
+        self.broker = broker
+        self.filter = event_filter
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def _push(self, event: OrderEvent) -> None:
+        # Runs on the subscriber's loop
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += self.queue.qsize() + 1
+            metrics.order_events_dropped_total.inc(self.queue.qsize() + 1)
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OrderEvent(RESYNC, id=event.id))
+
+    def offer(self, event: OrderEvent) -> None:
+        """Queue ``event`` from any thread if it passes the filter."""
+        if not self.filter.matches(event):
+            return
+        try:
+            self.loop.call_soon_threadsafe(self._push, event)
+        except RuntimeError:
+            # Loop closed; the connection is gone
+            self.broker.unsubscribe(self)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[OrderEvent]:
+        """Next event, or None if none arrives within ``timeout`` seconds."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class EventBroker:
+    """In-process pub/sub for order events with a short replay buffer."""
+
+    def __init__(self, max_queue: int, replay_size: int, max_subscribers: int):
+        self.max_queue = max_queue
+        self.max_subscribers = max_subscribers
+        self.subscriptions: List[Subscription] = []
+        self._recent: deque = deque(maxlen=replay_size)
+        self._lock = threading.Lock()
+
+    def publish(self, event: OrderEvent) -> None:
+        """Publish an event to every subscriber. Override to go through a shared broker."""
+        self.deliver(event)
+
+    def deliver(self, event: OrderEvent) -> None:
+        """Hand the event to this worker's subscribers and listeners."""
+        if event.id is None:
+            event.id = format_event_id(datetime.utcnow(), event.order_id or 0)
+        with self._lock:
+            self._recent.append(event)
+            subscriptions = list(self.subscriptions)
+        metrics.order_events_published_total.inc(type=event.type)
+        for subscription in subscriptions:
+            subscription.offer(event)
+        for listener in _listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning(f"Order event listener failed on {event.type}: {e}")
+
+    def subscribe(
+        self, event_filter: Optional[EventFilter] = None, last_event_id: Optional[str] = None
+    ) -> Subscription:
+        """Subscribe from the running event loop, optionally replaying after ``last_event_id``.
+
+        Raises ValueError for a malformed ``last_event_id``.
+        """
+        last = parse_event_id(last_event_id) if last_event_id is not None else None
+        subscription = Subscription(self, event_filter or EventFilter(), self.max_queue)
+        with self._lock:
+            if len(self.subscriptions) >= self.max_subscribers:
+                raise OverflowError("Too many order event subscribers")
+            self.subscriptions.append(subscription)
+            recent = list(self._recent)
+
+        if last is not None:
+            missed = self._missed(recent, last_event_id, last)
+            if missed is None:
+                subscription._push(OrderEvent(RESYNC, id=recent[-1].id if recent else last_event_id))
+            else:
+                for event in missed:
+                    if subscription.filter.matches(event):
+                        subscription._push(event)
+        return subscription
+
+    @staticmethod
+    def _missed(
+        recent: List[OrderEvent], last_event_id: str, last: Tuple[datetime, int]
+    ) -> Optional[List[OrderEvent]]:
+        """Buffered events after ``last_event_id``, or None when they cannot be known."""
+        # Ids follow updated_at, which is stamped before commit, so events may be
+        # delivered slightly out of id order: resume after the event's position
+        for position in range(len(recent) - 1, -1, -1):
+            if recent[position].id == last_event_id:
+                return recent[position + 1:]
+        keys = [parse_event_id(event.id) for event in recent]
+        if keys and min(keys) <= last <= max(keys):
+            # Seen in another worker's stream (no shared broker): this worker's later events
+            return [event for event, key in zip(recent, keys) if key > last]
+        # No longer buffered, or newer than anything this worker has delivered
+        return None
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self.subscriptions:
+                self.subscriptions.remove(subscription)
+
+
+order_events = EventBroker(
+    max_queue=settings.ORDER_EVENTS_QUEUE_SIZE,
+    replay_size=settings.ORDER_EVENTS_REPLAY_SIZE,
+    max_subscribers=settings.ORDER_EVENTS_MAX_SUBSCRIBERS,
+)
+
+metrics.registry.gauge(
+    "order_event_subscribers",
+    "Connections subscribed to order events in this worker.",
+    callback=lambda: len(order_events.subscriptions),
+)
+
+
+def add_listener(listener: Callable[[OrderEvent], None]) -> None:
+    """Call ``listener(event)`` for every event delivered in this worker.
+
+    Listeners run on the delivering thread and survive ``set_broker``, so
+    they must be quick and must not block.
+    """
+    _listeners.append(listener)
+
+
+def get_broker() -> EventBroker:
+    return order_events
+
+
+def set_broker(broker: EventBroker) -> None:
+    """Replace the broker, e.g. with one backed by a shared message broker."""
+    global order_events
+    order_events = broker
+
+
+def publish(event: OrderEvent) -> None:
+    """Publish an event for a committed change."""
+    try:
+        order_events.publish(event)
+    except Exception as e:
+        # Events are best-effort; never fail the request that changed the order
+        logger.warning(f"Failed to publish {event.type} for order {event.order_id}: {e}")
+
+
+def publish_order_event(event_type: str, order) -> None:
+    """Publish a committed order change, carrying the order as the API returns it.
+
+    Events are published even without subscribers so that the replay buffer
+    covers clients resuming with Last-Event-ID.
+    """
+    publish(OrderEvent.for_order(event_type, order))
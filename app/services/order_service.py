@@ -1,9 +1,88 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from collections import Counter
+from datetime import datetime, timedelta
+from sqlalchemy import and_, case, delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Optional, Sequence, Tuple
 from app.models.order import Order, OrderItem
 from app.models.menu import MenuItem
-from app.schemas.order import OrderCreate, OrderUpdate
+from app.schemas.order import (
+    OrderBulkCreate,
+    OrderBulkResponse,
+    OrderBulkResult,
+    OrderChanges,
+    OrderCreate,
+    OrderItemCreate,
+    OrderUpdate,
+    OrderResponse,
+    OrderStatusEnum,
+)
+from app.core.config import get_settings
 from app.core.exceptions import AppException
+from app.core import metrics
+from app.core.logging import get_logger
+from app.core.responses import serialize
+from app.services.menu_cache import mark_stock_changed, menu_cache
+from app.services.pricing import PricedLine, PricingIndex
+from app.services import order_events
+from app.services.idempotency import StoredResponse, idempotency_store, request_fingerprint
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Operation name in Idempotency-Key fingerprints
+CREATE_ORDER = "orders.create"
+
+PENDING = OrderStatusEnum.PENDING.value
+PREPARING = OrderStatusEnum.PREPARING.value
+READY = OrderStatusEnum.READY.value
+COMPLETED = OrderStatusEnum.COMPLETED.value
+CANCELLED = OrderStatusEnum.CANCELLED.value
+
+# Statuses an order may move to from each status; completed and cancelled are
+# final. Orders may be completed without passing through preparing and ready,
+# for counters that do not track kitchen progress.
+ORDER_TRANSITIONS: Dict[str, Tuple[str, ...]] = {
+    PENDING: (PREPARING, COMPLETED, CANCELLED),
+    PREPARING: (READY, COMPLETED, CANCELLED),
+    READY: (COMPLETED, CANCELLED),
+    COMPLETED: (),
+    CANCELLED: (),
+}
+# Column recording when an order entered each status
+STATUS_TIMESTAMPS = {
+    PREPARING: "preparing_at",
+    READY: "ready_at",
+    COMPLETED: "completed_at",
+    CANCELLED: "cancelled_at",
+}
+STATUS_EVENTS = {
+    PREPARING: order_events.ORDER_PREPARING,
+    READY: order_events.ORDER_READY,
+    COMPLETED: order_events.ORDER_COMPLETED,
+    CANCELLED: order_events.ORDER_CANCELLED,
+}
+
+
+def allowed_sources(status: str) -> List[str]:
+    """Statuses from which an order may move to ``status``."""
+    return [source for source, targets in ORDER_TRANSITIONS.items() if status in targets]
+
+
+def format_change_cursor(updated_at: datetime, order_id: int) -> str:
+    """Cursor for GET /orders/changes: the last change returned, as ``<updated_at>_<id>``.
+
+    The same value is the id of the order event for that change.
+    """
+    return order_events.format_event_id(updated_at, order_id)
+
+
+def parse_change_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        return order_events.parse_event_id(cursor)
+    except ValueError:
+        raise AppException(f"Invalid changes cursor: {cursor}", 400)
 
 
 class OrderService:
@@ -17,11 +96,52 @@ class OrderService:
         limit: int = 100
     ) -> List[Order]:
         """Get all orders with optional filtering by status."""
-        query = db.query(Order)
+        query = db.query(Order).options(selectinload(Order.items))
         if status:
             query = query.filter(Order.status == status)
         return query.order_by(Order.created_at.desc()).offset(skip).limit(limit).all()
 
+    @staticmethod
+    def get_order_changes(db: Session, since: Optional[str], limit: int = 100) -> OrderChanges:
+        """Get orders whose updated_at advanced past the ``since`` cursor, oldest change first.
+
+        Without a cursor no orders are returned, only the cursor of the latest
+        change, so clients start from the current state they already loaded.
+        Deleted orders do not appear; they are only reported as order events.
+
+        updated_at is stamped when a transaction flushes, not when it commits,
+        so a change committing late can carry an older stamp than one already
+        returned. Changes younger than ORDER_CHANGES_SAFETY_LAG_SECONDS are
+        therefore held back, and the cursor never moves past that horizon.
+        """
+        horizon = datetime.utcnow() - timedelta(seconds=settings.ORDER_CHANGES_SAFETY_LAG_SECONDS)
+        if not since:
+            latest = db.query(Order.updated_at, Order.id).filter(Order.updated_at <= horizon).order_by(
+                Order.updated_at.desc(), Order.id.desc()
+            ).first()
+            cursor = format_change_cursor(*latest) if latest else None
+            return OrderChanges(orders=[], cursor=cursor, has_more=False)
+
+        updated_at, order_id = parse_change_cursor(since)
+        orders = (
+            db.query(Order)
+            .options(selectinload(Order.items))
+            .filter(or_(
+                Order.updated_at > updated_at,
+                and_(Order.updated_at == updated_at, Order.id > order_id),
+            ), Order.updated_at <= horizon)
+            .order_by(Order.updated_at, Order.id)
+            .limit(limit + 1)
+            .all()
+        )
+        has_more = len(orders) > limit
+        orders = orders[:limit]
+        return OrderChanges(
+            orders=[OrderResponse.model_validate(order) for order in orders],
+            cursor=format_change_cursor(orders[-1].updated_at, orders[-1].id) if orders else since,
+            has_more=has_more,
+        )
+
     @staticmethod
     def get_order_by_id(db: Session, order_id: int) -> Order:
         """Get order by ID."""
@@ -31,111 +151,377 @@ class OrderService:
         return order
 
     @staticmethod
-    def create_order(db: Session, order_create: OrderCreate) -> Order:
-        """Create new order."""
-        # Validate stock if needed
-        for item in order_create.items:
-            menu_item = db.query(MenuItem).filter(MenuItem.id == item.menu_item_id).first()
+    def get_pricing_index(db: Session, lines: Sequence[OrderItemCreate]) -> PricingIndex:
+        """Get the menu pricing index, refreshed if it lacks anything the lines reference."""
+        index = menu_cache.get_pricing_index(db)
+        if not index.covers(lines):
+            # Another worker may have changed the menu since the last version check
+            menu_cache.invalidate()
+            index = menu_cache.get_pricing_index(db)
+        return index
+
+    @staticmethod
+    def _check_stock(
+        menu_items: Dict[int, MenuItem], requested: Counter, stock: Dict[int, Optional[int]]
+    ) -> None:
+        """Check requested quantities against the menu rows and remaining ``stock``."""
+        for menu_item_id, quantity in requested.items():
+            menu_item = menu_items.get(menu_item_id)
             if not menu_item:
-                raise AppException(f"Menu item {item.menu_item_id} not found", 400)
+                raise AppException(f"Menu item {menu_item_id} not found", 400)
             if not menu_item.is_available:
                 raise AppException(f"Menu item '{menu_item.name}' is not available", 400)
-            if menu_item.stock_quantity is not None and menu_item.stock_quantity < item.quantity:
+            available = stock.get(menu_item_id)
+            if available is not None and available < quantity:
                 raise AppException(
-                    f"Menu item '{menu_item.name}' has insufficient stock. Available: {menu_item.stock_quantity}, Requested: {item.quantity}",
+                    f"Menu item '{menu_item.name}' has insufficient stock. Available: {available}, Requested: {quantity}",
                     400
                 )
 
+    @staticmethod
+    def _build_order(order_create: OrderCreate, lines: List[PricedLine], total: float) -> Order:
         order = Order(
-            total=order_create.total,
+            total=total,
             table_number=order_create.table_number,
-            status='pending'
+            status=PENDING
         )
 
         # Add order items
-        for item_create in order_create.items:
-            order_item = OrderItem(
-                menu_item_id=item_create.menu_item_id,
-                name=item_create.name,
-                quantity=item_create.quantity,
-                price=item_create.price,
-                options_text=item_create.options_text,
-                remark=item_create.remark,
-            )
-            order.items.append(order_item)
+        for line in lines:
+            order.items.append(OrderItem(
+                menu_item_id=line.menu_item_id,
+                name=line.name,
+                quantity=line.quantity,
+                price=line.unit_price,
+                options_text=line.options_text,
+                remark=line.remark,
+            ))
+        return order
 
-            # Reduce stock if applicable
-            menu_item = db.query(MenuItem).filter(MenuItem.id == item_create.menu_item_id).first()
-            if menu_item and menu_item.stock_quantity is not None:
-                menu_item.stock_quantity -= item_create.quantity
+    @staticmethod
+    def create_order(db: Session, order_create: OrderCreate, idempotency_key: Optional[str] = None) -> Order:
+        """Create new order, pricing it from the menu.
+
+        With ``idempotency_key``, the response is stored under the key in the
+        order's transaction (see create_order_idempotent).
+        """
+        index = OrderService.get_pricing_index(db, order_create.items)
+        lines, total = index.price_order(order_create.items)
+        if order_create.total is not None and abs(order_create.total - total) >= 0.01:
+            logger.warning(f"Client order total {order_create.total} differs from computed {total}")
+
+        # Validate availability and stock against current rows, one query for all lines
+        requested = Counter()
+        for line in lines:
+            requested[line.menu_item_id] += line.quantity
+        menu_items = {
+            menu_item.id: menu_item
+            for menu_item in db.query(MenuItem).filter(MenuItem.id.in_(requested)).all()
+        }
+        OrderService._check_stock(menu_items, requested, {
+            menu_item_id: menu_item.stock_quantity for menu_item_id, menu_item in menu_items.items()
+        })
 
+        order = OrderService._build_order(order_create, lines, total)
+
+        # Reduce stock if applicable
+        stock_changed = False
+        for menu_item_id, quantity in requested.items():
+            menu_item = menu_items[menu_item_id]
+            if menu_item.stock_quantity is not None:
+                menu_item.stock_quantity -= quantity
+                stock_changed = True
+
+        if stock_changed:
+            mark_stock_changed(db)
         db.add(order)
+        if idempotency_key is not None:
+            db.flush()
+            idempotency_store.add(
+                db, idempotency_key, request_fingerprint(CREATE_ORDER, order_create),
+                201, serialize(OrderResponse, order),
+            )
         db.commit()
         db.refresh(order)
+        metrics.orders_created_total.inc()
+        order_events.publish_order_event(order_events.ORDER_CREATED, order)
         return order
 
+    @staticmethod
+    def create_order_idempotent(
+        db: Session, order_create: OrderCreate, idempotency_key: str
+    ) -> Tuple[StoredResponse, bool]:
+        """Create an order at most once per Idempotency-Key.
+
+        Returns the response for the key and whether it was replayed from an
+        earlier request. Replays skip pricing, stock updates and inserts.
+        """
+        fingerprint = request_fingerprint(CREATE_ORDER, order_create)
+        stored = idempotency_store.find(db, idempotency_key, fingerprint)
+        if stored is not None:
+            metrics.idempotent_replays_total.inc()
+            return stored, True
+
+        try:
+            OrderService.create_order(db, order_create, idempotency_key)
+        except IntegrityError:
+            # A concurrent request with the same key committed first
+            db.rollback()
+            stored = idempotency_store.find(db, idempotency_key, fingerprint)
+            if stored is None:
+                raise
+            metrics.idempotent_replays_total.inc()
+            return stored, True
+        return idempotency_store.find(db, idempotency_key, fingerprint), False
+
+    @staticmethod
+    def create_orders_bulk(db: Session, bulk: OrderBulkCreate) -> OrderBulkResponse:
+        """Create many orders in one transaction, reporting the outcome of each.
+
+        Prices come from the menu pricing index and stock from one query for
+        every item in the batch. Stock is allocated in request order, so an
+        order that would oversell fails on its own while the rest are created.
+        Orders and their items are written with batched INSERTs. Entries whose
+        idempotency_key was already used are replayed instead of created.
+        """
+        try:
+            return OrderService._create_orders_bulk(db, bulk)
+        except IntegrityError:
+            # A concurrent request stored one of the keys first; a second pass replays it
+            db.rollback()
+            return OrderService._create_orders_bulk(db, bulk)
+
+    @staticmethod
+    def _create_orders_bulk(db: Session, bulk: OrderBulkCreate) -> OrderBulkResponse:
+        entries = bulk.orders
+        results: List[Optional[OrderBulkResult]] = [None] * len(entries)
+
+        # Replay entries whose idempotency key was already used
+        fingerprints: Dict[int, str] = {}
+        first_use: Dict[str, int] = {}
+        for i, entry in enumerate(entries):
+            key = entry.idempotency_key
+            if key is None:
+                continue
+            if key in first_use:
+                results[i] = OrderBulkResult(index=i, status_code=400, error="Duplicate idempotency_key in batch")
+                continue
+            first_use[key] = i
+            fingerprints[i] = request_fingerprint(CREATE_ORDER, entry, exclude={"idempotency_key"})
+        for key, stored in idempotency_store.find_many(db, first_use).items():
+            i = first_use[key]
+            if stored.fingerprint != fingerprints[i]:
+                results[i] = OrderBulkResult(
+                    index=i, status_code=422, error="Idempotency-Key was already used for a different request"
+                )
+            else:
+                results[i] = OrderBulkResult(
+                    index=i, status_code=stored.status_code, replayed=True,
+                    order=OrderResponse.model_validate_json(stored.body),
+                )
+
+        # Price every remaining order from the in-memory index
+        pending = [i for i in range(len(entries)) if results[i] is None]
+        index = OrderService.get_pricing_index(db, [line for i in pending for line in entries[i].items])
+        priced: Dict[int, Tuple[List[PricedLine], float]] = {}
+        for i in pending:
+            try:
+                priced[i] = index.price_order(entries[i].items)
+            except AppException as e:
+                results[i] = OrderBulkResult(index=i, status_code=e.status_code, error=e.message)
+
+        # Allocate stock in request order against one fetch of the menu rows
+        menu_item_ids = {line.menu_item_id for lines, _ in priced.values() for line in lines}
+        menu_items = {
+            menu_item.id: menu_item
+            for menu_item in db.query(MenuItem).filter(MenuItem.id.in_(menu_item_ids)).all()
+        } if menu_item_ids else {}
+        stock = {menu_item_id: menu_item.stock_quantity for menu_item_id, menu_item in menu_items.items()}
+        created: List[Tuple[int, Order]] = []
+        for i, (lines, total) in priced.items():
+            requested = Counter()
+            for line in lines:
+                requested[line.menu_item_id] += line.quantity
+            try:
+                OrderService._check_stock(menu_items, requested, stock)
+            except AppException as e:
+                results[i] = OrderBulkResult(index=i, status_code=e.status_code, error=e.message)
+                continue
+            for menu_item_id, quantity in requested.items():
+                if stock[menu_item_id] is not None:
+                    stock[menu_item_id] -= quantity
+            created.append((i, OrderService._build_order(entries[i], lines, total)))
+
+        stock_changed = False
+        for menu_item_id, menu_item in menu_items.items():
+            if menu_item.stock_quantity != stock[menu_item_id]:
+                menu_item.stock_quantity = stock[menu_item_id]
+                stock_changed = True
+        if stock_changed:
+            mark_stock_changed(db)
+
+        db.add_all(order for _, order in created)
+        db.flush()
+        responses = []
+        for i, order in created:
+            response = OrderResponse.model_validate(order)
+            responses.append(response)
+            results[i] = OrderBulkResult(index=i, status_code=201, order=response)
+            if entries[i].idempotency_key is not None:
+                idempotency_store.add(
+                    db, entries[i].idempotency_key, fingerprints[i], 201, serialize(OrderResponse, response)
+                )
+        db.commit()
+
+        metrics.orders_created_total.inc(len(created))
+        for response in responses:
+            order_events.publish_order_event(order_events.ORDER_CREATED, response)
+        failed = sum(1 for result in results if result.status_code >= 400)
+        return OrderBulkResponse(created=len(created), failed=failed, results=results)
+
     @staticmethod
     def update_order(db: Session, order_id: int, order_update: OrderUpdate) -> Order:
-        """Update order."""
+        """Update order. A status change must be allowed by ORDER_TRANSITIONS."""
         order = OrderService.get_order_by_id(db, order_id)
 
-        update_data = order_update.dict(exclude_unset=True)
+        update_data = order_update.model_dump(exclude_unset=True)
+        status = update_data.pop("status", None)
         for field, value in update_data.items():
             if value is not None:
                 setattr(order, field, value)
 
+        # Setting the current status again is a no-op
+        changed = status is not None and status.value != order.status
+        if changed:
+            OrderService._apply_transition(db, order_id, status.value)
+
         db.commit()
-        db.refresh(order)
+        order = OrderService.get_order_by_id(db, order_id)
+        if changed:
+            OrderService._after_transition(order)
+        else:
+            order_events.publish_order_event(order_events.ORDER_UPDATED, order)
         return order
 
     @staticmethod
     def delete_order(db: Session, order_id: int) -> None:
-        """Delete order and restore stock."""
-        order = OrderService.get_order_by_id(db, order_id)
+        """Delete order and restore stock (already restored if it was cancelled).
 
-        # Restore stock
-        for item in order.items:
-            menu_item = db.query(MenuItem).filter(MenuItem.id == item.menu_item_id).first()
-            if menu_item and menu_item.stock_quantity is not None:
-                menu_item.stock_quantity += item.quantity
+        Whether the order was cancelled is decided by the DELETE itself, not
+        by the status read beforehand, so a concurrent cancel cannot get the
+        stock restored twice.
+        """
+        order = OrderService.get_order_by_id(db, order_id)
+        event = order_events.OrderEvent.for_order(order_events.ORDER_DELETED, order)
+        quantities = OrderService._order_quantities(db, order_id)
 
-        db.delete(order)
+        db.execute(
+            delete(OrderItem).where(OrderItem.order_id == order_id).execution_options(synchronize_session=False)
+        )
+        result = db.execute(
+            delete(Order)
+            .where(Order.id == order_id, Order.status != CANCELLED)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 1:
+            if OrderService._restore_stock(db, quantities):
+                mark_stock_changed(db)
+        elif db.execute(
+            delete(Order).where(Order.id == order_id).execution_options(synchronize_session=False)
+        ).rowcount == 0:
+            db.rollback()
+            raise AppException("Order not found", 404)
         db.commit()
+        order_events.publish(event)
 
     @staticmethod
-    def cancel_order(db: Session, order_id: int) -> Order:
-        """Cancel order and restore stock."""
+    def transition_order(db: Session, order_id: int, status: str) -> Order:
+        """Move an order to ``status``; cancelling also restores stock."""
+        OrderService._apply_transition(db, order_id, status)
+        db.commit()
         order = OrderService.get_order_by_id(db, order_id)
+        OrderService._after_transition(order)
+        return order
 
-        if order.status == 'cancelled':
-            raise AppException("Order is already cancelled", 400)
+    @staticmethod
+    def start_order(db: Session, order_id: int) -> Order:
+        """Mark order as being prepared."""
+        return OrderService.transition_order(db, order_id, PREPARING)
 
-        # Restore stock
-        for item in order.items:
-            menu_item = db.query(MenuItem).filter(MenuItem.id == item.menu_item_id).first()
-            if menu_item and menu_item.stock_quantity is not None:
-                menu_item.stock_quantity += item.quantity
+    @staticmethod
+    def ready_order(db: Session, order_id: int) -> Order:
+        """Mark order as ready to serve."""
+        return OrderService.transition_order(db, order_id, READY)
 
-        order.status = 'cancelled'
-        db.commit()
-        db.refresh(order)
-        return order
+    @staticmethod
+    def cancel_order(db: Session, order_id: int) -> Order:
+        """Cancel order and restore stock."""
+        return OrderService.transition_order(db, order_id, CANCELLED)
 
     @staticmethod
     def complete_order(db: Session, order_id: int) -> Order:
         """Mark order as completed."""
-        order = OrderService.get_order_by_id(db, order_id)
+        return OrderService.transition_order(db, order_id, COMPLETED)
 
-        if order.status == 'completed':
-            raise AppException("Order is already completed", 400)
+    @staticmethod
+    def _apply_transition(db: Session, order_id: int, status: str) -> None:
+        """Change the status with one conditional UPDATE, without committing.
 
-        if order.status == 'cancelled':
-            raise AppException("Cannot complete a cancelled order", 400)
+        The UPDATE only matches an order whose current status may move to
+        ``status``, so when two requests race (e.g. complete and cancel) the
+        database lets exactly one of them through and the other gets a 400.
+        """
+        now = datetime.utcnow()
+        values = {"status": status, "updated_at": now}
+        if status in STATUS_TIMESTAMPS:
+            values[STATUS_TIMESTAMPS[status]] = now
+        result = db.execute(
+            update(Order)
+            .where(Order.id == order_id, Order.status.in_(allowed_sources(status)))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            current = db.query(Order.status).filter(Order.id == order_id).scalar()
+            db.rollback()
+            if current is None:
+                raise AppException("Order not found", 404)
+            if current == status:
+                raise AppException(f"Order is already {status}", 400)
+            raise AppException(f"Cannot change order status from {current} to {status}", 400)
 
-        order.status = 'completed'
-        db.commit()
-        db.refresh(order)
-        return order
+        if status == CANCELLED:
+            if OrderService._restore_stock(db, OrderService._order_quantities(db, order_id)):
+                mark_stock_changed(db)
+
+    @staticmethod
+    def _after_transition(order: Order) -> None:
+        if order.status == CANCELLED:
+            metrics.orders_cancelled_total.inc()
+        order_events.publish_order_event(STATUS_EVENTS[order.status], order)
+
+    @staticmethod
+    def _order_quantities(db: Session, order_id: int) -> Counter:
+        """Quantity ordered per menu item."""
+        quantities: Counter = Counter()
+        for menu_item_id, quantity in db.query(OrderItem.menu_item_id, OrderItem.quantity).filter(
+            OrderItem.order_id == order_id
+        ):
+            quantities[menu_item_id] += quantity
+        return quantities
+
+    @staticmethod
+    def _restore_stock(db: Session, quantities: Counter) -> bool:
+        """Return ``quantities`` to stock-tracked items in one UPDATE."""
+        if not quantities:
+            return False
+        result = db.execute(
+            update(MenuItem)
+            .where(MenuItem.id.in_(quantities), MenuItem.stock_quantity.isnot(None))
+            .values(stock_quantity=MenuItem.stock_quantity + case(dict(quantities), value=MenuItem.id))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
 
     @staticmethod
     def get_order_summary(db: Session) -> dict:
@@ -151,3 +537,69 @@ class OrderService:
             'pending_orders': pending_orders,
             'cancelled_orders': cancelled_orders,
         }
+
+
+class AsyncOrderService:
+    """Async order operations for AsyncSession-based handlers.
+
+    Runs the OrderService logic through AsyncSession.run_sync, so statements
+    go through the async driver on the event loop instead of holding a
+    threadpool thread. Results are converted to response schemas inside the
+    sync call because lazy loads are not possible once back on the loop.
+    """
+
+    @staticmethod
+    async def get_all_orders(
+        db: AsyncSession,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[OrderResponse]:
+        """Get all orders with optional filtering by status."""
+        def run(session: Session) -> List[OrderResponse]:
+            orders = OrderService.get_all_orders(session, status=status, skip=skip, limit=limit)
+            return [OrderResponse.model_validate(order) for order in orders]
+
+        return await db.run_sync(run)
+
+    @staticmethod
+    async def get_order_by_id(db: AsyncSession, order_id: int) -> OrderResponse:
+        """Get order by ID."""
+        def run(session: Session) -> OrderResponse:
+            return OrderResponse.model_validate(OrderService.get_order_by_id(session, order_id))
+
+        return await db.run_sync(run)
+
+    @staticmethod
+    async def create_order(db: AsyncSession, order_create: OrderCreate) -> OrderResponse:
+        """Create new order."""
+        def run(session: Session) -> OrderResponse:
+            return OrderResponse.model_validate(OrderService.create_order(session, order_create))
+
+        return await db.run_sync(run)
+
+    @staticmethod
+    async def create_order_idempotent(
+        db: AsyncSession, order_create: OrderCreate, idempotency_key: str
+    ) -> Tuple[StoredResponse, bool]:
+        """Create an order at most once per Idempotency-Key."""
+        def run(session: Session) -> Tuple[StoredResponse, bool]:
+            return OrderService.create_order_idempotent(session, order_create, idempotency_key)
+
+        return await db.run_sync(run)
+
+    @staticmethod
+    async def get_order_changes(db: AsyncSession, since: Optional[str], limit: int = 100) -> OrderChanges:
+        """Get orders changed after the ``since`` cursor."""
+        def run(session: Session) -> OrderChanges:
+            return OrderService.get_order_changes(session, since, limit)
+
+        return await db.run_sync(run)
+
+    @staticmethod
+    async def create_orders_bulk(db: AsyncSession, bulk: OrderBulkCreate) -> OrderBulkResponse:
+        """Create many orders in one transaction."""
+        def run(session: Session) -> OrderBulkResponse:
+            return OrderService.create_orders_bulk(session, bulk)
+
+        return await db.run_sync(run)
@@ -0,0 +1,146 @@
+"""Base class for in-memory views of orders kept current by order events.
+
+A view is loaded from the database on first use and then updated by the
+order events delivered to this worker. A view ignores an event older than
+the change it already holds for that order, comparing the updated_at
+carried in event ids, since events may arrive out of order.
+
+With one worker and the in-process broker, events carry every order change
+and the view never reads orders again. With several workers (whose changes
+this worker's broker does not see) or a shared broker (which may drop
+events), a view is also rebuilt from the database when it is read more than
+ORDER_VIEWS_RESYNC_SECONDS after its last load; the events delivered while
+the rebuild was reading are replayed on top of it.
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.services import order_events
+
+# Versions kept for orders that left a view, so a late event cannot bring them back
+MAX_TOMBSTONES = 10000
+
+
+def _event_version(event: order_events.OrderEvent) -> Optional[datetime]:
+    """The updated_at of the change an event carries, if its id says."""
+    if event.id is None:
+        return None
+    try:
+        return order_events.parse_event_id(event.id)[0]
+    except ValueError:
+        return None
+
+
+class OrderView:
+    """Loading, periodic resync and event ordering shared by the order views.
+
+    Subclasses hold their state under ``_lock``, keep the orders they hold
+    in an ``_orders`` dict by id, and implement ``_query`` (rows with ``id``
+    and ``updated_at``), ``_reset``, ``_rebuild`` and ``_apply``.
+    """
+
+    def __init__(self, resync_interval: Optional[float] = None):
+        self.resync_interval = resync_interval  # None: follow events only, never rebuild
+        self.loaded = False
+        self._loaded_at = 0.0
+        self._versions: Dict[int, datetime] = {}  # Order id -> updated_at of the change held
+        self._tombstones: "OrderedDict[int, datetime]" = OrderedDict()  # Same, for orders that left
+        self._replay: Optional[List[order_events.OrderEvent]] = None  # Delivered during a load
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+            self._versions = {}
+            self._tombstones = OrderedDict()
+            self.loaded = False
+
+    def apply(self, event: order_events.OrderEvent) -> None:
+        """Update the view from an order event; registered as an order event listener."""
+        if event.order_id is None:
+            return
+        with self._lock:
+            if self._replay is not None:
+                self._replay.append(event)
+            self._apply_if_newer(event)
+
+    def _apply_if_newer(self, event: order_events.OrderEvent) -> None:
+        order_id = event.order_id
+        version = _event_version(event)
+        held = self._versions.get(order_id) or self._tombstones.get(order_id)
+        if version is not None and held is not None and version < held:
+            return  # Delivered after a later change to the same order
+        self._apply(event)
+
+        version = version or held
+        if order_id in self._orders:
+            self._tombstones.pop(order_id, None)
+            if version is not None:
+                self._versions[order_id] = version
+        else:
+            self._versions.pop(order_id, None)
+            if version is not None:
+                self._tombstones[order_id] = version
+                self._tombstones.move_to_end(order_id)
+                if len(self._tombstones) > MAX_TOMBSTONES:
+                    self._tombstones.popitem(last=False)
+
+    def load(self, db: Session) -> None:
+        """Rebuild the view from the database."""
+        with self._load_lock:
+            self._load(db)
+
+    def ensure_loaded(self, db: Session) -> None:
+        """Load the view, or rebuild it when the last load is older than resync_interval (if set)."""
+        if self._is_fresh():
+            return
+        # Readers of a loaded view do not wait for a rebuild already under way
+        if not self._load_lock.acquire(blocking=not self.loaded):
+            return
+        try:
+            if not self._is_fresh():
+                self._load(db)
+        finally:
+            self._load_lock.release()
+
+    def _is_fresh(self) -> bool:
+        if not self.loaded:
+            return False
+        return self.resync_interval is None or time.monotonic() - self._loaded_at < self.resync_interval
+
+    def _load(self, db: Session) -> None:
+        with self._lock:
+            self._replay = []
+        try:
+            rows = self._query(db)
+        except BaseException:
+            with self._lock:
+                self._replay = None
+            raise
+        with self._lock:
+            replay, self._replay = self._replay, None
+            self._reset()
+            self._versions = {row.id: row.updated_at for row in rows}
+            self._rebuild(rows)
+            for event in replay:
+                self._apply_if_newer(event)
+            self.loaded = True
+            self._loaded_at = time.monotonic()
+
+    def _query(self, db: Session) -> Sequence[Any]:
+        raise NotImplementedError
+
+    def _reset(self) -> None:
+        raise NotImplementedError
+
+    def _rebuild(self, rows: Sequence[Any]) -> None:
+        raise NotImplementedError
+
+    def _apply(self, event: order_events.OrderEvent) -> None:
+        raise NotImplementedError
@@ -0,0 +1,116 @@
+"""Server-side order pricing from an in-memory index of the menu catalog."""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.core.exceptions import AppException
+from app.schemas.menu import MenuItemResponse, MenuOptionResponse
+from app.schemas.order import OrderItemCreate
+
+
+class PricedLine:
+    """An order line with its price computed from the menu."""
+
+    __slots__ = ("menu_item_id", "name", "quantity", "unit_price", "options_text", "remark")
+
+    def __init__(
+        self,
+        menu_item_id: int,
+        name: str,
+        quantity: int,
+        unit_price: float,
+        options_text: Optional[str],
+        remark: Optional[str],
+    ):
+        self.menu_item_id = menu_item_id
+        self.name = name
+        self.quantity = quantity
+        self.unit_price = unit_price
+        self.options_text = options_text
+        self.remark = remark
+
+    @property
+    def line_total(self) -> float:
+        return round(self.unit_price * self.quantity, 2)
+
+
+class PricingIndex:
+    """Menu prices and option rules keyed by id, built from one catalog version.
+
+    The menu catalog cache builds one per menu version, so pricing an order
+    needs no database queries.
+    """
+
+    def __init__(self, items: Sequence[MenuItemResponse]):
+        self.items: Dict[int, MenuItemResponse] = {item.id: item for item in items}
+        # choice id -> (option id, choice name, price modifier)
+        self.choices: Dict[int, Tuple[int, str, float]] = {}
+        for item in items:
+            for option in item.options:
+                for choice in option.choices:
+                    self.choices[choice.id] = (option.id, choice.name, choice.price_modifier or 0.0)
+
+    def covers(self, lines: Sequence[OrderItemCreate]) -> bool:
+        """Whether every menu item and option choice in ``lines`` is indexed."""
+        return all(
+            line.menu_item_id in self.items
+            and all(choice_id in self.choices for choice_id in line.option_choice_ids)
+            for line in lines
+        )
+
+    def price_line(self, line: OrderItemCreate) -> PricedLine:
+        """Validate one order line's choices and compute its unit price."""
+        item = self.items.get(line.menu_item_id)
+        if item is None:
+            raise AppException(f"Menu item {line.menu_item_id} not found", 400)
+        if not item.is_available:
+            raise AppException(f"Menu item '{item.name}' is not available", 400)
+
+        if len(set(line.option_choice_ids)) != len(line.option_choice_ids):
+            raise AppException(f"Duplicate option choices for '{item.name}'", 400)
+
+        item_option_ids = {option.id for option in item.options}
+        selected: Dict[int, List[str]] = {option_id: [] for option_id in item_option_ids}
+        unit_price = item.price
+        for choice_id in line.option_choice_ids:
+            choice = self.choices.get(choice_id)
+            if choice is None or choice[0] not in item_option_ids:
+                raise AppException(f"Option choice {choice_id} is not available for '{item.name}'", 400)
+            option_id, choice_name, modifier = choice
+            selected[option_id].append(choice_name)
+            unit_price += modifier
+
+        descriptions = []
+        for option in sorted(item.options, key=lambda o: (o.display_order, o.id)):
+            names = selected[option.id]
+            _check_selection_count(item.name, option, len(names))
+            if names:
+                descriptions.append(f"{option.name}: {', '.join(names)}")
+
+        return PricedLine(
+            menu_item_id=item.id,
+            name=item.name,
+            quantity=line.quantity,
+            unit_price=round(unit_price, 2),
+            options_text="; ".join(descriptions) if descriptions else line.options_text,
+            remark=line.remark,
+        )
+
+    def price_order(self, lines: Sequence[OrderItemCreate]) -> Tuple[List[PricedLine], float]:
+        """Price every line; return the priced lines and the order total."""
+        priced = [self.price_line(line) for line in lines]
+        return priced, round(sum(line.line_total for line in priced), 2)
+
+
+def _check_selection_count(item_name: str, option: MenuOptionResponse, count: int) -> None:
+    minimum = option.min_selection or 0
+    if option.is_required:
+        minimum = max(minimum, 1)
+    maximum = option.max_selection
+    if option.option_type == "single":
+        maximum = 1 if maximum is None else min(maximum, 1)
+
+    if count < minimum:
+        if minimum == 1:
+            raise AppException(f"'{option.name}' is required for '{item_name}'", 400)
+        raise AppException(f"Select at least {minimum} of '{option.name}' for '{item_name}'", 400)
+    if maximum is not None and count > maximum:
+        raise AppException(f"Select at most {maximum} of '{option.name}' for '{item_name}'", 400)
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import IntegrityError
@@ -7,14 +8,22 @@ from contextlib import asynccontextmanager
 from app.core.config import get_settings
 from app.core.logging import setup_logging, get_logger
 from app.core.middleware import log_requests
+from app.core import metrics
+from app.core.profiling import ProfilingMiddleware
+from app.core.compression import CompressionMiddleware, no_compression
 from app.core.exceptions import (
     AppException,
     app_exception_handler,
     validation_exception_handler,
     integrity_error_handler
 )
-from app.db.database import engine, Base
-from app.api import user_router, menu_router, orders_router, auth_router, admin_router, superadmin_router, db_admin_router
+from app.db.database import engine, Base, SessionLocal, dispose_async_engine
+from app.db import startup
+from app.services.menu_cache import menu_cache
+from app.services.kitchen_queue import kitchen_queue
+from app.services.open_tables import open_tables
+from app.api import user_router, menu_router, orders_router, kitchen_router, auth_router, admin_router
+from app.api.lazy import LazyRouter, include_lazy_routers
 
 # Setup logging
 setup_logging()
@@ -22,17 +31,40 @@ logger = get_logger(__name__)
 
 settings = get_settings()
 
+metrics.register_pool_metrics(engine)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
-    # Startup: Create database tables
     logger.info("Starting application...")
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created successfully")
+
+    # Startup: trust Alembic in production, create tables directly in development
+    if startup.resolve_schema_mode() == "migrations":
+        startup.verify_schema_revision(engine)
+    else:
+        startup.create_schema(engine, Base.metadata)
+
+    warmed = startup.warm_pool(engine, min(settings.DB_POOL_WARM_CONNECTIONS, settings.db_pool_size))
+    logger.info(f"Connection pool warmed with {warmed} connections")
+
+    if settings.WARM_MENU_CACHE and startup.schema_status["ok"]:
+        try:
+            with SessionLocal() as db:
+                menu_cache.warm(db)
+        except Exception as e:
+            logger.warning(f"Menu cache warm-up failed: {e}")
+    if startup.schema_status["ok"]:
+        try:
+            with SessionLocal() as db:
+                kitchen_queue.load(db)
+                open_tables.load(db)
+        except Exception as e:
+            logger.warning(f"Order views load failed: {e}")
     yield
     # Shutdown
     logger.info("Shutting down application...")
+    await dispose_async_engine()
 
 
 app = FastAPI(
@@ -51,6 +83,10 @@ app.add_exception_handler(IntegrityError, integrity_error_handler)
 
 # Middleware
 app.middleware("http")(log_requests)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
 
 # CORS Middleware - Must be added BEFORE routes
 app.add_middleware(
@@ -82,11 +118,53 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/live", tags=["Health"])
+@no_compression
+def liveness_check():
+    """Liveness probe: the process is up and serving requests."""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready", tags=["Health"])
+@no_compression
+def readiness_check():
+    """Readiness probe: the database is reachable and the schema is as expected."""
+    db_error = startup.check_database(engine)
+    schema = startup.schema_status
+    ready = db_error is None and schema["ok"]
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "database": {"connected": db_error is None, "error": db_error},
+            "schema": schema,
+            "menu_cache_version": menu_cache.version,
+        },
+    )
+
+
+# Metrics endpoint
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+    def get_metrics():
+        """Expose application metrics in Prometheus text format."""
+        return PlainTextResponse(
+            metrics.registry.render(),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+
 # Include routers
 app.include_router(auth_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(user_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(menu_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(orders_router.router, prefix=settings.API_V1_PREFIX)
+app.include_router(kitchen_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(admin_router.router, prefix=settings.API_V1_PREFIX)
-app.include_router(superadmin_router.router, prefix=settings.API_V1_PREFIX)
-app.include_router(db_admin_router.router, prefix=settings.API_V1_PREFIX)
\ No newline at end of file
+
+# Rarely used admin routers are imported on first request to keep cold start fast
+lazy_routers = [
+    LazyRouter(app, "app.api.superadmin_router", "/superadmin", prefix=settings.API_V1_PREFIX).install(),
+    LazyRouter(app, "app.api.db_admin_router", "/db-admin", prefix=settings.API_V1_PREFIX).install(),
+]
+include_lazy_routers(app, lazy_routers)
@@ -0,0 +1,104 @@
+"""
+Benchmark of response compression CPU cost against bytes saved.
+
+Compresses typical JSON payloads (a single order, an order page, the menu
+catalog and a sales report) with gzip and, when installed, brotli at several
+levels, and reports compression time, output size and the ratio to the
+uncompressed body. Use it to pick COMPRESSION_GZIP_LEVEL,
+COMPRESSION_BROTLI_QUALITY and COMPRESSION_MIN_SIZE.
+
+Usage:
+    python scripts/benchmark_compression.py --repeat 50
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("LOG_TO_FILE", "false")
+
+from benchmark_serialization import build_orders  # noqa: E402
+
+GZIP_LEVELS = (1, 6, 9)
+BROTLI_QUALITIES = (1, 4, 11)
+
+
+def build_payloads():
+    from app.core.responses import ORJSONResponse, serialize
+    from app.schemas.menu import MenuItemResponse
+    from app.schemas.order import OrderResponse
+
+    orders = build_orders(100, 3)
+    menu = [
+        {
+            "id": i, "name": f"เมนู {i}", "category": f"Category {i % 8}", "price": 40.0 + i,
+            "description": "Freshly made to order", "image_url": f"https://cdn.example.com/menu/{i}.jpg",
+            "is_available": True, "display_order": i, "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-01T00:00:00",
+            "options": [{
+                "id": i, "menu_item_id": i, "name": "Sweetness", "is_required": False,
+                "max_selections": 1, "display_order": 0,
+                "choices": [
+                    {"id": i * 10 + j, "option_id": i, "name": f"Level {j}", "price_adjustment": 0.0,
+                     "display_order": j}
+                    for j in range(4)
+                ],
+            }],
+        }
+        for i in range(120)
+    ]
+    report = {
+        "period": "2024-01",
+        "daily": [
+            {"date": f"2024-01-{d:02d}", "orders": 100 + d, "revenue": 4500.0 + d * 10} for d in range(1, 32)
+        ],
+        "top_items": [{"name": f"เมนู {i}", "quantity": 500 - i, "revenue": 9000.0 - i} for i in range(20)],
+    }
+    return {
+        "order": serialize(OrderResponse, orders[0]),
+        "orders_100": serialize(List[OrderResponse], orders),
+        "menu_120": ORJSONResponse(None).render(menu),
+        "report": ORJSONResponse(None).render(report),
+    }
+
+
+def codecs():
+    from app.core.compression import brotli, make_encoder
+
+    for level in GZIP_LEVELS:
+        yield f"gzip-{level}", lambda body, level=level: make_encoder("gzip", level, 0).compress(body, final=True)
+    if brotli is not None:
+        for quality in BROTLI_QUALITIES:
+            yield f"br-{quality}", lambda body, q=quality: make_encoder("br", 0, q).compress(body, final=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    payloads = build_payloads()
+    header = f"{'payload':<12} {'codec':<8} {'bytes':>9} {'compressed':>11} {'ratio':>7} {'median us':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, body in payloads.items():
+        for codec, compress in codecs():
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                compressed = compress(body)
+                timings.append(time.perf_counter() - start)
+            print(
+                f"{name:<12} {codec:<8} {len(body):>9} {len(compressed):>11} "
+                f"{len(compressed) / len(body):>7.2f} {statistics.median(timings) * 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Load benchmark comparing the sync (threadpool) and async (AsyncSession) database modes.
+
+Each mode runs in its own subprocess with DB_ASYNC set accordingly, drives the
+app in-process through httpx's ASGI transport with many concurrent clients, and
+reports throughput and latency percentiles for the high-concurrency endpoints:
+menu reads, the pending order board and order creation.
+
+Point DATABASE_URL at PostgreSQL for meaningful numbers; with SQLite both
+modes serialize on the database file.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/benchmark_db_modes.py --requests 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SCENARIOS = ("menu", "board", "create")
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_scenario(client, scenario, menu_item_id, total, concurrency):
+    """Fire ``total`` requests for one scenario with ``concurrency`` in flight."""
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_request():
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            if scenario == "menu":
+                response = await client.get("/api/v1/menu/items")
+            elif scenario == "board":
+                response = await client.get("/api/v1/orders", params={"status": "pending", "limit": 50})
+            else:
+                response = await client.post("/api/v1/orders", json={
+                    "total": 45,
+                    "table_number": 1,
+                    "items": [{"menu_item_id": menu_item_id, "name": "Bench Tea", "quantity": 1, "price": 45}],
+                })
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+    return {
+        "requests": total,
+        "errors": errors,
+        "rps": round(total / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 2),
+    }
+
+
+async def worker(total, concurrency):
+    """Benchmark the current process's mode (DB_ASYNC read from the environment)."""
+    import logging
+
+    import httpx
+
+    from app.db.database import Base, SessionLocal, engine, dispose_async_engine
+    from app.models import MenuItem
+    from main import app
+
+    logging.disable(logging.INFO)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        item = db.query(MenuItem).filter(MenuItem.name == "Bench Tea").first()
+        if not item:
+            item = MenuItem(name="Bench Tea", category="Benchmark", price=45)
+            db.add(item)
+            db.commit()
+        menu_item_id = item.id
+    finally:
+        db.close()
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up connections and caches
+        await run_scenario(client, "menu", menu_item_id, min(50, total), concurrency)
+        for scenario in SCENARIOS:
+            results[scenario] = await run_scenario(client, scenario, menu_item_id, total, concurrency)
+    await dispose_async_engine()
+    print(json.dumps(results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=100, help="Requests in flight")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        asyncio.run(worker(args.requests, args.concurrency))
+        return
+
+    print(f"Benchmarking {args.requests} requests per scenario, concurrency {args.concurrency}\n")
+    header = f"{'mode':<6} {'scenario':<8} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"
+    print(header)
+    print("-" * len(header))
+    for mode, flag in (("sync", "false"), ("async", "true")):
+        env = {**os.environ, "DB_ASYNC": flag, "LOG_TO_FILE": "false"}
+        output = subprocess.run(
+            [sys.executable, __file__, "--worker",
+             "--requests", str(args.requests), "--concurrency", str(args.concurrency)],
+            env=env, capture_output=True, text=True,
+        )
+        if output.returncode != 0:
+            print(f"{mode} run failed:\n{output.stderr}")
+            continue
+        results = json.loads(output.stdout.strip().splitlines()[-1])
+        for scenario in SCENARIOS:
+            r = results[scenario]
+            print(
+                f"{mode:<6} {scenario:<8} {r['rps']:>9} {r['p50_ms']:>9} "
+                f"{r['p95_ms']:>9} {r['p99_ms']:>9} {r['errors']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
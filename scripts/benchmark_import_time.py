@@ -0,0 +1,67 @@
+"""
+Measure application cold-start import time with ``python -X importtime``.
+
+Imports ``main`` in fresh interpreters, reports the median cumulative import
+time and the slowest modules, and optionally fails when the median exceeds a
+budget (used by tests/test_cold_start.py).
+
+Usage:
+    python scripts/benchmark_import_time.py --runs 5 --top 20
+    python scripts/benchmark_import_time.py --budget-ms 1500
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def measure_import(module: str = "main") -> dict:
+    """Import ``module`` in a fresh interpreter; return {module: (self_us, cumulative_us)}."""
+    env = {**os.environ, "LOG_TO_FILE": "false"}
+    env.setdefault("DATABASE_URL", "sqlite:///./importtime.db")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreter runs")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if median exceeds this")
+    args = parser.parse_args()
+
+    runs = [measure_import() for _ in range(args.runs)]
+    totals_ms = [run["main"][1] / 1000 for run in runs]
+    median_ms = statistics.median(totals_ms)
+
+    print(f"import main: median {median_ms:.1f} ms over {args.runs} runs "
+          f"(min {min(totals_ms):.1f}, max {max(totals_ms):.1f})\n")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    last = runs[-1]
+    for name, (self_us, cumulative_us) in sorted(last.items(), key=lambda kv: kv[1][0], reverse=True)[:args.top]:
+        print(f"{self_us / 1000:>9.1f} {cumulative_us / 1000:>9.1f}  {name}")
+
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        print(f"\nCold-start budget exceeded: {median_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
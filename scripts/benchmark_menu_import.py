@@ -0,0 +1,98 @@
+"""
+Benchmark of bulk menu import against creating items one at a time.
+
+Builds a catalog of --items menu items over 20 options, then times against
+a fresh database:
+
+* the bulk import (MenuImportService.import_catalog), first creating and
+  then re-importing to update every record, and the export;
+* MenuService.create_menu_item for a --sample of items (a MAX query and a
+  commit per item), extrapolated to the full catalog.
+
+Uses a temporary SQLite file unless DATABASE_URL is set.
+
+Usage:
+    python scripts/benchmark_menu_import.py --items 10000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+_tmpdir = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmpdir}/benchmark_menu.db")
+os.environ.setdefault("LOG_TO_FILE", "false")
+
+OPTIONS = 20
+
+
+def build_catalog(items: int):
+    from app.schemas.menu import MenuCatalogFile
+
+    return MenuCatalogFile.model_validate({
+        "options": [
+            {"name": f"Option {o}", "choices": [{"name": f"Choice {c}", "price_modifier": c * 5} for c in range(4)]}
+            for o in range(OPTIONS)
+        ],
+        "items": [
+            {
+                "name": f"เมนู {i}", "category": f"Category {i % 25}", "price": 40 + i % 200,
+                "description": "Freshly made to order", "stock_quantity": 100,
+                "options": [f"Option {i % OPTIONS}", f"Option {(i + 7) % OPTIONS}"],
+            }
+            for i in range(items)
+        ],
+    })
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<38} {elapsed:>8.2f}s")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--sample", type=int, default=200, help="Items created one at a time")
+    args = parser.parse_args()
+
+    from app.db.database import Base, SessionLocal, engine
+    from app.models.menu import MenuOption
+    from app.schemas.menu import MenuItemCreate
+    from app.services.menu_import import MenuImportService
+    from app.services.menu_service import MenuService
+
+    Base.metadata.create_all(bind=engine)
+    catalog = build_catalog(args.items)
+    print(f"Catalog: {args.items} items, {OPTIONS} options on {engine.url.drivername}\n")
+
+    db = SessionLocal()
+    try:
+        timed("bulk import (create)", lambda: MenuImportService.import_catalog(db, catalog))
+        timed("bulk import (update all)", lambda: MenuImportService.import_catalog(db, catalog))
+        timed("export", lambda: MenuImportService.export_catalog(db))
+
+        option_ids = [option_id for (option_id,) in db.query(MenuOption.id).limit(2)]
+
+        def create_one_by_one():
+            for i in range(args.sample):
+                MenuService.create_menu_item(db, MenuItemCreate(
+                    name=f"Single {i}", category=f"Category {i % 25}", price=50, option_ids=option_ids,
+                ))
+
+        _, elapsed = timed(f"create_menu_item x {args.sample}", create_one_by_one)
+        print(f"{f'  extrapolated to {args.items} items':<38} {elapsed / args.sample * args.items:>8.2f}s")
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+if __name__ == "__main__":
+    main()
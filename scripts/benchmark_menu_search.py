@@ -0,0 +1,118 @@
+"""
+Benchmark of the in-memory menu search index.
+
+Generates --items menu items with mixed Thai/English names and times:
+
+* building the index from scratch, and re-syncing after --changes items
+  are edited (the incremental path taken on each menu version);
+* search latency (median and p95) over a mix of Thai, English, partial and
+  misspelled queries, against a plain substring scan of the same catalog.
+
+Runs without a database.
+
+Usage:
+    python scripts/benchmark_menu_search.py --items 50000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("LOG_TO_FILE", "false")
+
+# Thai words and their English names, combined three at a time into item names
+THAI = [
+    "ผัด", "ไทย", "ต้ม", "ยำ", "กุ้ง", "ไก่", "หมู", "ข้าว", "แกง", "เขียวหวาน",
+    "กะเพรา", "ทะเล", "น้ำ", "ชา", "เย็น", "เนื้อ", "ปลา", "หมึก", "ไข่", "เต้าหู้",
+    "มะม่วง", "เหนียว", "ส้มตำ", "ลาบ", "ทอด", "ย่าง", "นึ่ง", "พริก", "กระเทียม", "มะพร้าว",
+]
+ENGLISH = [
+    "Pad", "Thai", "Tom", "Yum", "Shrimp", "Chicken", "Pork", "Rice", "Curry", "Green",
+    "Basil", "Seafood", "Soup", "Tea", "Iced", "Beef", "Fish", "Squid", "Egg", "Tofu",
+    "Mango", "Sticky", "Papaya", "Larb", "Fried", "Grilled", "Steamed", "Chili", "Garlic", "Coconut",
+]
+CATEGORIES = ["Noodles", "Rice", "Curry", "Soups", "Salads", "Drinks", "Desserts", "Appetizers"]
+QUERIES = ["pad thai", "ผัดไทย", "กะเพรา", "chick", "currry", "tom yum", "ต้มยำกุ้ง", "iced tea", "ชาเย็น", "seafod"]
+
+
+def build_items(count: int, seed: int = 7):
+    from app.schemas.menu import MenuItemResponse
+
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        words = rng.sample(range(len(THAI)), 3)
+        items.append(MenuItemResponse(
+            id=i + 1,
+            name="".join(THAI[w] for w in words) + " " + " ".join(ENGLISH[w] for w in words) + f" {i}",
+            category=rng.choice(CATEGORIES),
+            price=40 + i % 200,
+            image_url=None,
+            description=f"House special number {i}",
+            is_available=True,
+            stock_quantity=None,
+            prep_time=10,
+            is_recommended=i % 20 == 0,
+            display_order=i,
+            options=[],
+        ))
+    return items
+
+
+def latencies(func, queries, rounds):
+    samples = []
+    for _ in range(rounds):
+        for query in queries:
+            start = time.perf_counter()
+            func(query)
+            samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--changes", type=int, default=100, help="Items edited before the incremental sync")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    from app.services.menu_search import MenuSearchIndex, normalize
+
+    items = build_items(args.items)
+    print(f"Catalog: {args.items} items\n")
+
+    index = MenuSearchIndex()
+    start = time.perf_counter()
+    index.sync(items)
+    print(f"{'full build':<30} {time.perf_counter() - start:>9.2f}s")
+
+    edited = list(items)
+    for i in range(args.changes):
+        edited[i] = edited[i].model_copy(update={"description": f"Updated special {i}"})
+    start = time.perf_counter()
+    reindexed = index.sync(edited)
+    print(f"{f'incremental sync ({reindexed} items)':<30} {time.perf_counter() - start:>9.2f}s\n")
+
+    def scan(query):
+        needle = normalize(query)
+        return [item for item in items if needle in normalize(item.name) or needle in normalize(item.description)][:20]
+
+    print(f"{'':<30} {'median':>9} {'p95':>9}")
+    for label, func in (("index search", index.search), ("substring scan", scan)):
+        median, p95 = latencies(func, QUERIES, args.rounds)
+        print(f"{label:<30} {median:>7.2f}ms {p95:>7.2f}ms")
+
+    print("\nSample results:")
+    for query in QUERIES[:5]:
+        print(f"  {query!r}: {[item.name for item in index.search(query, limit=3)]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Microbenchmark of response serialization for a page of orders.
+
+Builds N transient Order rows (no database) with a few items each and times
+the ways an endpoint can turn them into JSON bytes:
+
+* jsonable_encoder  - jsonable_encoder() + json.dumps (routes without a response model)
+* stdlib            - validate to OrderResponse, model_dump(mode="json") + json.dumps
+                      (response_model with a custom JSONResponse class)
+* orjson            - validate, model_dump() + orjson.dumps (ORJSONResponse)
+* typeadapter       - TypeAdapter(List[OrderResponse]) validate + dump_json, the
+                      pre-serialized path (and FastAPI's default response_model path)
+* dump_only         - dump_json of already validated models (cached results)
+
+Usage:
+    python scripts/benchmark_serialization.py --orders 1000 --items 3 --repeat 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("LOG_TO_FILE", "false")
+
+
+def build_orders(count, items_per_order):
+    from app.models import Order, OrderItem
+
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    orders = []
+    for i in range(1, count + 1):
+        order = Order(
+            id=i, total=45.0 * items_per_order, status="pending", table_number=i % 30,
+            created_at=now + timedelta(seconds=i), updated_at=now + timedelta(seconds=i),
+        )
+        order.items = [
+            OrderItem(
+                id=i * 10 + j, order_id=i, menu_item_id=j + 1, name=f"ชาไทย {j}",
+                quantity=1 + j % 2, price=45.0, options_text="หวานน้อย, ใส่ไข่มุก", remark=None,
+            )
+            for j in range(items_per_order)
+        ]
+        orders.append(order)
+    return orders
+
+
+def time_it(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), min(timings), len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--items", type=int, default=3, help="Items per order")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    from fastapi.encoders import jsonable_encoder
+    from pydantic import TypeAdapter
+
+    from app.core.responses import ORJSONResponse
+    from app.schemas.order import OrderResponse
+
+    orders = build_orders(args.orders, args.items)
+    adapter = TypeAdapter(List[OrderResponse])
+    validated = adapter.validate_python(orders, from_attributes=True)
+
+    def validate():
+        return [OrderResponse.model_validate(order) for order in orders]
+
+    cases = {
+        "jsonable_encoder": lambda: json.dumps(jsonable_encoder(validate())).encode(),
+        "stdlib": lambda: json.dumps([m.model_dump(mode="json") for m in validate()]).encode(),
+        "orjson": lambda: ORJSONResponse(None).render([m.model_dump() for m in validate()]),
+        "typeadapter": lambda: adapter.dump_json(adapter.validate_python(orders, from_attributes=True)),
+        "dump_only": lambda: adapter.dump_json(validated),
+    }
+
+    print(f"Serializing {args.orders} orders x {args.items} items, median of {args.repeat} runs\n")
+    header = f"{'method':<18} {'median ms':>10} {'min ms':>10} {'bytes':>10} {'vs stdlib':>10}"
+    print(header)
+    print("-" * len(header))
+    results = {name: time_it(fn, args.repeat) for name, fn in cases.items()}
+    baseline = results["stdlib"][0]
+    for name, (median, best, size) in results.items():
+        print(
+            f"{name:<18} {median * 1000:>10.2f} {best * 1000:>10.2f} {size:>10} "
+            f"{baseline / median:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
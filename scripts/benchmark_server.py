@@ -0,0 +1,156 @@
+"""
+Load benchmark comparing server configurations.
+
+Each configuration starts the production launcher (python -m app.core.server)
+on a local port with its own backend and worker count, waits for
+/health/live, drives it over real HTTP with many concurrent clients and
+reports throughput and latency percentiles for menu reads and the health
+probe, then stops the server with SIGTERM.
+
+Configurations are given as BACKEND:WORKERS, e.g. uvicorn:1 gunicorn:4.
+Point DATABASE_URL at PostgreSQL for meaningful numbers.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/benchmark_server.py uvicorn:1 uvicorn:4 gunicorn:4
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PATHS = {
+    "menu": "/api/v1/menu/items",
+    "health": "/health/live",
+}
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def start_server(backend, workers, port):
+    env = {
+        **os.environ,
+        "SERVER_BACKEND": backend,
+        "WEB_CONCURRENCY": str(workers),
+        "PORT": str(port),
+        "HOST": "127.0.0.1",
+        "LOG_TO_FILE": "false",
+        "LOG_LEVEL": "WARNING",
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "app.core.server"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+
+
+async def wait_until_live(client, process, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(process.stderr.read().decode(errors="replace"))
+        try:
+            if (await client.get(PATHS["health"])).status_code == 200:
+                return
+        except Exception:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("Server did not become live in time")
+
+
+async def run_scenario(client, path, total, concurrency):
+    """Fire ``total`` requests at ``path`` with ``concurrency`` in flight."""
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_request():
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+    return {
+        "rps": round(total / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 2),
+        "errors": errors,
+    }
+
+
+async def benchmark(backend, workers, port, total, concurrency):
+    import httpx
+
+    process = start_server(backend, workers, port)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30.0
+        ) as client:
+            await wait_until_live(client, process)
+            # Let every worker start up and warm its caches
+            await run_scenario(client, PATHS["menu"], min(200, total), concurrency)
+            return {
+                name: await run_scenario(client, path, total, concurrency)
+                for name, path in PATHS.items()
+            }
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("configs", nargs="*", default=["uvicorn:1", "uvicorn:2"],
+                        help="Configurations as BACKEND:WORKERS")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=100, help="Requests in flight")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"Benchmarking {args.requests} requests per scenario, concurrency {args.concurrency}\n")
+    header = f"{'config':<12} {'scenario':<8} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"
+    print(header)
+    print("-" * len(header))
+    for config in args.configs:
+        backend, _, workers = config.partition(":")
+        try:
+            results = asyncio.run(
+                benchmark(backend, int(workers or 1), args.port, args.requests, args.concurrency)
+            )
+        except RuntimeError as e:
+            print(f"{config} failed:\n{e}")
+            continue
+        for scenario, r in results.items():
+            print(
+                f"{config:<12} {scenario:<8} {r['rps']:>9} {r['p50_ms']:>9} "
+                f"{r['p95_ms']:>9} {r['p99_ms']:>9} {r['errors']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
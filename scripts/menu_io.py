@@ -0,0 +1,81 @@
+"""
+Import or export the menu catalog directly against the database.
+
+JSON files hold the whole catalog (options with choices, and items that
+reference options by name); CSV files hold menu items only. The format is
+taken from the file extension unless --format is given. Imports create or
+update records in one transaction; see POST /api/v1/menu/import.
+
+Usage:
+    python scripts/menu_io.py export menu.json
+    python scripts/menu_io.py export --format csv menu_items.csv
+    python scripts/menu_io.py import menu.json
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.db.database import SessionLocal  # noqa: E402
+from app.schemas.menu import MenuCatalogFile  # noqa: E402
+from app.services.menu_import import (  # noqa: E402
+    MenuImportService,
+    items_to_csv,
+    parse_catalog_json,
+    parse_items_csv,
+)
+
+
+def file_format(path: Path, fmt: str) -> str:
+    return fmt or ("csv" if path.suffix.lower() == ".csv" else "json")
+
+
+def export_menu(path: Path, fmt: str) -> None:
+    db = SessionLocal()
+    try:
+        catalog = MenuImportService.export_catalog(db)
+    finally:
+        db.close()
+    if fmt == "csv":
+        path.write_text(items_to_csv(catalog.items), encoding="utf-8")
+    else:
+        path.write_text(catalog.model_dump_json(indent=2), encoding="utf-8")
+    print(f"✓ Exported {len(catalog.options)} options and {len(catalog.items)} items to {path}")
+
+
+def import_menu(path: Path, fmt: str) -> None:
+    if fmt == "csv":
+        catalog = MenuCatalogFile(items=parse_items_csv(path.read_text(encoding="utf-8-sig")))
+    else:
+        catalog = parse_catalog_json(path.read_bytes())
+
+    start = time.perf_counter()
+    db = SessionLocal()
+    try:
+        result = MenuImportService.import_catalog(db, catalog)
+    finally:
+        db.close()
+    print(f"✓ Imported {path} in {time.perf_counter() - start:.2f}s")
+    for field, count in result.model_dump().items():
+        print(f"  {field}: {count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=("import", "export"))
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=("json", "csv"))
+    args = parser.parse_args()
+
+    fmt = file_format(args.path, args.format)
+    if args.command == "export":
+        export_menu(args.path, fmt)
+    else:
+        import_menu(args.path, fmt)
+
+
+if __name__ == "__main__":
+    main()
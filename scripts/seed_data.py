@@ -9,9 +9,8 @@ import json
 BASE_URL = "http://localhost:8000/api/v1"
 
 
-def seed_menu_options():
-    """Create menu options (customizations) for menu items."""
-    print("Creating menu options...")
+def menu_options():
+    """Menu options (customizations) for menu items."""
 
     # Sweetness Level Option
     sweetness_option = {
@@ -48,10 +47,6 @@ def seed_menu_options():
         ],
     }
 
-    response = requests.post(f"{BASE_URL}/menu/options", json=sweetness_option)
-    sweetness_id = response.json()["id"] if response.status_code == 201 else 1
-    print(f"✓ Sweetness option created (ID: {sweetness_id})")
-
     # Spiciness Level Option
     spice_option = {
         "name": "Spiciness Level",
@@ -93,10 +88,6 @@ def seed_menu_options():
         ],
     }
 
-    response = requests.post(f"{BASE_URL}/menu/options", json=spice_option)
-    spice_id = response.json()["id"] if response.status_code == 201 else 2
-    print(f"✓ Spiciness option created (ID: {spice_id})")
-
     # Protein Option (Multiple Choice)
     protein_option = {
         "name": "Protein",
@@ -138,16 +129,15 @@ def seed_menu_options():
         ],
     }
 
-    response = requests.post(f"{BASE_URL}/menu/options", json=protein_option)
-    protein_id = response.json()["id"] if response.status_code == 201 else 3
-    print(f"✓ Protein option created (ID: {protein_id})")
+    return [sweetness_option, spice_option, protein_option]
 
-    return [sweetness_id, spice_id, protein_id]
 
+def seed_menu():
+    """Create menu options and items with one bulk import request."""
+    print("Creating menu...")
 
-def seed_menu_items(option_ids):
-    """Create menu items."""
-    print("\nCreating menu items...")
+    options = menu_options()
+    option_names = [option["name"] for option in options]
 
     menu_items = [
         {
@@ -161,7 +151,7 @@ def seed_menu_items(option_ids):
             "prep_time": 10,
             "is_recommended": True,
             "display_order": 1,
-            "option_ids": option_ids,
+            "options": option_names,
         },
         {
             "name": "Green Curry",
@@ -174,7 +164,7 @@ def seed_menu_items(option_ids):
             "prep_time": 15,
             "is_recommended": True,
             "display_order": 2,
-            "option_ids": option_ids,
+            "options": option_names,
         },
         {
             "name": "Massaman Curry",
@@ -187,7 +177,7 @@ def seed_menu_items(option_ids):
             "prep_time": 15,
             "is_recommended": False,
             "display_order": 3,
-            "option_ids": option_ids,
+            "options": option_names,
         },
         {
             "name": "Tom Yum Soup",
@@ -200,7 +190,7 @@ def seed_menu_items(option_ids):
             "prep_time": 12,
             "is_recommended": True,
             "display_order": 1,
-            "option_ids": option_ids,
+            "options": option_names,
         },
         {
             "name": "Larb",
@@ -213,7 +203,7 @@ def seed_menu_items(option_ids):
             "prep_time": 10,
             "is_recommended": False,
             "display_order": 2,
-            "option_ids": option_ids,
+            "options": option_names,
         },
         {
             "name": "Spring Rolls",
@@ -226,7 +216,7 @@ def seed_menu_items(option_ids):
             "prep_time": 8,
             "is_recommended": True,
             "display_order": 1,
-            "option_ids": [],
+            "options": [],
         },
         {
             "name": "Satay",
@@ -239,60 +229,70 @@ def seed_menu_items(option_ids):
             "prep_time": 12,
             "is_recommended": True,
             "display_order": 2,
-            "option_ids": option_ids,
+            "options": option_names,
         },
     ]
 
-    created_items = []
-    for item in menu_items:
-        response = requests.post(f"{BASE_URL}/menu/items", json=item)
-        if response.status_code == 201:
-            created_item = response.json()
-            created_items.append(created_item["id"])
-            print(f"✓ {item['name']} created (ID: {created_item['id']})")
-        else:
-            print(f"✗ Failed to create {item['name']}: {response.text}")
+    response = requests.post(f"{BASE_URL}/menu/import", json={"options": options, "items": menu_items})
+    if response.status_code != 200:
+        print(f"✗ Failed to import menu: {response.text}")
+        return []
+    result = response.json()
+    print(f"✓ {result['options_created']} options and {result['items_created']} items created "
+          f"({result['options_updated']} options and {result['items_updated']} items updated)")
+
+    ids = {
+        (item["category"], item["name"]): item["id"]
+        for item in requests.get(f"{BASE_URL}/menu/items", params={"limit": 1000}).json()
+    }
+    return [ids[(item["category"], item["name"])] for item in menu_items]
 
-    return created_items
+
+def pick_choices(item_id, choice_names):
+    """Return option choice ids for an item: the named choices, plus a default for required options."""
+    item = requests.get(f"{BASE_URL}/menu/items/{item_id}").json()
+    choice_ids = []
+    for option in item.get("options", []):
+        picked = [
+            c["id"] for c in option["choices"]
+            if any(c["name"] == name or c["name"].endswith(f"({name})") for name in choice_names)
+        ]
+        if not picked and option["is_required"] and option["choices"]:
+            default = next((c for c in option["choices"] if c["is_default"]), option["choices"][0])
+            picked = [default["id"]]
+        choice_ids.extend(picked[:1] if option["option_type"] == "single" else picked)
+    return choice_ids
 
 
 def seed_sample_orders(item_ids):
-    """Create sample orders."""
+    """Create sample orders. Prices and totals are computed by the server."""
     print("\nCreating sample orders...")
 
     orders = [
         {
             "table_number": 1,
-            "total": 250.0,
             "items": [
                 {
                     "menu_item_id": item_ids[0] if len(item_ids) > 0 else 1,
-                    "name": "Pad Thai",
                     "quantity": 1,
-                    "price": 120.0,
-                    "options_text": "Sweetness: Normal, Spice: Medium, Protein: Chicken",
+                    "choices": ["Normal", "Medium", "Chicken"],
                     "remark": "No peanuts",
                 },
                 {
                     "menu_item_id": item_ids[3] if len(item_ids) > 3 else 4,
-                    "name": "Tom Yum Soup",
                     "quantity": 1,
-                    "price": 100.0,
-                    "options_text": "Sweetness: Normal, Spice: Hot",
+                    "choices": ["Normal", "Hot"],
                     "remark": "",
                 },
             ],
         },
         {
             "table_number": 2,
-            "total": 310.0,
             "items": [
                 {
                     "menu_item_id": item_ids[1] if len(item_ids) > 1 else 2,
-                    "name": "Green Curry",
                     "quantity": 2,
-                    "price": 150.0,
-                    "options_text": "Sweetness: Normal, Spice: Medium, Protein: Shrimp",
+                    "choices": ["Normal", "Medium", "Shrimp"],
                     "remark": "Extra basil",
                 },
             ],
@@ -300,10 +300,12 @@ def seed_sample_orders(item_ids):
     ]
 
     for order in orders:
+        for item in order["items"]:
+            item["option_choice_ids"] = pick_choices(item["menu_item_id"], item.pop("choices"))
         response = requests.post(f"{BASE_URL}/orders", json=order)
         if response.status_code == 201:
             created_order = response.json()
-            print(f"✓ Order created (ID: {created_order['id']}, Table: {order['table_number']})")
+            print(f"✓ Order created (ID: {created_order['id']}, Table: {order['table_number']}, Total: {created_order['total']})")
         else:
             print(f"✗ Failed to create order for table {order['table_number']}: {response.text}")
 
@@ -315,11 +317,8 @@ def main():
     print("=" * 60)
 
     try:
-        # Seed options first
-        option_ids = seed_menu_options()
-
-        # Seed menu items
-        item_ids = seed_menu_items(option_ids)
+        # Seed options and menu items
+        item_ids = seed_menu()
 
         # Seed sample orders
         if item_ids:
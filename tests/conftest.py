@@ -1,9 +1,15 @@
 """Test configuration and fixtures."""
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from app.db.database import Base, get_db
+from app.db.database import Base, QueryStats, get_db, get_read_db
+from app.services.idempotency import idempotency_store
+from app.services.kitchen_queue import kitchen_queue
+from app.services.menu_cache import menu_cache
+from app.services.open_tables import open_tables
 from main import app
 
 # Test database URL (use in-memory SQLite for testing)
@@ -19,12 +25,17 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engin
 def db_session():
     """Create a fresh database for each test."""
     Base.metadata.create_all(bind=engine)
+    menu_cache.clear()
     db = TestingSessionLocal()
     try:
         yield db
     finally:
         db.close()
         Base.metadata.drop_all(bind=engine)
+        menu_cache.clear()
+        idempotency_store.clear()
+        kitchen_queue.clear()
+        open_tables.clear()
 
 
 @pytest.fixture
@@ -37,6 +48,39 @@ def client(db_session):
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     with TestClient(app) as test_client:
+        # Startup loaded the cache and order views from the app database, not the test session
+        menu_cache.clear()
+        kitchen_queue.clear()
+        open_tables.clear()
         yield test_client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def query_budget():
+    """Fail the test if the wrapped block issues more queries than declared.
+
+    Usage::
+
+        with query_budget(3):
+            client.get("/api/v1/menu/items")
+    """
+    @contextmanager
+    def budget(max_queries: int):
+        stats = QueryStats()
+
+        def count_query(conn, cursor, statement, parameters, context, executemany):
+            stats.count += 1
+
+        event.listen(engine, "before_cursor_execute", count_query)
+        try:
+            yield stats
+        finally:
+            event.remove(engine, "before_cursor_execute", count_query)
+        assert stats.count <= max_queries, (
+            f"Query budget exceeded: {stats.count} queries issued, budget is {max_queries}"
+        )
+
+    return budget
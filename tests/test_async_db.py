@@ -0,0 +1,102 @@
+"""Test the AsyncSession data access path."""
+import asyncio
+import threading
+
+import pytest
+
+from app.db.database import Base
+from app.models import MenuItem
+from app.schemas.order import OrderCreate, OrderItemCreate
+from app.services import AsyncMenuService, AsyncOrderService
+from app.services.menu_cache import menu_cache
+from app.core.exceptions import AppException
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+
+def run_with_session(tmp_path, scenario):
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        try:
+            async with session_factory() as db:
+                return await scenario(db)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_async_order_creation_and_listing(tmp_path):
+    """Orders created through AsyncOrderService decrement stock and are listed."""
+    async def scenario(db):
+        db.add(MenuItem(name="Thai Tea", category="Drinks", price=45, stock_quantity=5))
+        await db.commit()
+
+        order = await AsyncOrderService.create_order(db, OrderCreate(
+            total=90,
+            table_number=3,
+            items=[OrderItemCreate(menu_item_id=1, name="Thai Tea", quantity=2, price=45)],
+        ))
+        orders = await AsyncOrderService.get_all_orders(db, status="pending")
+        item = await AsyncMenuService.get_menu_item_by_id(db, 1)
+        return order, orders, item
+
+    order, orders, item = run_with_session(tmp_path, scenario)
+    assert order.status == "pending"
+    assert len(order.items) == 1
+    assert [o.id for o in orders] == [order.id]
+    assert item.stock_quantity == 3
+
+
+def test_async_service_raises_app_exceptions(tmp_path):
+    """Service errors propagate unchanged from the async path."""
+    async def scenario(db):
+        with pytest.raises(AppException) as exc_info:
+            await AsyncOrderService.get_order_by_id(db, 999)
+        return exc_info.value
+
+    error = run_with_session(tmp_path, scenario)
+    assert error.status_code == 404
+
+
+def test_concurrent_async_reads_on_a_cold_cache(tmp_path):
+    """Concurrent reads that reload the catalog or stock do not block the event loop."""
+    async def scenario(db):
+        db.add(MenuItem(name="Thai Tea", category="Drinks", price=45, stock_quantity=5))
+        await db.commit()
+        engine = db.bind
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async def read(action):
+            async with session_factory() as session:
+                return await action(session)
+
+        menu_cache.clear()
+        cold = await asyncio.gather(
+            read(AsyncMenuService.get_menu_payload),
+            read(AsyncMenuService.get_all_menu_items),
+            read(lambda session: AsyncMenuService.search_menu_items(session, "tea")),
+        )
+        menu_cache.invalidate()
+        menu_cache.invalidate_stock()
+        stale = await asyncio.gather(
+            read(AsyncMenuService.get_all_menu_items),
+            read(AsyncMenuService.get_all_menu_items),
+        )
+        return cold, stale
+
+    # A deadlock blocks the loop thread itself, so wait for the loop from outside it
+    results = []
+    thread = threading.Thread(target=lambda: results.append(run_with_session(tmp_path, scenario)), daemon=True)
+    thread.start()
+    thread.join(timeout=30)
+    assert results, "event loop blocked"
+    (payload, items, found), stale = results[0]
+    assert b"Thai Tea" in payload.body
+    assert [item.name for item in items] == [item.name for item in found] == ["Thai Tea"]
+    assert [len(result) for result in stale] == [1, 1]
@@ -0,0 +1,71 @@
+"""Test bulk order creation."""
+import pytest
+from sqlalchemy import event
+
+from app.models.menu import MenuItem
+from app.models.order import Order
+
+
+@pytest.fixture
+def item_id(client):
+    return client.post("/api/v1/menu/items", json={
+        "name": "Mango Sticky Rice", "category": "Desserts", "price": 80, "stock_quantity": 3,
+    }).json()["id"]
+
+
+def entry(item_id, quantity=1, **extra):
+    return {"table_number": 1, "items": [{"menu_item_id": item_id, "quantity": quantity}], **extra}
+
+
+def test_partial_failure_allocates_stock_in_order(client, db_session, item_id):
+    response = client.post("/api/v1/orders/bulk", json={"orders": [
+        entry(item_id, 2),
+        entry(item_id, 2),  # Only 1 left
+        entry(item_id, 1),
+        entry(9999),
+    ]})
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["failed"]) == (2, 2)
+    assert [r["status_code"] for r in body["results"]] == [201, 400, 201, 400]
+    assert "Available: 1, Requested: 2" in body["results"][1]["error"]
+    assert body["results"][2]["order"]["total"] == 80
+
+    assert db_session.query(Order).count() == 2
+    assert db_session.get(MenuItem, item_id).stock_quantity == 0
+
+
+def test_bulk_reads_menu_once(client, db_session):
+    item = client.post("/api/v1/menu/items", json={"name": "Iced Coffee", "category": "Drinks", "price": 40}).json()
+    client.get("/api/v1/menu/items")  # Load the pricing index
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0])
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.post("/api/v1/orders/bulk", json={"orders": [entry(item["id"]) for _ in range(50)]})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.json()["created"] == 50
+    # One stock lookup for the batch. INSERTs are batched by insertmanyvalues
+    # on PostgreSQL; SQLite cannot order batched RETURNING rows so runs them singly
+    assert [s for s in statements if s != "INSERT"] == ["SELECT"]
+
+
+def test_idempotency_keys_replay_across_uploads(client, db_session, item_id):
+    batch = {"orders": [entry(item_id, idempotency_key="pos-1"), entry(item_id, idempotency_key="pos-2")]}
+    first = client.post("/api/v1/orders/bulk", json=batch).json()
+    retry = client.post("/api/v1/orders/bulk", json=batch).json()
+
+    assert retry["created"] == 0
+    assert all(result["replayed"] for result in retry["results"])
+    assert [r["order"]["id"] for r in retry["results"]] == [r["order"]["id"] for r in first["results"]]
+
+    single = client.post("/api/v1/orders", json=entry(item_id), headers={"Idempotency-Key": "pos-1"})
+    assert single.json()["id"] == first["results"][0]["order"]["id"]
+    assert db_session.query(Order).count() == 2
@@ -0,0 +1,38 @@
+"""Test cold-start import budget and lazy loading."""
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from benchmark_import_time import PROJECT_ROOT, measure_import  # noqa: E402
+
+# Generous enough for shared CI runners; tighten with COLD_START_BUDGET_MS
+COLD_START_BUDGET_MS = float(os.environ.get("COLD_START_BUDGET_MS", 2500))
+
+LAZY_MODULES = ("app.api.superadmin_router", "app.api.db_admin_router", "jose", "passlib")
+
+
+def test_import_main_within_budget():
+    """Median cumulative import time of main stays within the cold-start budget."""
+    totals_ms = [measure_import()["main"][1] / 1000 for _ in range(3)]
+    assert statistics.median(totals_ms) <= COLD_START_BUDGET_MS
+
+
+def test_rarely_used_modules_are_not_imported_at_startup():
+    """Admin routers and python-jose are deferred until first use."""
+    timings = measure_import()
+    for module in LAZY_MODULES:
+        assert module not in timings, f"{module} is imported by main at startup"
+
+
+def test_lazy_router_loads_on_first_request(client):
+    """Routes under a lazy prefix work on first request and appear in OpenAPI."""
+    response = client.get("/api/v1/superadmin/users/list")
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token required"
+
+    paths = client.get("/openapi.json").json()["paths"]
+    assert "/api/v1/db-admin/tables" in paths
@@ -0,0 +1,88 @@
+"""Test response compression middleware."""
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, no_compression
+from app.core.responses import negotiate_encoding
+
+BIG = "x" * 5000
+
+
+def make_client(**options):
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1000, **options)
+
+    @app.get("/big")
+    def big():
+        return PlainTextResponse(BIG)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("ok")
+
+    @app.get("/raw")
+    @no_compression
+    def raw():
+        return PlainTextResponse(BIG)
+
+    @app.get("/encoded")
+    def encoded():
+        return Response(gzip.compress(BIG.encode()), headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((BIG for _ in range(3)), media_type="text/plain")
+
+    return TestClient(app)
+
+
+def test_large_responses_gzipped_for_accepting_clients():
+    client = make_client()
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < len(BIG)
+    assert response.text == BIG
+
+    response = client.get("/big", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+
+
+def test_threshold_opt_out_and_existing_encoding_respected():
+    client = make_client()
+    headers = {"Accept-Encoding": "gzip"}
+    assert "content-encoding" not in client.get("/small", headers=headers).headers
+    assert "content-encoding" not in client.get("/raw", headers=headers).headers
+
+    response = client.get("/encoded", headers=headers)
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == BIG  # compressed once, not twice
+
+
+def test_streaming_and_excluded_paths():
+    client = make_client()
+    response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == BIG * 3
+
+    excluded = make_client(exclude_paths=["/big"])
+    assert "content-encoding" not in excluded.get("/big", headers={"Accept-Encoding": "gzip"}).headers
+
+
+def test_client_q_values_pick_the_coding():
+    client = make_client()
+    response = client.get("/big", headers={"Accept-Encoding": "gzip;q=1, br;q=0.1"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert negotiate_encoding("gzip;q=1, br;q=0.1", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("gzip, br", ("br", "gzip")) == "br"
+    assert negotiate_encoding("*;q=0.5, gzip;q=0", ("br", "gzip")) == "br"
+    assert negotiate_encoding("identity", ("br", "gzip")) is None
+
+
+def test_uncompressed_responses_vary_on_accept_encoding():
+    client = make_client()
+    assert client.get("/small", headers={"Accept-Encoding": "gzip"}).headers["vary"] == "Accept-Encoding"
+    assert client.get("/big", headers={"Accept-Encoding": "identity"}).headers["vary"] == "Accept-Encoding"
+    assert "vary" not in client.get("/raw", headers={"Accept-Encoding": "gzip"}).headers
@@ -0,0 +1,51 @@
+"""Test connection pool configuration and instrumentation."""
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.config import Settings
+from app.db.pool import InstrumentedQueuePool, get_pool_stats
+
+
+def test_pool_defaults_split_connections_across_workers():
+    """Pool size and overflow share DB_MAX_CONNECTIONS between workers."""
+    single = Settings(DATABASE_URL="sqlite://", DB_MAX_CONNECTIONS=20, WEB_CONCURRENCY=1)
+    assert (single.db_pool_size, single.db_max_overflow) == (10, 10)
+
+    four = Settings(DATABASE_URL="sqlite://", DB_MAX_CONNECTIONS=20, WEB_CONCURRENCY=4)
+    assert four.db_pool_size + four.db_max_overflow == 5
+
+    explicit = Settings(DATABASE_URL="sqlite://", DB_POOL_SIZE=3, DB_MAX_OVERFLOW=0)
+    assert (explicit.db_pool_size, explicit.db_max_overflow) == (3, 0)
+
+
+def test_instrumented_pool_counts_waits_and_timeouts(tmp_path):
+    """Checkouts beyond size + overflow are recorded as waits and timeouts."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    held = engine.connect()
+    try:
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+        released = threading.Timer(0.01, held.close)
+        released.start()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        released.join()
+    finally:
+        held.close()
+
+    stats = get_pool_stats(engine)
+    assert stats["checkouts"] == 2
+    assert stats["waits"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["checked_out"] == 0
+    engine.dispose()
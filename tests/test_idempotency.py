@@ -0,0 +1,71 @@
+"""Test Idempotency-Key handling on order creation."""
+import pytest
+
+from app.models.menu import MenuItem
+from app.models.order import Order
+from app.services.idempotency import idempotency_store
+
+
+@pytest.fixture
+def item_id(client):
+    return client.post("/api/v1/menu/items", json={
+        "name": "Khao Man Gai", "category": "Rice", "price": 55, "stock_quantity": 10,
+    }).json()["id"]
+
+
+def post_order(client, item_id, key, quantity=2):
+    return client.post(
+        "/api/v1/orders",
+        json={"table_number": 3, "items": [{"menu_item_id": item_id, "quantity": quantity}]},
+        headers={"Idempotency-Key": key},
+    )
+
+
+def test_retry_replays_original_order_without_queries(client, db_session, item_id, query_budget):
+    first = post_order(client, item_id, "retry-1")
+    assert first.status_code == 201 and "Idempotent-Replayed" not in first.headers
+
+    with query_budget(0):
+        retry = post_order(client, item_id, "retry-1")
+    assert retry.status_code == 201
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json() == first.json()
+
+    assert db_session.query(Order).count() == 1
+    assert db_session.get(MenuItem, item_id).stock_quantity == 8
+
+
+def test_retry_served_from_table_after_worker_restart(client, db_session, item_id):
+    first = post_order(client, item_id, "retry-2")
+    idempotency_store.clear()
+
+    retry = post_order(client, item_id, "retry-2")
+    assert retry.json()["id"] == first.json()["id"]
+    assert db_session.query(Order).count() == 1
+
+
+def test_key_reused_for_different_request(client, item_id):
+    post_order(client, item_id, "retry-3")
+    response = post_order(client, item_id, "retry-3", quantity=1)
+    assert response.status_code == 422
+
+
+def test_concurrent_duplicate_replays_winner(client, db_session, item_id, monkeypatch):
+    first = post_order(client, item_id, "retry-4")
+    idempotency_store.clear()
+
+    # Simulate a duplicate that checked the key before the first request committed
+    find = idempotency_store.find
+    calls = []
+
+    def find_after_race(db, key, fingerprint):
+        calls.append(key)
+        return None if len(calls) == 1 else find(db, key, fingerprint)
+
+    monkeypatch.setattr(idempotency_store, "find", find_after_race)
+    retry = post_order(client, item_id, "retry-4")
+
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json()["id"] == first.json()["id"]
+    assert db_session.query(Order).count() == 1
+    assert db_session.get(MenuItem, item_id).stock_quantity == 8
@@ -0,0 +1,151 @@
+"""Test the kitchen preparation queue and ready-time estimates."""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.models.order import Order
+from app.services.kitchen_queue import KitchenQueue, kitchen_queue
+from app.services.order_events import OrderEvent, format_event_id
+
+NOW = datetime(2026, 1, 1, 12, 0)
+MENU = {
+    1: SimpleNamespace(category="Wok", prep_time=10),
+    2: SimpleNamespace(category="Drinks", prep_time=2),
+    3: SimpleNamespace(category="Wok", prep_time=None),
+}
+
+
+def order_event(order_id, status, menu_item_ids, minutes_ago=0, preparing_at=None):
+    return OrderEvent("order.created", order_id=order_id, status=status, order={
+        "id": order_id, "table_number": 1, "status": status,
+        "created_at": (NOW - timedelta(minutes=minutes_ago)).isoformat(),
+        "preparing_at": preparing_at.isoformat() if preparing_at else None,
+        "items": [{"id": order_id * 10 + i, "menu_item_id": m, "name": "x", "quantity": 1} for i, m in enumerate(menu_item_ids)],
+    })
+
+
+def test_schedule_uses_prep_times_and_station_load():
+    queue = KitchenQueue(cooks_per_station=2, default_prep_minutes=5)
+    queue.apply(order_event(1, "pending", [1], minutes_ago=3))
+    queue.apply(order_event(2, "pending", [1, 2], minutes_ago=2))
+    queue.apply(order_event(3, "pending", [3], minutes_ago=1))
+    # Arrived last but already cooking, so it holds a wok cook first
+    queue.apply(order_event(4, "preparing", [1], minutes_ago=9, preparing_at=NOW - timedelta(minutes=4)))
+
+    schedule = queue.schedule(MENU, now=NOW)
+    etas = {order.order_id: order.eta - NOW for order in schedule.orders}
+    assert [order.order_id for order in schedule.orders] == [4, 1, 2, 3]
+    assert etas == {
+        4: timedelta(minutes=6), 1: timedelta(minutes=10),
+        2: timedelta(minutes=16), 3: timedelta(minutes=15),
+    }
+    assert {s.station: s.lines for s in schedule.stations} == {"Drinks": 1, "Wok": 4}
+
+    drinks = queue.schedule(MENU, now=NOW, station="Drinks")
+    assert [(o.order_id, [line.station for line in o.lines]) for o in drinks.orders] == [(2, ["Drinks"])]
+
+
+def test_events_update_queue_incrementally():
+    queue = KitchenQueue(cooks_per_station=1, default_prep_minutes=5)
+    queue.apply(order_event(1, "pending", [1]))
+    queue.apply(order_event(2, "pending", [1]))
+    queue.apply(OrderEvent("order.completed", order_id=1, status="completed"))
+
+    assert [order.order_id for order in queue.schedule(MENU, now=NOW).orders] == [2]
+    assert queue.order_eta(1, MENU, now=NOW) is None
+    assert queue.order_eta(2, MENU, now=NOW).eta == NOW + timedelta(minutes=10)
+
+
+def test_schedule_reused_until_queue_changes():
+    queue = KitchenQueue(cooks_per_station=1, default_prep_minutes=5)
+    queue.apply(order_event(1, "pending", [1, 2]))
+
+    first = queue.schedule(MENU, now=NOW)
+    assert queue.schedule(MENU, now=NOW + timedelta(seconds=1)) is first
+    drinks = queue.schedule(MENU, now=NOW + timedelta(seconds=1), station="Drinks")
+    assert [line.station for order in drinks.orders for line in order.lines] == ["Drinks"]
+
+    queue.apply(order_event(2, "pending", [1]))
+    second = queue.schedule(MENU, now=NOW + timedelta(seconds=2))
+    assert second is not first and len(second.orders) == 2
+    # Estimates are relative to when they were computed
+    assert queue.schedule(MENU, now=NOW + timedelta(minutes=1)).generated_at == NOW + timedelta(minutes=1)
+
+
+def test_closed_orders_stay_closed_after_late_events():
+    queue = KitchenQueue(cooks_per_station=1, default_prep_minutes=5)
+    created = order_event(1, "pending", [1])
+    created.id = format_event_id(NOW, 1)
+    queue.apply(created)
+    cancelled_at = NOW + timedelta(seconds=2)
+    queue.apply(OrderEvent("order.cancelled", order_id=1, status="cancelled", id=format_event_id(cancelled_at, 1)))
+    queue.apply(created)  # Redelivered late
+    assert len(queue) == 0
+
+
+def test_initial_load_skips_orders_that_events_already_removed(client, db_session):
+    item = client.post("/api/v1/menu/items", json={"name": "Som Tam", "category": "Salads", "price": 50}).json()
+    order = client.post("/api/v1/orders", json={"items": [{"menu_item_id": item["id"], "quantity": 1}]}).json()
+
+    fresh = KitchenQueue(cooks_per_station=1, default_prep_minutes=5)
+    fresh.load(db_session)
+    assert len(fresh) == 1
+
+    # Cancelled while the load was reading the database
+    racing = KitchenQueue(cooks_per_station=1, default_prep_minutes=5)
+    query = racing._query
+
+    def query_then_cancel(db):
+        orders = query(db)
+        racing.apply(OrderEvent("order.cancelled", order_id=order["id"], status="cancelled"))
+        return orders
+
+    racing._query = query_then_cancel
+    racing.load(db_session)
+    assert racing.loaded and len(racing) == 0
+
+
+def test_events_delivered_out_of_order_are_ignored():
+    queue = KitchenQueue(cooks_per_station=1, default_prep_minutes=5)
+    cancelled = OrderEvent("order.cancelled", order_id=1, status="cancelled", id=format_event_id(NOW, 1))
+    stale = order_event(1, "pending", [1])
+    stale.id = format_event_id(NOW - timedelta(seconds=1), 1)
+
+    queue.apply(cancelled)
+    queue.apply(stale)
+    assert len(queue) == 0
+
+
+def test_queue_resyncs_changes_made_without_events(client, db_session, monkeypatch):
+    item = client.post("/api/v1/menu/items", json={"name": "Khao Soi", "category": "Noodles", "price": 70}).json()
+    order = client.post("/api/v1/orders", json={"items": [{"menu_item_id": item["id"], "quantity": 1}]}).json()
+    assert len(client.get("/api/v1/kitchen/queue").json()["orders"]) == 1
+
+    # Completed through another worker: no event reaches this one
+    db_session.query(Order).filter(Order.id == order["id"]).update({"status": "completed"})
+    db_session.commit()
+    assert len(client.get("/api/v1/kitchen/queue").json()["orders"]) == 1
+
+    monkeypatch.setattr(kitchen_queue, "resync_interval", 0)
+    assert client.get("/api/v1/kitchen/queue").json()["orders"] == []
+
+
+def test_queue_endpoint_follows_order_events(client, query_budget):
+    item = client.post(
+        "/api/v1/menu/items", json={"name": "Pad Thai", "category": "Wok", "price": 60, "prep_time": 12}
+    ).json()
+    first, second = (
+        client.post("/api/v1/orders", json={"table_number": t, "items": [{"menu_item_id": item["id"], "quantity": 1}]}).json()
+        for t in (1, 2)
+    )
+
+    queue = client.get("/api/v1/kitchen/queue").json()
+    assert [order["order_id"] for order in queue["orders"]] == [first["id"], second["id"]]
+    assert queue["orders"][0]["lines"][0]["prep_minutes"] == 12
+
+    client.post(f"/api/v1/orders/{first['id']}/complete")
+    with query_budget(1):  # At most the menu version check; no order queries
+        queue = client.get("/api/v1/kitchen/queue").json()
+    assert [order["order_id"] for order in queue["orders"]] == [second["id"]]
+
+    assert client.get(f"/api/v1/kitchen/orders/{second['id']}/eta").json()["status"] == "pending"
+    assert client.get(f"/api/v1/kitchen/orders/{first['id']}/eta").status_code == 404
@@ -0,0 +1,111 @@
+"""Test log rotation and compression."""
+import gzip
+import logging
+import os
+import threading
+from types import SimpleNamespace
+
+from app.core import logging as app_logging
+
+
+def make_settings(tmp_path, **overrides):
+    values = dict(
+        LOG_DIR=str(tmp_path / "logs"),
+        LOG_FILE_NAME="app.log",
+        LOG_ROTATION="size",
+        LOG_MAX_BYTES=200,
+        LOG_ROTATION_WHEN="midnight",
+        LOG_BACKUP_COUNT=2,
+        LOG_COMPRESS=True,
+        WEB_CONCURRENCY=1,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def emit(handler, count):
+    for i in range(count):
+        record = logging.LogRecord("test", logging.INFO, __file__, 0, "x" * 100 + str(i), None, None)
+        handler.emit(record)
+
+
+def test_size_rotation_compresses_and_keeps_backup_count(tmp_path):
+    """Rotated files are gzipped and pruned to LOG_BACKUP_COUNT."""
+    handler = app_logging._build_file_handler(make_settings(tmp_path))
+    try:
+        emit(handler, 20)
+    finally:
+        handler.close()
+    app_logging._compress_executor.submit(lambda: None).result()
+
+    log_dir = tmp_path / "logs"
+    rotated = sorted(p.name for p in log_dir.glob("app.log.*"))
+    assert rotated == ["app.log.1.gz", "app.log.2.gz"]
+    with gzip.open(log_dir / "app.log.1.gz", "rt") as f:
+        assert "xxx" in f.read()
+
+
+def test_rollovers_outpacing_compression_keep_every_record(tmp_path):
+    """Segments rotated while the compressor is busy are neither overwritten nor reordered."""
+    handler = app_logging._build_file_handler(make_settings(tmp_path, LOG_BACKUP_COUNT=100))
+    release = threading.Event()
+    app_logging._compress_executor.submit(release.wait)
+    try:
+        emit(handler, 40)
+    finally:
+        handler.close()
+        release.set()
+    app_logging._compress_executor.submit(lambda: None).result()
+
+    log_dir = tmp_path / "logs"
+    backups = sorted(log_dir.glob("app.log.*"), key=lambda p: int(p.name.split(".")[2]), reverse=True)
+    assert all(p.name.endswith(".gz") for p in backups)
+    lines = []
+    for path in backups:
+        with gzip.open(path, "rt") as f:
+            lines.extend(f.read().splitlines())
+    lines.extend((log_dir / "app.log").read_text().splitlines())
+    assert lines == ["x" * 100 + str(i) for i in range(40)]
+
+
+def test_rotation_without_compression(tmp_path):
+    """LOG_COMPRESS=False keeps plain rotated files."""
+    handler = app_logging._build_file_handler(make_settings(tmp_path, LOG_COMPRESS=False))
+    try:
+        emit(handler, 20)
+    finally:
+        handler.close()
+
+    rotated = sorted(p.name for p in (tmp_path / "logs").glob("app.log.*"))
+    assert rotated == ["app.log.1", "app.log.2"]
+
+
+def test_time_rotation_handler(tmp_path):
+    """'time' rotation uses a timed handler with the configured interval."""
+    handler = app_logging._build_file_handler(make_settings(tmp_path, LOG_ROTATION="time"))
+    try:
+        assert isinstance(handler, logging.handlers.TimedRotatingFileHandler)
+        assert handler.backupCount == 2
+        assert handler.namer is app_logging._gzip_namer
+    finally:
+        handler.close()
+
+
+def test_compression_failure_reported_through_handler(tmp_path):
+    """A failed compression goes to Handler.handleError and keeps the backups."""
+    handler = app_logging._build_file_handler(make_settings(tmp_path))
+    errors = []
+    handler.handleError = errors.append
+    try:
+        base = str(tmp_path / "logs" / "app.log")
+        app_logging._compress_and_shift(base + ".missing.pending", base, 2, handler)
+    finally:
+        handler.close()
+
+    assert [record.getMessage() for record in errors] == [f"Failed to compress rotated log {base}.missing.pending"]
+
+
+def test_workers_write_separate_log_files(tmp_path):
+    handler = app_logging._build_file_handler(make_settings(tmp_path, WEB_CONCURRENCY=4))
+    handler.close()
+    assert handler.baseFilename == str(tmp_path / "logs" / f"app.{os.getpid()}.log")
@@ -0,0 +1,118 @@
+"""Test the versioned menu catalog cache."""
+from app.models import CacheVersion, MenuItem
+from app.services.menu_cache import MenuCatalogCache, bump_menu_version, get_menu_version, menu_cache
+
+
+def test_bump_creates_and_increments_version(db_session):
+    """The version row is created on first bump and incremented after."""
+    assert get_menu_version(db_session) == 0
+    bump_menu_version(db_session)
+    db_session.commit()
+    bump_menu_version(db_session)
+    db_session.commit()
+    assert get_menu_version(db_session) == 2
+    assert db_session.query(CacheVersion).count() == 1
+
+
+def test_cache_reloads_only_when_version_changes(db_session):
+    """Catalog is reloaded after a version bump, not on every read."""
+    cache = MenuCatalogCache(check_interval=0)
+    db_session.add(MenuItem(name="Pad Thai", category="Noodles", price=80))
+    db_session.commit()
+    assert [item.name for item in cache.get_items(db_session)] == ["Pad Thai"]
+
+    # Unversioned change is not picked up
+    db_session.add(MenuItem(name="Som Tam", category="Salads", price=60))
+    db_session.commit()
+    assert len(cache.get_items(db_session)) == 1
+
+    bump_menu_version(db_session)
+    db_session.commit()
+    assert len(cache.get_items(db_session)) == 2
+
+
+def test_stock_refreshes_without_version_bump(db_session):
+    """Stock is re-read on its own; the catalog is not reloaded for it."""
+    cache = MenuCatalogCache(check_interval=60, stock_check_interval=0)
+    db_session.add(MenuItem(name="Mango Sticky Rice", category="Desserts", price=90, stock_quantity=5))
+    db_session.commit()
+    assert cache.get_items(db_session)[0].stock_quantity == 5
+    pricing = cache.get_pricing_index(db_session)
+
+    db_session.query(MenuItem).update({MenuItem.stock_quantity: 0})
+    db_session.commit()
+    assert cache.get_items(db_session)[0].stock_quantity == 0
+    assert cache.get_category_index(db_session).categories[0].available_count == 0
+    assert cache.get_pricing_index(db_session) is pricing
+
+
+def test_stock_changes_patch_search_results_without_resync(db_session, monkeypatch):
+    """New stock shows in search results without syncing the whole index."""
+    cache = MenuCatalogCache(check_interval=60, stock_check_interval=0)
+    db_session.add(MenuItem(name="Mango Sticky Rice", category="Desserts", price=90, stock_quantity=5))
+    db_session.commit()
+    index = cache.get_search_index(db_session)
+
+    def sync(items):
+        raise AssertionError("search index resynced for a stock change")
+
+    monkeypatch.setattr(index, "sync", sync)
+    db_session.query(MenuItem).update({MenuItem.stock_quantity: 2})
+    db_session.commit()
+    assert cache.get_search_index(db_session).search("mango")[0].stock_quantity == 2
+
+
+def test_orders_update_stock_without_bumping_menu_version(client, db_session):
+    """Orders leave the menu version alone but listings show the new stock."""
+    item = client.post("/api/v1/menu/items", json={"name": "Som Tam", "category": "Salads", "price": 60, "stock_quantity": 3}).json()
+    client.get("/api/v1/menu/items")
+    version = get_menu_version(db_session)
+
+    order = client.post("/api/v1/orders", json={"items": [{"menu_item_id": item["id"], "quantity": 3}]}).json()
+    assert get_menu_version(db_session) == version
+    assert client.get("/api/v1/menu/items").json()[0]["stock_quantity"] == 0
+    assert client.get("/api/v1/menu/categories/facets").json()[0]["available_count"] == 0
+
+    client.post(f"/api/v1/orders/{order['id']}/cancel")
+    assert client.get("/api/v1/menu/search", params={"q": "som tam"}).json()[0]["stock_quantity"] == 3
+    assert menu_cache.version == version
+
+
+def test_menu_changes_through_api_refresh_catalog(client):
+    """Creating an item through the API is visible on the next menu read."""
+    assert client.get("/api/v1/menu/items").json() == []
+    client.post("/api/v1/menu/items", json={"name": "Thai Tea", "category": "Drinks", "price": 45})
+    names = [item["name"] for item in client.get("/api/v1/menu/items").json()]
+    assert names == ["Thai Tea"]
+
+
+def test_health_probes(client):
+    """Liveness is static; readiness checks the database."""
+    assert client.get("/health/live").json() == {"status": "alive"}
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["database"]["connected"] is True
+
+
+def test_menu_listing_served_precompressed(client):
+    """Menu listings are served from cached bytes in the client's preferred coding."""
+    for i in range(10):
+        client.post("/api/v1/menu/items", json={"name": f"Thai Tea {i}", "category": "Drinks", "price": 45})
+
+    plain = client.get("/api/v1/menu/items", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert len(plain.json()) == 10
+
+    gzipped = client.get("/api/v1/menu/items", headers={"Accept-Encoding": "gzip;q=0.5, br;q=0"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["vary"] == "Accept-Encoding"
+    assert gzipped.json() == plain.json()
+
+    etag = plain.headers["etag"]
+    not_modified = client.get("/api/v1/menu/items", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+
+    client.post("/api/v1/menu/items", json={"name": "Cocoa", "category": "Drinks", "price": 50})
+    changed = client.get("/api/v1/menu/items", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
@@ -0,0 +1,62 @@
+"""Test the menu category index and faceted browsing."""
+from app.schemas.menu import MenuItemResponse
+from app.services.menu_categories import CategoryIndex, category_key
+
+
+def menu_item(item_id, category, is_available=True, stock_quantity=None, display_order=0):
+    return MenuItemResponse(
+        id=item_id, name=f"Item {item_id}", category=category, price=50, image_url=None, description=None,
+        is_available=is_available, stock_quantity=stock_quantity, prep_time=None, is_recommended=False,
+        display_order=display_order, options=[],
+    )
+
+
+def test_category_key_ignores_case_and_spacing():
+    assert category_key("  Main   Dishes ") == category_key("main dishes") == "main dishes"
+    assert category_key("ＤＲＩＮＫＳ") == "drinks"  # Full-width letters
+
+
+def test_index_groups_spellings_and_counts_availability():
+    index = CategoryIndex([
+        menu_item(3, "Drinks", display_order=0),
+        menu_item(1, "Noodles", display_order=1),
+        menu_item(4, "drinks ", is_available=False, display_order=2),
+        menu_item(2, "Noodles", stock_quantity=0, display_order=3),
+        menu_item(5, "DRINKS", stock_quantity=4, display_order=4),
+    ])
+
+    # Ordered by the category's oldest item, named after its spelling
+    assert [(c.name, c.item_count, c.available_count) for c in index.categories] == [
+        ("Noodles", 2, 1), ("Drinks", 3, 2),
+    ]
+    assert [item.id for item in index.items_for("drinks")] == [3, 4, 5]
+    assert len(index.items_for(None)) == 5
+    assert index.items_for("Soups") == []
+    assert index.get("NOODLES").name == "Noodles"
+
+
+def test_category_endpoints_follow_menu_changes(client, query_budget):
+    def create(name, category, **fields):
+        return client.post("/api/v1/menu/items", json={"name": name, "category": category, "price": 50, **fields}).json()
+
+    curry = create("Green Curry", "Curry")
+    create("Red Curry", "curry", stock_quantity=0)
+    tea = create("Thai Tea", "Drinks")
+
+    client.get("/api/v1/menu/categories")
+    with query_budget(1):  # At most the menu version check; no DISTINCT scan
+        assert client.get("/api/v1/menu/categories").json() == ["Curry", "Drinks"]
+        facets = client.get("/api/v1/menu/categories/facets").json()
+    assert [(f["name"], f["item_count"], f["available_count"]) for f in facets] == [("Curry", 2, 1), ("Drinks", 1, 1)]
+
+    # Filtering matches any spelling of the category
+    listed = client.get("/api/v1/menu/items", params={"category": " CURRY"}).json()
+    assert [item["name"] for item in listed] == ["Green Curry", "Red Curry"]
+
+    client.put(f"/api/v1/menu/items/{curry['id']}", json={"is_available": False})
+    client.put(f"/api/v1/menu/items/{tea['id']}", json={"category": "Curry"})
+    facets = client.get("/api/v1/menu/categories/facets").json()
+    assert [(f["name"], f["item_count"], f["available_count"]) for f in facets] == [("Curry", 3, 1)]
+
+    client.delete(f"/api/v1/menu/items/{curry['id']}")
+    assert client.get("/api/v1/menu/categories").json() == ["curry"]
@@ -0,0 +1,87 @@
+"""Test bulk menu import and export."""
+from app.models.cache_version import CacheVersion
+from app.models.menu import MenuItem
+
+CATALOG = {
+    "options": [
+        {"name": "Spiciness", "is_required": True, "choices": [{"name": "Mild"}, {"name": "Hot", "price_modifier": 5}]},
+        {"name": "Extras", "option_type": "multiple", "choices": [{"name": "Egg", "price_modifier": 10}]},
+    ],
+    "items": [
+        {"name": "Pad Kra Pao", "category": "Rice", "price": 70, "options": ["Spiciness", "Extras"]},
+        {"name": "Fried Rice", "category": "Rice", "price": 60, "options": ["Extras"]},
+        {"name": "Thai Tea", "category": "Drinks", "price": 40},
+    ],
+}
+
+
+def menu_version(db_session):
+    row = db_session.get(CacheVersion, "menu")
+    return row.version if row else 0
+
+
+def test_import_creates_catalog_with_one_version_bump(client, db_session):
+    client.get("/api/v1/menu/items")  # Cache the empty catalog
+    version = menu_version(db_session)
+
+    response = client.post("/api/v1/menu/import", json=CATALOG)
+    assert response.status_code == 200
+    assert response.json() == {
+        "options_created": 2, "options_updated": 0, "choices_created": 3, "choices_updated": 0,
+        "items_created": 3, "items_updated": 0,
+    }
+    assert menu_version(db_session) == version + 1
+
+    items = {item["name"]: item for item in client.get("/api/v1/menu/items").json()}
+    assert [o["name"] for o in items["Pad Kra Pao"]["options"]] == ["Spiciness", "Extras"]
+    assert [c["name"] for c in items["Pad Kra Pao"]["options"][0]["choices"]] == ["Mild", "Hot"]
+    assert (items["Pad Kra Pao"]["display_order"], items["Fried Rice"]["display_order"]) == (1, 2)
+
+
+def test_export_round_trip_updates_in_place(client, db_session):
+    client.post("/api/v1/menu/import", json=CATALOG)
+    catalog = client.get("/api/v1/menu/export").json()
+    catalog["items"][0]["price"] = 99
+    catalog["options"][0]["choices"].append({"name": "Thai Hot"})
+
+    result = client.post("/api/v1/menu/import", json=catalog).json()
+    assert (result["items_created"], result["items_updated"]) == (0, 3)
+    assert (result["choices_created"], result["choices_updated"]) == (1, 3)
+    assert db_session.query(MenuItem).count() == 3
+    assert client.get("/api/v1/menu/export").json()["items"][0]["price"] == 99
+
+
+def test_csv_import_and_export(client):
+    client.post("/api/v1/menu/import", json={"options": CATALOG["options"]})
+    csv_body = (
+        "name,category,price,stock_quantity,is_available,options\n"
+        "Som Tam,Salads,50,20,true,Spiciness\n"
+        "Larb,Salads,65,,false,Spiciness|Extras\n"
+    )
+    response = client.post("/api/v1/menu/import", content=csv_body, headers={"Content-Type": "text/csv"})
+    assert response.json()["items_created"] == 2
+
+    exported = client.get("/api/v1/menu/export", params={"format": "csv"})
+    assert exported.headers["content-type"].startswith("text/csv")
+    lines = exported.text.splitlines()
+    assert lines[0].startswith("id,name,category,price")
+    assert any(line.endswith(",false,,,false,2,Spiciness|Extras") for line in lines)
+
+
+def test_import_errors(client):
+    bad_row = "name,category,price\nSom Tam,Salads,50\nLarb,Salads,cheap\n"
+    response = client.post("/api/v1/menu/import", content=bad_row, headers={"Content-Type": "text/csv"})
+    assert response.status_code == 422
+    assert "line 3" in response.text
+
+    unknown = {"items": [{"name": "Larb", "category": "Salads", "price": 65, "options": ["Nope"]}]}
+    response = client.post("/api/v1/menu/import", json=unknown)
+    assert response.status_code == 400
+    assert "Unknown menu options: Nope" in response.text
+
+
+def test_import_queries_do_not_grow_with_catalog_size(client, query_budget):
+    items = [{"name": f"Item {i}", "category": f"Cat {i % 5}", "price": 10 + i} for i in range(300)]
+    with query_budget(12):
+        response = client.post("/api/v1/menu/import", json={"options": CATALOG["options"], "items": items})
+    assert response.json()["items_created"] == 300
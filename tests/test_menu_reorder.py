@@ -0,0 +1,61 @@
+"""Test bulk reordering of choices, options and menu items."""
+import pytest
+
+
+@pytest.fixture
+def option(client):
+    return client.post("/api/v1/menu/options", json={
+        "name": "Sweetness", "choices": [{"name": "None"}, {"name": "Less"}, {"name": "Normal"}],
+    }).json()
+
+
+def reversed_orders(records):
+    return [{"id": r["id"], "display_order": len(records) - i} for i, r in enumerate(records)]
+
+
+def test_reorder_choices_in_one_update(client, option, query_budget):
+    # Reorder UPDATE, menu version bump and the reordered list
+    with query_budget(3):
+        response = client.post(
+            f"/api/v1/menu/options/{option['id']}/reorder-choices", json=reversed_orders(option["choices"])
+        )
+    assert response.status_code == 200
+    assert [c["name"] for c in response.json()] == ["Normal", "Less", "None"]
+
+
+def test_reorder_rejects_choices_of_other_options(client, option):
+    other = client.post("/api/v1/menu/options", json={"name": "Size", "choices": [{"name": "Large"}]}).json()
+    orders = [{"id": option["choices"][0]["id"], "display_order": 5}, {"id": other["choices"][0]["id"], "display_order": 1}]
+
+    response = client.post(f"/api/v1/menu/options/{option['id']}/reorder-choices", json=orders)
+    assert response.status_code == 400
+    unchanged = client.get(f"/api/v1/menu/options/{option['id']}").json()
+    assert [c["display_order"] for c in unchanged["choices"]] == [0, 1, 2]
+
+    missing = client.post("/api/v1/menu/options/9999/reorder-choices", json=orders)
+    assert missing.status_code == 404
+
+
+def test_reorder_items_within_category(client):
+    items = [
+        client.post("/api/v1/menu/items", json={"name": name, "category": "Noodles", "price": 60}).json()
+        for name in ("Pad Thai", "Pad See Ew", "Rad Na")
+    ]
+    soup = client.post("/api/v1/menu/items", json={"name": "Tom Yum", "category": "Soups", "price": 90}).json()
+
+    response = client.post("/api/v1/menu/categories/Noodles/reorder", json=reversed_orders(items))
+    assert [row["id"] for row in response.json()] == [item["id"] for item in reversed(items)]
+    assert [item["name"] for item in client.get("/api/v1/menu/items", params={"category": "Noodles"}).json()] == [
+        "Rad Na", "Pad See Ew", "Pad Thai",
+    ]
+
+    wrong_category = client.post("/api/v1/menu/categories/Noodles/reorder", json=[{"id": soup["id"], "display_order": 0}])
+    assert wrong_category.status_code == 400
+
+
+def test_reorder_options(client, option):
+    other = client.post("/api/v1/menu/options", json={"name": "Size", "display_order": 1}).json()
+    response = client.post("/api/v1/menu/options/reorder", json=[
+        {"id": option["id"], "display_order": 2}, {"id": other["id"], "display_order": 0},
+    ])
+    assert [row["id"] for row in response.json()] == [other["id"], option["id"]]
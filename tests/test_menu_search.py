@@ -0,0 +1,74 @@
+"""Test menu search and its n-gram index."""
+from app.schemas.menu import MenuItemResponse
+from app.services.menu_search import MenuSearchIndex, ngrams
+
+
+def menu_item(item_id, name, category, description=None, recommended=False):
+    return MenuItemResponse(
+        id=item_id, name=name, category=category, price=50, image_url=None, description=description,
+        is_available=True, stock_quantity=None, prep_time=None, is_recommended=recommended,
+        display_order=item_id, options=[],
+    )
+
+
+CATALOG = [
+    menu_item(1, "ผัดไทย Pad Thai", "Noodles"),
+    menu_item(2, "ผัดซีอิ๊ว Pad See Ew", "Noodles"),
+    menu_item(3, "ต้มยำกุ้ง Tom Yum Goong", "Soups", "Spicy prawn soup"),
+    menu_item(4, "ต้มข่าไก่ Tom Kha Gai", "Soups", "Coconut chicken soup", recommended=True),
+    menu_item(5, "Thai Tea", "Drinks", "ชาไทย with milk"),
+]
+
+
+def names(items):
+    return [item.name for item in items]
+
+
+def test_ngrams_mix_thai_bigrams_and_word_trigrams():
+    assert ngrams("ผัดไทย pad") == ["ผั", "ัด", "ดไ", "ไท", "ทย", " pa", "pad", "ad "]
+    # The last word of a query may still be being typed
+    assert ngrams("chick", prefix=True) == [" ch", "chi", "hic", "ick"]
+
+
+def test_search_matches_thai_english_partial_and_typos():
+    index = MenuSearchIndex()
+    index.sync(CATALOG)
+
+    assert names(index.search("ผัดไทย"))[0] == "ผัดไทย Pad Thai"
+    assert names(index.search("pad"))[:2] == ["ผัดไทย Pad Thai", "ผัดซีอิ๊ว Pad See Ew"]
+    assert names(index.search("tom yumm"))[0] == "ต้มยำกุ้ง Tom Yum Goong"
+    assert names(index.search("ชาไทย"))[0] == "Thai Tea"
+    assert names(index.search("soup", category="Soups", limit=1)) == ["ต้มข่าไก่ Tom Kha Gai"]
+    assert names(index.search("soup", category="soups ", limit=1)) == ["ต้มข่าไก่ Tom Kha Gai"]
+    assert index.search("xyz") == []
+
+
+def test_recommended_items_rank_higher():
+    index = MenuSearchIndex()
+    index.sync(CATALOG)
+    # Both soups match equally; the recommended one comes first
+    assert names(index.search("soup")) == ["ต้มข่าไก่ Tom Kha Gai", "ต้มยำกุ้ง Tom Yum Goong"]
+
+
+def test_sync_reindexes_only_changed_items():
+    index = MenuSearchIndex()
+    assert index.sync(CATALOG) == 5
+    assert index.sync(CATALOG) == 0
+
+    renamed = [menu_item(1, "ผัดไทยกุ้งสด Pad Thai Shrimp", "Noodles")] + CATALOG[1:4]
+    assert index.sync(renamed) == 1
+    assert len(index) == 4
+    assert names(index.search("shrimp")) == ["ผัดไทยกุ้งสด Pad Thai Shrimp"]
+    assert "Thai Tea" not in names(index.search("thai tea"))
+    assert index.search("milk") == []
+
+
+def test_search_endpoint_follows_menu_changes(client):
+    item = client.post("/api/v1/menu/items", json={"name": "ข้าวผัด Fried Rice", "category": "Rice", "price": 60}).json()
+
+    response = client.get("/api/v1/menu/search", params={"q": "fried"})
+    assert [found["id"] for found in response.json()] == [item["id"]]
+
+    client.put(f"/api/v1/menu/items/{item['id']}", json={"name": "ข้าวผัดปู Crab Fried Rice"})
+    assert client.get("/api/v1/menu/search", params={"q": "ปู"}).json()[0]["name"] == "ข้าวผัดปู Crab Fried Rice"
+    assert client.get("/api/v1/menu/search").status_code == 422
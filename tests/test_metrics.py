@@ -0,0 +1,42 @@
+"""Test metrics registry and /metrics endpoint."""
+from app.core.metrics import MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Histogram buckets are cumulative and include +Inf, sum and count."""
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    latency.observe(0.05, route="/a")
+    latency.observe(0.5, route="/a")
+    latency.observe(5, route="/a")
+
+    text = registry.render()
+    assert '# TYPE latency_seconds histogram' in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+    assert 'latency_seconds_sum{route="/a"} 5.55' in text
+
+
+def test_counter_and_callback_gauge():
+    """Counters accumulate per label set and gauges read callbacks at scrape time."""
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests.", ("status",))
+    requests.inc(status="200")
+    requests.inc(status="200")
+    registry.gauge("pool_size", "Pool size.", callback=lambda: 5)
+
+    text = registry.render()
+    assert 'requests_total{status="200"} 2' in text
+    assert "pool_size 5" in text
+
+
+def test_metrics_endpoint_labels_by_route_template(client):
+    """Requests are recorded under their route template, not the raw path."""
+    client.get("/api/v1/orders/12345")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'route="/api/v1/orders/{order_id}"' in response.text
+    assert "orders_created_total" in response.text
@@ -0,0 +1,102 @@
+"""Test the open tables floor view."""
+from datetime import datetime, timedelta
+
+from app.models.order import Order
+from app.services.open_tables import OpenTablesView, open_tables
+from app.services.order_events import OrderEvent, format_event_id
+
+NOW = datetime(2026, 1, 1, 19, 0)
+
+
+def order_event(order_id, status, table, total, minutes_ago=0, event_type="order.updated"):
+    return OrderEvent(event_type, order_id=order_id, status=status, table_number=table, order={
+        "id": order_id, "table_number": table, "status": status, "total": total,
+        "created_at": (NOW - timedelta(minutes=minutes_ago)).isoformat(), "items": [],
+    })
+
+
+def test_aggregate_follows_order_events():
+    view = OpenTablesView()
+    view.apply(order_event(1, "pending", 5, 120.0, minutes_ago=20))
+    view.apply(order_event(2, "pending", 5, 80.5, minutes_ago=5))
+    view.apply(order_event(3, "pending", None, 40.0, minutes_ago=1))
+    view.apply(order_event(1, "preparing", 5, 120.0, minutes_ago=20))
+
+    tables = view.snapshot(now=NOW).tables
+    assert [(t.table_number, t.open_orders, t.total, t.oldest_pending_seconds) for t in tables] == [
+        (5, 2, 200.5, 300), (None, 1, 40.0, 60),
+    ]
+
+    # Moving an order to another table moves its contribution
+    view.apply(order_event(2, "pending", 6, 80.5, minutes_ago=5))
+    view.apply(order_event(1, "completed", 5, 120.0, minutes_ago=20, event_type="order.completed"))
+    view.apply(order_event(3, "pending", None, 40.0, event_type="order.deleted"))
+    assert [(t.table_number, t.open_orders, t.total) for t in view.snapshot(now=NOW).tables] == [(6, 1, 80.5)]
+
+
+def test_open_tables_endpoint(client, query_budget):
+    item = client.post("/api/v1/menu/items", json={"name": "Larb", "category": "Salads", "price": 65}).json()
+
+    def place(table, quantity=1):
+        return client.post("/api/v1/orders", json={
+            "table_number": table, "items": [{"menu_item_id": item["id"], "quantity": quantity}],
+        }).json()
+
+    first = place(3)
+    assert client.get("/api/v1/orders/tables").json()["tables"][0]["open_orders"] == 1
+
+    place(3, quantity=2)
+    takeaway = place(None)
+    client.post(f"/api/v1/orders/{first['id']}/ready")  # Not allowed from pending; no change
+    client.post(f"/api/v1/orders/{takeaway['id']}/complete")
+
+    with query_budget(0):
+        tables = client.get("/api/v1/orders/tables").json()["tables"]
+    assert [(t["table_number"], t["open_orders"], t["total"]) for t in tables] == [(3, 2, 195.0)]
+    assert tables[0]["oldest_pending_at"].startswith(first["created_at"][:19])
+
+
+def test_oldest_pending_follows_removals_and_stale_events():
+    view = OpenTablesView()
+    view.apply(order_event(1, "pending", 5, 10.0, minutes_ago=30))
+    view.apply(order_event(2, "pending", 5, 10.0, minutes_ago=10))
+    view.apply(order_event(3, "pending", 5, 10.0, minutes_ago=20))
+    view.apply(order_event(1, "preparing", 5, 10.0, minutes_ago=30))
+    assert view.snapshot(now=NOW).tables[0].oldest_pending_seconds == 1200
+
+    # Delivered after a later change to the same order
+    served = order_event(3, "ready", 5, 10.0, minutes_ago=20)
+    served.id = format_event_id(NOW, 3)
+    stale = order_event(3, "pending", 5, 10.0, minutes_ago=20)
+    stale.id = format_event_id(NOW - timedelta(seconds=1), 3)
+    view.apply(served)
+    view.apply(stale)
+    assert view.snapshot(now=NOW).tables[0].oldest_pending_seconds == 600
+
+
+def test_single_worker_view_never_rescans_orders(client, query_budget):
+    item = client.post("/api/v1/menu/items", json={"name": "Larb", "category": "Salads", "price": 65}).json()
+    client.post("/api/v1/orders", json={"table_number": 1, "items": [{"menu_item_id": item["id"], "quantity": 1}]})
+    client.get("/api/v1/orders/tables")
+
+    # Events reach the only worker, so the view is never rebuilt
+    assert open_tables.resync_interval is None
+    open_tables._loaded_at = 0.0
+    with query_budget(0):
+        assert len(client.get("/api/v1/orders/tables").json()["tables"]) == 1
+
+
+def test_open_tables_resync_changes_made_without_events(client, db_session, monkeypatch):
+    item = client.post("/api/v1/menu/items", json={"name": "Larb", "category": "Salads", "price": 65}).json()
+    order = client.post("/api/v1/orders", json={
+        "table_number": 2, "items": [{"menu_item_id": item["id"], "quantity": 1}],
+    }).json()
+    assert len(client.get("/api/v1/orders/tables").json()["tables"]) == 1
+
+    # Completed through another worker: no event reaches this one
+    db_session.query(Order).filter(Order.id == order["id"]).update({"status": "completed"})
+    db_session.commit()
+    assert len(client.get("/api/v1/orders/tables").json()["tables"]) == 1
+
+    monkeypatch.setattr(open_tables, "resync_interval", 0)
+    assert client.get("/api/v1/orders/tables").json()["tables"] == []
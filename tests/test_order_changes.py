@@ -0,0 +1,97 @@
+"""Test the long-poll orders changes endpoint."""
+import threading
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.models.order import Order
+from app.services import order_events
+
+LAG = 0.2
+
+
+@pytest.fixture(autouse=True)
+def short_lag(monkeypatch):
+    monkeypatch.setattr(settings, "ORDER_CHANGES_SAFETY_LAG_SECONDS", LAG)
+    monkeypatch.setattr(settings, "ORDER_CHANGES_POLL_SECONDS", LAG)
+
+
+def create_order(client, table_number=1):
+    item = client.post("/api/v1/menu/items", json={"name": "Som Tam", "category": "Salads", "price": 50}).json()
+    return client.post("/api/v1/orders", json={
+        "table_number": table_number, "items": [{"menu_item_id": item["id"], "quantity": 1}],
+    }).json()
+
+
+def test_changes_since_cursor(client):
+    first = create_order(client)
+    time.sleep(LAG)
+    start = client.get("/api/v1/orders/changes").json()
+    assert start["orders"] == [] and start["cursor"]
+
+    second = create_order(client, table_number=2)
+    client.post(f"/api/v1/orders/{first['id']}/complete")
+    # Held back until older than the safety lag
+    held = client.get("/api/v1/orders/changes", params={"since": start["cursor"], "timeout": 0}).json()
+    assert held == {"orders": [], "cursor": start["cursor"], "has_more": False}
+
+    time.sleep(LAG)
+    changes = client.get("/api/v1/orders/changes", params={"since": start["cursor"], "timeout": 0}).json()
+    assert [(o["id"], o["status"]) for o in changes["orders"]] == [
+        (second["id"], "pending"), (first["id"], "completed"),
+    ]
+
+    nothing = client.get("/api/v1/orders/changes", params={"since": changes["cursor"], "timeout": 0}).json()
+    assert nothing == {"orders": [], "cursor": changes["cursor"], "has_more": False}
+
+
+def test_changes_wait_is_woken_by_order_event(client, db_session):
+    order = create_order(client)
+    time.sleep(LAG)
+    cursor = client.get("/api/v1/orders/changes").json()["cursor"]
+    result = {}
+
+    def poll():
+        started = time.perf_counter()
+        response = client.get("/api/v1/orders/changes", params={"since": cursor, "timeout": 10})
+        result.update(response.json(), elapsed=time.perf_counter() - started)
+
+    poller = threading.Thread(target=poll)
+    poller.start()
+    time.sleep(0.3)
+    row = db_session.get(Order, order["id"])
+    row.status = "completed"
+    db_session.commit()
+    order_events.publish(order_events.OrderEvent(order_events.ORDER_COMPLETED, order_id=row.id))
+    poller.join(10)
+
+    assert [o["status"] for o in result["orders"]] == ["completed"]
+    assert result["elapsed"] < 5
+
+
+def test_changes_from_other_workers_found_by_polling(client, db_session):
+    """A change that publishes no event in this worker is still returned."""
+    order = create_order(client)
+    time.sleep(LAG)
+    cursor = client.get("/api/v1/orders/changes").json()["cursor"]
+
+    def change_elsewhere():
+        time.sleep(0.1)
+        row = db_session.get(Order, order["id"])
+        row.status = "completed"
+        db_session.commit()
+
+    worker = threading.Thread(target=change_elsewhere)
+    worker.start()
+    started = time.perf_counter()
+    changes = client.get("/api/v1/orders/changes", params={"since": cursor, "timeout": 5}).json()
+    worker.join()
+
+    assert [o["status"] for o in changes["orders"]] == ["completed"]
+    assert time.perf_counter() - started < 3
+
+
+def test_invalid_cursor(client):
+    response = client.get("/api/v1/orders/changes", params={"since": "yesterday", "timeout": 0})
+    assert response.status_code == 400
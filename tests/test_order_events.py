@@ -0,0 +1,116 @@
+"""Test the order event broker and the kitchen WebSocket/SSE endpoints."""
+import asyncio
+import json
+
+import pytest
+
+from datetime import datetime, timedelta
+
+from app.services.order_events import RESYNC, EventBroker, EventFilter, OrderEvent, format_event_id
+
+START = datetime(2024, 1, 1, 12, 0)
+
+
+def make_event(status="pending", table=1, order_id=1, seconds=0):
+    return OrderEvent(
+        "order.updated", order_id=order_id, status=status, table_number=table,
+        id=format_event_id(START + timedelta(seconds=seconds), order_id),
+    )
+
+
+def drain(subscription):
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    return events
+
+
+def test_filters_and_slow_consumer_resync():
+    async def scenario():
+        broker = EventBroker(max_queue=2, replay_size=10, max_subscribers=5)
+        pending = broker.subscribe(EventFilter.parse("pending", "1,2"))
+        everything = broker.subscribe()
+        events = [make_event(), make_event(status="cooking", seconds=1), make_event(table=3, seconds=2)]
+        for event in events:
+            broker.publish(event)
+        await asyncio.sleep(0)
+        return events, drain(pending), drain(everything)
+
+    events, pending, everything = asyncio.run(scenario())
+    assert pending == events[:1]
+    # The queue overflowed on the third event, so the backlog became one resync
+    assert [(event.type, event.id) for event in everything] == [(RESYNC, events[2].id)]
+
+
+def test_replay_after_last_event_id():
+    async def scenario():
+        broker = EventBroker(max_queue=10, replay_size=3, max_subscribers=5)
+        # Delivered slightly out of id order, as commits can be
+        events = [make_event(order_id=1, seconds=0), make_event(order_id=2, seconds=2),
+                  make_event(order_id=3, seconds=1), make_event(order_id=4, seconds=3)]
+        for event in events:
+            broker.publish(event)
+        resumed = drain(broker.subscribe(last_event_id=events[2].id))
+        out_of_order = drain(broker.subscribe(last_event_id=events[1].id))
+        # Seen on another worker: resume from this worker's later changes
+        foreign = drain(broker.subscribe(last_event_id=format_event_id(START + timedelta(seconds=1.5), 9)))
+        too_old = drain(broker.subscribe(last_event_id=events[0].id))
+        restarted = drain(broker.subscribe(last_event_id=format_event_id(START + timedelta(seconds=9), 1)))
+        with pytest.raises(ValueError):
+            broker.subscribe(last_event_id="42")
+        return events, resumed, out_of_order, foreign, too_old, restarted
+
+    events, resumed, out_of_order, foreign, too_old, restarted = asyncio.run(scenario())
+    assert resumed == events[3:]
+    assert out_of_order == events[2:]
+    assert foreign == [events[1], events[3]]
+    assert [(event.type, event.id) for event in too_old] == [(RESYNC, events[3].id)]
+    assert [event.type for event in restarted] == [RESYNC]
+
+
+def test_subscriber_limit():
+    async def scenario():
+        broker = EventBroker(max_queue=10, replay_size=10, max_subscribers=1)
+        with broker.subscribe():
+            with pytest.raises(OverflowError):
+                broker.subscribe()
+        broker.subscribe()
+
+    asyncio.run(scenario())
+
+
+def test_websocket_receives_filtered_order_events(client):
+    item = client.post("/api/v1/menu/items", json={"name": "Pad Thai", "category": "Noodles", "price": 60}).json()
+    lines = [{"menu_item_id": item["id"], "quantity": 1}]
+
+    with client.websocket_connect("/api/v1/kitchen/ws?table=5") as websocket:
+        client.post("/api/v1/orders", json={"table_number": 4, "items": lines})
+        created = client.post("/api/v1/orders", json={"table_number": 5, "items": lines}).json()
+        client.post(f"/api/v1/orders/{created['id']}/complete")
+
+        first = json.loads(websocket.receive_text())
+        second = json.loads(websocket.receive_text())
+
+    assert (first["type"], first["order_id"], first["order"]["total"]) == ("order.created", created["id"], 60)
+    assert (second["type"], second["status"]) == ("order.completed", "completed")
+
+
+def test_event_ids_are_change_cursors(client):
+    item = client.post("/api/v1/menu/items", json={"name": "Pad Thai", "category": "Noodles", "price": 60}).json()
+    lines = [{"menu_item_id": item["id"], "quantity": 1}]
+
+    with client.websocket_connect("/api/v1/kitchen/ws") as websocket:
+        created = client.post("/api/v1/orders", json={"table_number": 4, "items": lines}).json()
+        event = json.loads(websocket.receive_text())
+
+    assert event["id"] == format_event_id(datetime.fromisoformat(created["updated_at"]), created["id"])
+
+
+def test_stream_rejects_bad_filter(client):
+    response = client.get("/api/v1/kitchen/stream?table=five")
+    assert response.status_code == 400
+    response = client.get("/api/v1/kitchen/stream", headers={"Last-Event-ID": "12"})
+    assert response.status_code == 400
+    # Not an order status, so it would never match
+    response = client.get("/api/v1/kitchen/stream?status=pending,cooking")
+    assert response.status_code == 422
@@ -0,0 +1,114 @@
+"""Test the order status state machine."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.exceptions import AppException
+from app.models.menu import MenuItem
+from app.models.order import Order
+from app.services.order_service import OrderService
+
+
+@pytest.fixture
+def item_id(client):
+    return client.post(
+        "/api/v1/menu/items", json={"name": "Khao Soi", "category": "Noodles", "price": 80, "stock_quantity": 10}
+    ).json()["id"]
+
+
+def place_order(client, item_id, quantity=2):
+    return client.post("/api/v1/orders", json={"items": [{"menu_item_id": item_id, "quantity": quantity}]}).json()
+
+
+def test_kitchen_flow_records_timestamps(client, item_id):
+    order = place_order(client, item_id)
+    assert client.post(f"/api/v1/orders/{order['id']}/ready").status_code == 400
+
+    started = client.post(f"/api/v1/orders/{order['id']}/start").json()
+    ready = client.post(f"/api/v1/orders/{order['id']}/ready").json()
+    completed = client.post(f"/api/v1/orders/{order['id']}/complete").json()
+
+    assert [started["status"], ready["status"], completed["status"]] == ["preparing", "ready", "completed"]
+    assert completed["preparing_at"] <= completed["ready_at"] <= completed["completed_at"]
+    assert completed["cancelled_at"] is None
+
+
+def test_final_statuses_cannot_change(client, item_id):
+    order = place_order(client, item_id)
+    client.post(f"/api/v1/orders/{order['id']}/complete")
+
+    response = client.post(f"/api/v1/orders/{order['id']}/cancel")
+    assert response.status_code == 400
+    assert "from completed to cancelled" in response.text
+    assert client.post(f"/api/v1/orders/{order['id']}/complete").json()["detail"] == "Order is already completed"
+    # Cancelling a completed order must not restore its stock
+    assert client.get(f"/api/v1/menu/items/{item_id}").json()["stock_quantity"] == 8
+    assert client.post("/api/v1/orders/9999/start").status_code == 404
+
+
+def test_update_status_goes_through_transitions(client, item_id):
+    order = place_order(client, item_id)
+    url = f"/api/v1/orders/{order['id']}"
+
+    assert client.put(url, json={"status": "cooking"}).status_code == 422
+    assert client.put(url, json={"status": "ready"}).status_code == 400
+    assert client.put(url, json={"status": "pending", "table_number": 4}).json()["table_number"] == 4
+
+    cancelled = client.put(url, json={"status": "cancelled"}).json()
+    assert cancelled["status"] == "cancelled"
+    assert cancelled["cancelled_at"] is not None
+    assert client.get(f"/api/v1/menu/items/{item_id}").json()["stock_quantity"] == 10
+
+
+def test_concurrent_transitions_apply_exactly_one(client, db_session, item_id):
+    Session = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+    actions = [OrderService.cancel_order, OrderService.complete_order] * 4
+
+    for _ in range(5):
+        order_id = place_order(client, item_id)["id"]
+        barrier = threading.Barrier(len(actions))
+
+        def attempt(action):
+            session = Session()
+            try:
+                barrier.wait()
+                return action(session, order_id).status
+            except AppException as e:
+                assert e.status_code == 400
+                return None
+            finally:
+                session.close()
+
+        with ThreadPoolExecutor(len(actions)) as pool:
+            outcomes = list(pool.map(attempt, actions))
+
+        winners = [status for status in outcomes if status is not None]
+        db_session.expire_all()
+        assert len(winners) == 1
+        assert db_session.get(Order, order_id).status == winners[0]
+        # Stock is returned once if the cancel won, never if the complete won
+        expected_stock = 10 if winners[0] == "cancelled" else 8
+        assert db_session.get(MenuItem, item_id).stock_quantity == expected_stock
+        db_session.get(MenuItem, item_id).stock_quantity = 10
+        db_session.commit()
+
+
+def test_delete_after_concurrent_cancel_restores_stock_once(client, db_session, item_id):
+    order_id = place_order(client, item_id)["id"]
+    Session = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+    deleter = Session()
+    try:
+        # The deleting session still sees the order as pending when the cancel commits
+        stale = OrderService.get_order_by_id(deleter, order_id)
+        client.post(f"/api/v1/orders/{order_id}/cancel")
+        assert OrderService.get_order_by_id(deleter, order_id).status == stale.status == "pending"
+        OrderService.delete_order(deleter, order_id)
+    finally:
+        deleter.close()
+
+    db_session.expire_all()
+    assert db_session.get(Order, order_id) is None
+    assert db_session.get(MenuItem, item_id).stock_quantity == 10
+    assert client.delete(f"/api/v1/orders/{order_id}").status_code == 404
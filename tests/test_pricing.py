@@ -0,0 +1,77 @@
+"""Test server-side order pricing."""
+import pytest
+
+
+@pytest.fixture
+def menu(client):
+    """A drink with a required single-choice option and an optional multi-choice one."""
+    sweetness = client.post("/api/v1/menu/options", json={
+        "name": "Sweetness", "option_type": "single", "is_required": True,
+        "choices": [{"name": "Less"}, {"name": "Normal"}],
+    }).json()
+    toppings = client.post("/api/v1/menu/options", json={
+        "name": "Toppings", "option_type": "multiple", "max_selection": 2,
+        "choices": [
+            {"name": "Pearls", "price_modifier": 10},
+            {"name": "Jelly", "price_modifier": 5},
+            {"name": "Pudding", "price_modifier": 15},
+        ],
+    }).json()
+    item = client.post("/api/v1/menu/items", json={
+        "name": "Thai Tea", "category": "Drinks", "price": 45,
+        "option_ids": [sweetness["id"], toppings["id"]],
+    }).json()
+    return {
+        "item_id": item["id"],
+        "less": sweetness["choices"][0]["id"],
+        "normal": sweetness["choices"][1]["id"],
+        "toppings": [choice["id"] for choice in toppings["choices"]],
+    }
+
+
+def order(client, item_id, choice_ids, quantity=1, **extra):
+    return client.post("/api/v1/orders", json={
+        "items": [{"menu_item_id": item_id, "quantity": quantity, "option_choice_ids": choice_ids}],
+        **extra,
+    })
+
+
+def test_totals_computed_from_menu_prices_and_modifiers(client, menu):
+    pearls, jelly, _ = menu["toppings"]
+    response = order(client, menu["item_id"], [menu["less"], pearls, jelly], quantity=2, total=1)
+    assert response.status_code == 201
+    body = response.json()
+    assert body["total"] == 120  # (45 + 10 + 5) x 2, client total ignored
+    line = body["items"][0]
+    assert (line["name"], line["price"]) == ("Thai Tea", 60)
+    assert line["options_text"] == "Sweetness: Less; Toppings: Pearls, Jelly"
+
+
+@pytest.mark.parametrize("choices, message", [
+    ([], "'Sweetness' is required"),
+    (["less", "normal"], "at most 1 of 'Sweetness'"),
+    (["less", "t0", "t1", "t2"], "at most 2 of 'Toppings'"),
+    (["less", "less"], "Duplicate option choices"),
+])
+def test_option_rules_enforced(client, menu, choices, message):
+    ids = [menu["toppings"][int(c[1])] if c.startswith("t") else menu[c] for c in choices]
+    response = order(client, menu["item_id"], ids)
+    assert response.status_code == 400
+    assert message in response.text
+
+
+def test_choice_from_another_item_rejected(client, menu):
+    other_option = client.post("/api/v1/menu/options", json={
+        "name": "Size", "choices": [{"name": "Large", "price_modifier": 20}],
+    }).json()
+    response = order(client, menu["item_id"], [menu["less"], other_option["choices"][0]["id"]])
+    assert response.status_code == 400
+
+
+def test_pricing_uses_no_menu_queries(client, menu, query_budget):
+    client.get("/api/v1/menu/items")  # Load the catalog and pricing index
+
+    # Stock lookup, order and item inserts, refresh, items load; none for pricing
+    with query_budget(5):
+        response = order(client, menu["item_id"], [menu["normal"]], quantity=3)
+    assert response.json()["total"] == 135
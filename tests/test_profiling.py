@@ -0,0 +1,55 @@
+"""Test on-demand profiling."""
+import threading
+
+from app.core.profiling import StackSampler
+from app.core.security import JWTService
+from app.models.user import User, UserRole
+
+
+def busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_sampler_captures_worker_threads():
+    """Stacks from other threads (e.g. the endpoint threadpool) are sampled."""
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,))
+    sampler = StackSampler(interval=0.001)
+    sampler.start()
+    worker.start()
+    try:
+        threading.Event().wait(0.1)
+    finally:
+        stop.set()
+        worker.join()
+        sampler.stop()
+
+    assert sampler.samples > 0
+    assert "busy_loop" in sampler.collapsed()
+    functions = [entry["function"] for entry in sampler.top_functions()]
+    assert "test_profiling.py:busy_loop" in functions
+
+
+def test_profile_flag_ignored_without_superadmin(client, db_session):
+    """Other callers are served normally, unprofiled."""
+    user = User(name="Staff", email="staff@example.com", password_hash="x", role=UserRole.USER)
+    db_session.add(user)
+    db_session.commit()
+
+    for headers in ({}, {"Authorization": f"Bearer {JWTService.create_access_token(str(user.id))}"}):
+        response = client.get("/api/v1/menu/items", params={"profile": "1"}, headers=headers)
+        assert response.status_code == 200
+        assert "x-profile-id" not in response.headers
+
+
+def test_profile_request_as_superadmin(client, db_session):
+    """The superadmin check uses the app's (overridden) database session."""
+    admin = User(name="Admin", email="admin@example.com", password_hash="x", role=UserRole.SUPERADMIN)
+    db_session.add(admin)
+    db_session.commit()
+
+    token = JWTService.create_access_token(str(admin.id))
+    response = client.get("/health", headers={"X-Profile": "1", "Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.headers["x-profile-id"]
@@ -0,0 +1,42 @@
+"""Test per-endpoint query budgets."""
+from app.models import MenuItem, MenuOption, OptionChoice, Order, OrderItem
+
+
+def seed_menu(db_session, count=5):
+    option = MenuOption(name="Sweetness", choices=[OptionChoice(name="Less"), OptionChoice(name="More")])
+    for i in range(count):
+        db_session.add(MenuItem(name=f"Item {i}", category="Drinks", price=50, options=[option]))
+    db_session.commit()
+
+
+def test_menu_items_listing_has_constant_query_count(client, db_session, query_budget):
+    """Loading the menu catalog avoids N+1 queries; repeat reads hit the cache."""
+    seed_menu(db_session, count=10)
+    db_session.expire_all()
+
+    # Version check + items + options + choices
+    with query_budget(4):
+        response = client.get("/api/v1/menu/items")
+    assert response.status_code == 200
+    assert len(response.json()) == 10
+
+    with query_budget(0):
+        response = client.get("/api/v1/menu/items", params={"category": "Drinks", "limit": 5})
+    assert len(response.json()) == 5
+
+
+def test_orders_listing_has_constant_query_count(client, db_session, query_budget):
+    """Listing orders loads order items without N+1 queries."""
+    seed_menu(db_session, count=1)
+    menu_item = db_session.query(MenuItem).first()
+    for i in range(10):
+        db_session.add(Order(total=50, items=[
+            OrderItem(menu_item_id=menu_item.id, name=menu_item.name, quantity=1, price=50)
+        ]))
+    db_session.commit()
+    db_session.expire_all()
+
+    with query_budget(2):
+        response = client.get("/api/v1/orders")
+    assert response.status_code == 200
+    assert len(response.json()) == 10
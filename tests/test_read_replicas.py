@@ -0,0 +1,40 @@
+"""Test read-replica routing."""
+from app.db import database
+from app.db.database import ReplicaRouter, get_read_db, set_force_primary
+
+
+def test_router_uses_primary_without_replicas():
+    """With no replicas configured reads go to the primary."""
+    assert ReplicaRouter([]).pick() is database.engine
+
+
+def test_router_round_robins_healthy_replicas(tmp_path):
+    """Healthy replicas are used in turn; unhealthy ones fall back to primary."""
+    router = ReplicaRouter([
+        f"sqlite:///{tmp_path / 'replica1.db'}",
+        f"sqlite:///{tmp_path / 'replica2.db'}",
+    ])
+    first, second = (replica.engine for replica in router.replicas)
+    assert [router.pick(), router.pick(), router.pick()] == [first, second, first]
+    assert all(status["healthy"] for status in router.status())
+
+    for replica in router.replicas:
+        replica.healthy = False
+    assert router.pick() is database.engine
+
+
+def test_read_db_sticks_to_primary_after_write(tmp_path, monkeypatch):
+    """Requests that recently wrote read from the primary."""
+    router = ReplicaRouter([f"sqlite:///{tmp_path / 'replica.db'}"])
+    monkeypatch.setattr(database, "replica_router", router)
+
+    set_force_primary(False)
+    session = next(get_read_db())
+    assert session.get_bind() is router.replicas[0].engine
+    session.close()
+
+    set_force_primary(True)
+    session = next(get_read_db())
+    assert session.get_bind() is database.engine
+    session.close()
+    set_force_primary(False)
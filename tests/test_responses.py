@@ -0,0 +1,53 @@
+"""Test JSON response rendering and pre-serialized responses."""
+import json
+from typing import List
+
+from app.core.responses import ORJSONResponse, etag_matches, typed_response
+from app.models import MenuItem, Order, OrderItem
+from app.schemas.order import OrderResponse
+
+
+def test_orjson_response_renders_utf8_and_int_keys():
+    body = ORJSONResponse({"name": "ชาไทย", 1: "one"}).body
+    assert json.loads(body) == {"name": "ชาไทย", "1": "one"}
+    assert "ชาไทย".encode() in body
+
+
+def test_typed_response_matches_schema_dump(db_session):
+    menu_item = MenuItem(name="Tea", category="Drinks", price=45)
+    db_session.add(menu_item)
+    db_session.commit()
+    order = Order(total=45, items=[OrderItem(menu_item_id=menu_item.id, name="Tea", quantity=1, price=45)])
+    db_session.add(order)
+    db_session.commit()
+
+    response = typed_response(List[OrderResponse], [order])
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == [OrderResponse.model_validate(order).model_dump(mode="json")]
+
+
+def test_orders_listing_served_pre_serialized(client, db_session):
+    menu_item = MenuItem(name="Tea", category="Drinks", price=45)
+    db_session.add(menu_item)
+    db_session.commit()
+    db_session.add(Order(total=45, table_number=3, items=[
+        OrderItem(menu_item_id=menu_item.id, name="Tea", quantity=1, price=45)
+    ]))
+    db_session.commit()
+
+    response = client.get("/api/v1/orders")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    [order] = response.json()
+    assert order["table_number"] == 3
+    assert order["items"][0]["name"] == "Tea"
+
+
+def test_etag_matches_lists_wildcard_and_weak_tags():
+    etag = 'W/"menu-3-0a1b2c3d"'
+    assert etag_matches(etag, etag)
+    assert etag_matches('W/"menu-2-ffffffff", W/"menu-3-0a1b2c3d"', etag)
+    assert etag_matches('"menu-3-0a1b2c3d"', etag)
+    assert etag_matches(" * ", etag)
+    assert not etag_matches('W/"menu-2-ffffffff"', etag)
+    assert not etag_matches(None, etag)
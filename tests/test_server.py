@@ -0,0 +1,69 @@
+"""Test production launcher worker sizing and server options."""
+import pytest
+
+from app.core import server
+from app.core.config import Settings
+
+
+@pytest.fixture
+def make_settings(monkeypatch):
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+
+    def make(**overrides):
+        return Settings(DATABASE_URL="sqlite://", **overrides)
+
+    return make
+
+
+def test_single_worker_without_shared_event_broker(make_settings):
+    """In-process order events need every change to go through the one worker."""
+    assert server.resolve_workers(make_settings(DB_MAX_CONNECTIONS=100), cpus=8) == 1
+
+
+def test_workers_follow_cpus_capped_by_connection_budget(make_settings):
+    """With a shared broker, workers are the CPUs each keeping enough connections."""
+    def workers(max_connections, cpus):
+        settings = make_settings(DB_MAX_CONNECTIONS=max_connections, ORDER_EVENTS_SHARED_BROKER=True)
+        return server.resolve_workers(settings, cpus=cpus)
+
+    assert workers(100, cpus=4) == 4
+    assert workers(20, cpus=16) == 5
+    assert workers(2, cpus=8) == 1
+
+
+def test_explicit_web_concurrency_wins(make_settings):
+    settings = make_settings(WEB_CONCURRENCY=3, DB_MAX_CONNECTIONS=4)
+    assert server.resolve_workers(settings, cpus=16) == 3
+
+
+def test_invalid_backend_rejected(make_settings):
+    with pytest.raises(ValueError):
+        server.resolve_backend(make_settings(SERVER_BACKEND="waitress"))
+
+
+def test_gunicorn_options_preload_and_graceful_timeouts(make_settings):
+    settings = make_settings(PORT=9000, GRACEFUL_TIMEOUT=12, MAX_REQUESTS=500)
+    options = server.gunicorn_options(settings, workers=4)
+
+    assert options["bind"] == "0.0.0.0:9000"
+    assert options["workers"] == 4
+    assert options["worker_class"].endswith("UvicornWorker")
+    assert options["preload_app"] is True
+    assert options["graceful_timeout"] == 12
+    assert options["max_requests"] == 500
+    assert callable(options["post_fork"])
+
+
+def test_uvicorn_options_use_fast_loop_when_available(make_settings):
+    options = server.uvicorn_options(make_settings(MAX_REQUESTS=0), workers=2)
+
+    assert options["workers"] == 2
+    assert options["loop"] == server.event_loop()
+    assert options["http"] == server.http_protocol()
+    assert options["limit_max_requests"] is None
+
+
+def test_order_views_resync_only_when_events_may_be_missed(make_settings):
+    assert make_settings().order_views_resync_interval is None
+    assert make_settings(WEB_CONCURRENCY=4).order_views_resync_interval == 60
+    assert make_settings(ORDER_EVENTS_SHARED_BROKER=True, ORDER_VIEWS_RESYNC_SECONDS=30).order_views_resync_interval == 30